@@ -0,0 +1,14 @@
+from django.conf import settings
+from django.contrib.auth import hashers
+
+
+class PBKDF2PasswordHasher(hashers.PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with the work factor taken from ``PASSWORD_PBKDF2_ITERATIONS``.
+
+    Hashes made with another iteration count keep verifying and are upgraded
+    on the next successful login, so the cost can be tuned per deployment.
+    """
+
+    @property
+    def iterations(self):
+        return settings.PASSWORD_PBKDF2_ITERATIONS
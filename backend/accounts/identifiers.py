@@ -0,0 +1,122 @@
+"""Resolution of the login ``identifier`` to a user.
+
+A user can sign in with their username, email, phone or national id. Each is
+stored case-folded in ``LoginIdentifier`` so that login is one indexed
+equality lookup. The identifier's shape narrows which kinds can match: an
+``@`` means an email (or a username, which may contain one); without it the
+value can only be a username, phone or national id.
+"""
+
+from django.apps import apps as global_apps
+from django.db import transaction
+
+from .models import LoginIdentifier
+
+# Persian and Arabic-Indic digits typed on local keyboards.
+_DIGITS = str.maketrans("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "01234567890123456789")
+
+# User field -> identifier kind
+FIELDS = {
+    "username": LoginIdentifier.KIND_USERNAME,
+    "email": LoginIdentifier.KIND_EMAIL,
+    "phone": LoginIdentifier.KIND_PHONE,
+    "national_id": LoginIdentifier.KIND_NATIONAL_ID,
+}
+
+
+def normalize_identifier(value) -> str:
+    return str(value or "").strip().translate(_DIGITS).casefold()[:254]
+
+
+def candidate_kinds(value: str) -> tuple:
+    if "@" in value:
+        return (LoginIdentifier.KIND_USERNAME, LoginIdentifier.KIND_EMAIL)
+    return (LoginIdentifier.KIND_USERNAME, LoginIdentifier.KIND_PHONE, LoginIdentifier.KIND_NATIONAL_ID)
+
+
+def resolve_login_user(identifier):
+    """The user signing in as ``identifier``, or None. One query.
+
+    If the value belongs to several users (say one's username is another's
+    phone), the username wins, then email, phone and national id.
+    """
+    value = normalize_identifier(identifier)
+    if not value:
+        return None
+    match = (
+        LoginIdentifier.objects.filter(value=value, kind__in=candidate_kinds(value))
+        .select_related("user")
+        .order_by("kind", "user_id")
+        .first()
+    )
+    return match.user if match else None
+
+
+def resolve_login_user_ids(identifiers) -> dict:
+    """Map each of ``identifiers`` that names a user to that user's id, in one query.
+
+    Same precedence as ``resolve_login_user``; unknown identifiers are left out.
+    """
+    by_value = {}
+    for identifier in identifiers:
+        value = normalize_identifier(identifier)
+        if value:
+            by_value.setdefault(value, []).append(identifier)
+    if not by_value:
+        return {}
+
+    resolved = {}
+    rows = (
+        LoginIdentifier.objects.filter(value__in=list(by_value))
+        .order_by("value", "kind", "user_id")
+        .values_list("value", "kind", "user_id")
+    )
+    for value, kind, user_id in rows:
+        if value in resolved or kind not in candidate_kinds(value):
+            continue
+        resolved[value] = user_id
+    return {identifier: resolved[value] for value, originals in by_value.items() if value in resolved for identifier in originals}
+
+
+def identifiers_for(row, model=LoginIdentifier) -> list:
+    """Build (unsaved) identifiers for a user, given as an instance or a values() dict."""
+    get = row.get if isinstance(row, dict) else lambda name: getattr(row, name)
+    identifiers = []
+    for field, kind in FIELDS.items():
+        value = normalize_identifier(get(field))
+        if value:
+            identifiers.append(model(user_id=get("id"), kind=kind, value=value))
+    return identifiers
+
+
+def is_identifier_change(update_fields) -> bool:
+    return update_fields is None or not set(FIELDS).isdisjoint(update_fields)
+
+
+def index_user(user) -> None:
+    with transaction.atomic():
+        LoginIdentifier.objects.filter(user_id=user.pk).delete()
+        LoginIdentifier.objects.bulk_create(identifiers_for(user))
+
+
+def index_rows(rows) -> None:
+    """Index users written in bulk (``bulk_create`` skips the save signals)."""
+    LoginIdentifier.objects.bulk_create([identifier for row in rows for identifier in identifiers_for(row)])
+
+
+def rebuild(apps=global_apps, batch_size=2000) -> int:
+    """Re-derive every login identifier from the user table; returns the row count."""
+    identifier_model = apps.get_model("accounts", "LoginIdentifier")
+    user_model = apps.get_model("accounts", "User")
+    total = 0
+    with transaction.atomic():
+        identifier_model.objects.all().delete()
+        batch = []
+        for row in user_model.objects.values("id", *FIELDS).iterator(chunk_size=batch_size):
+            batch.extend(identifiers_for(row, model=identifier_model))
+            if len(batch) >= batch_size:
+                identifier_model.objects.bulk_create(batch)
+                total, batch = total + len(batch), []
+        identifier_model.objects.bulk_create(batch)
+        total += len(batch)
+    return total
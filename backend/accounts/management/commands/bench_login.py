@@ -0,0 +1,86 @@
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.db.models import Q
+
+from accounts import identifiers
+from accounts.models import User
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure login identifier resolution as the user table grows. Synthetic users are "
+        "created inside a transaction that is rolled back at the end."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", default="1000,10000,100000", help="Comma-separated user counts to measure at.")
+        parser.add_argument("--samples", type=int, default=200, help="Lookups timed at each size.")
+        parser.add_argument("--legacy", action="store_true", help="Also time the old OR-of-iexact query.")
+
+    def handle(self, *args, **options):
+        try:
+            sizes = sorted(int(size) for size in options["sizes"].split(","))
+        except ValueError:
+            raise CommandError("--sizes must be a comma-separated list of integers.")
+
+        with transaction.atomic():
+            created = 0
+            for size in sizes:
+                created = self._grow(created, size)
+                if connection.vendor == "postgresql":
+                    with connection.cursor() as cursor:
+                        cursor.execute("ANALYZE accounts_user")
+                        cursor.execute("ANALYZE accounts_loginidentifier")
+
+                probes = [self._probe(random.randrange(created)) for _ in range(options["samples"])]
+                line = f"{size:>9} users  resolver {self._time(identifiers.resolve_login_user, probes)}"
+                if options["legacy"]:
+                    line += f"  legacy {self._time(_legacy_lookup, probes)}"
+                self.stdout.write(line)
+            transaction.set_rollback(True)
+
+    def _grow(self, start, stop, batch_size=5000):
+        for offset in range(start, stop, batch_size):
+            users = User.objects.bulk_create(
+                [
+                    User(
+                        username=f"bench-user-{n}",
+                        email=f"bench-{n}@example.test",
+                        phone=f"09{n:09d}",
+                        national_id=f"{n:010d}",
+                        password="!",
+                    )
+                    for n in range(offset, min(offset + batch_size, stop))
+                ]
+            )
+            identifiers.index_rows(users)
+        return max(start, stop)
+
+    @staticmethod
+    def _probe(n):
+        return random.choice([f"BENCH-USER-{n}", f"bench-{n}@example.test", f"09{n:09d}", f"{n:010d}"])
+
+    @staticmethod
+    def _time(lookup, probes):
+        timings = []
+        for probe in probes:
+            started = time.perf_counter()
+            if lookup(probe) is None:
+                raise CommandError(f"{probe!r} did not resolve.")
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+        p95 = timings[int(len(timings) * 0.95) - 1] if timings else 0.0
+        return f"median {statistics.median(timings):.3f} ms  p95 {p95:.3f} ms"
+
+
+def _legacy_lookup(identifier):
+    return User.objects.filter(
+        Q(username__iexact=identifier)
+        | Q(email__iexact=identifier)
+        | Q(phone__iexact=identifier)
+        | Q(national_id__iexact=identifier)
+    ).first()
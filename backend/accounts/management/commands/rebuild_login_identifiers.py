@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from accounts import identifiers
+
+
+class Command(BaseCommand):
+    help = "Rebuild the login identifier index from the user table."
+
+    def handle(self, *args, **options):
+        total = identifiers.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} login identifiers."))
@@ -0,0 +1,28 @@
+# Generated by Django 5.2.11 on 2026-10-18 01:29
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_user_role_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LoginIdentifier',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.PositiveSmallIntegerField(choices=[(1, 'username'), (2, 'email'), (3, 'phone'), (4, 'national_id')])),
+                ('value', models.CharField(max_length=254)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='login_identifiers', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['value', 'kind'], name='login_identifier_value_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'kind'), name='unique_login_identifier_kind')],
+            },
+        ),
+    ]
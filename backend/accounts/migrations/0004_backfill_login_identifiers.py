@@ -0,0 +1,18 @@
+from django.db import migrations
+
+
+def backfill(apps, schema_editor):
+    from accounts.identifiers import rebuild
+
+    rebuild(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("accounts", "0003_login_identifier"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
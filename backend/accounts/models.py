@@ -8,5 +8,38 @@ class User(AbstractUser):
     phone = models.CharField(max_length=20, unique=True, null=True, blank=True)
     national_id = models.CharField(max_length=20, unique=True, null=True, blank=True)
 
+    # Bumped on every role change; access tokens embed it (see rbac.tokens).
+    role_version = models.PositiveIntegerField(default=0)
+
+    def __str__(self):
+        return self.username
+
+class LoginIdentifier(models.Model):
+    """One normalized login identifier of a user (see ``accounts.identifiers``).
+
+    Login resolves any identifier with a single probe of the ``value`` index
+    instead of OR-ing case-insensitive scans over four ``User`` columns.
+    ``kind`` doubles as the precedence when two users share a value.
+    """
+
+    KIND_USERNAME = 1
+    KIND_EMAIL = 2
+    KIND_PHONE = 3
+    KIND_NATIONAL_ID = 4
+    KIND_CHOICES = (
+        (KIND_USERNAME, "username"),
+        (KIND_EMAIL, "email"),
+        (KIND_PHONE, "phone"),
+        (KIND_NATIONAL_ID, "national_id"),
+    )
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name="login_identifiers")
+    kind = models.PositiveSmallIntegerField(choices=KIND_CHOICES)
+    value = models.CharField(max_length=254)
+
+    class Meta:
+        indexes = [models.Index(fields=["value", "kind"], name="login_identifier_value_idx")]
+        constraints = [models.UniqueConstraint(fields=["user", "kind"], name="unique_login_identifier_kind")]
+
     def __str__(self):
-        return self.username
\ No newline at end of file
+        return f"{self.get_kind_display()}:{self.value}"
@@ -0,0 +1,101 @@
+"""Password checks for login.
+
+Hashing a password is deliberately slow, and a login storm used to run every
+check inline. Here:
+
+- a wrong password for a user is remembered (as an HMAC, never the password)
+  for ``LOGIN_FAILURE_CACHE_TTL`` seconds, so a client retrying the same
+  credentials is refused without hashing again; the key covers the stored
+  hash, so it stops matching as soon as the password changes;
+- a correct password stored with an outdated hasher or work factor is
+  re-hashed with the preferred one;
+- ``acheck_login_password`` runs the hashing in a bounded thread pool. The
+  hash functions release the GIL, so checks run on all cores while the event
+  loop keeps serving other requests.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth import hashers
+from django.core.cache import cache
+
+from .models import User
+
+
+class HashingBusy(Exception):
+    """More password checks are waiting than ``PASSWORD_HASH_MAX_PENDING`` allows."""
+
+
+def _failure_key(user, password) -> str:
+    message = f"{user.pk}\0{user.password}\0{password}".encode()
+    return "login-failure:" + hmac.new(settings.SECRET_KEY.encode(), message, hashlib.sha256).hexdigest()
+
+
+def _verify(encoded, password):
+    """Return ``(matches, new encoded password or None)``. CPU-bound."""
+    if not password or not hashers.check_password(password, encoded):
+        return False, None
+    preferred = hashers.get_hasher("default")
+    if hashers.identify_hasher(encoded).algorithm != preferred.algorithm or preferred.must_update(encoded):
+        return True, hashers.make_password(password)
+    return True, None
+
+
+def _store_rehash(user, new_encoded):
+    # Only replace the hash that was checked, in case the password changed meanwhile.
+    User.objects.filter(pk=user.pk, password=user.password).update(password=new_encoded)
+    user.password = new_encoded
+
+
+def check_login_password(user, password) -> bool:
+    key = _failure_key(user, password)
+    if cache.get(key):
+        return False
+    matches, new_encoded = _verify(user.password, password)
+    if not matches:
+        cache.set(key, True, timeout=settings.LOGIN_FAILURE_CACHE_TTL)
+    elif new_encoded:
+        _store_rehash(user, new_encoded)
+    return matches
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _hashing_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = (
+                ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"),
+                threading.BoundedSemaphore(settings.PASSWORD_HASH_MAX_PENDING),
+            )
+        return _pool
+
+
+async def acheck_login_password(user, password) -> bool:
+    """``check_login_password`` for async views; raises ``HashingBusy`` when saturated."""
+    key = _failure_key(user, password)
+    if await cache.aget(key):
+        return False
+
+    executor, slots = _hashing_pool()
+    if not slots.acquire(blocking=False):
+        raise HashingBusy
+    try:
+        matches, new_encoded = await asyncio.get_running_loop().run_in_executor(executor, _verify, user.password, password)
+    finally:
+        slots.release()
+
+    if not matches:
+        await cache.aset(key, True, timeout=settings.LOGIN_FAILURE_CACHE_TTL)
+    elif new_encoded:
+        await sync_to_async(_store_rehash)(user, new_encoded)
+    return matches
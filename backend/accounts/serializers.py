@@ -1,12 +1,14 @@
 from django.contrib.auth import get_user_model
-from django.db.models import Q
 from rest_framework import serializers
 from rest_framework.exceptions import AuthenticationFailed
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 from rbac.models import Role, UserRole
+from rbac.tokens import RoleRefreshToken
+
+from .identifiers import resolve_login_user
+from .passwords import check_login_password
 
 
 User = get_user_model()
@@ -61,6 +63,15 @@ class RegisterSerializer(serializers.ModelSerializer):
 
         return user
 
+def login_payload(user) -> dict:
+    refresh = RoleRefreshToken.for_user(user)
+    return {
+        "access": str(refresh.access_token),
+        "refresh": str(refresh),
+        "user": UserPublicSerializer(user).data,
+    }
+
+
 class LoginSerializer(serializers.Serializer):
     identifier = serializers.CharField()
     password = serializers.CharField(write_only=True)
@@ -69,20 +80,9 @@ class LoginSerializer(serializers.Serializer):
         identifier = (attrs["identifier"] or "").strip()
         password = attrs["password"]
 
-        user = User.objects.filter(
-            Q(username__iexact=identifier)
-            | Q(email__iexact=identifier)
-            | Q(phone__iexact=identifier)
-            | Q(national_id__iexact=identifier)
-        ).first()
+        user = resolve_login_user(identifier)
 
-        if not user or not user.check_password(password):
+        if not user or not check_login_password(user, password):
             raise AuthenticationFailed("Invalid credentials.")
 
-        refresh = RefreshToken.for_user(user)
-
-        return {
-            "access": str(refresh.access_token),
-            "refresh": str(refresh),
-            "user": UserPublicSerializer(user).data,
-        }
\ No newline at end of file
+        return login_payload(user)
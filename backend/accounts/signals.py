@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from . import identifiers
+from .models import User
+
+
+@receiver(post_save, sender=User, dispatch_uid="accounts-login-identifiers")
+def _user_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created or identifiers.is_identifier_change(update_fields):
+        identifiers.index_user(instance)
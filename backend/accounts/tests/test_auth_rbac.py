@@ -1,4 +1,6 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
 from rest_framework import status
 
@@ -80,4 +82,34 @@ class AuthRBACTests(APITestCase):
         UserRole.objects.create(user=self.user, role=self.admin_role)
         self.client.force_authenticate(user=self.user)
         resp = self.client.get("/api/rbac/roles/")
-        self.assertEqual(resp.status_code, status.HTTP_200_OK)
\ No newline at end of file
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+    def _login_tokens(self, identifier, password):
+        resp = self.client.post(
+            "/api/auth/login/",
+            {"identifier": identifier, "password": password},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.data)
+        return resp.data["access"], resp.data["refresh"]
+
+    def test_access_token_roles_skip_role_queries(self):
+        UserRole.objects.create(user=self.user, role=self.admin_role)
+        access, _ = self._login_tokens("user1", "UserPassw0rd!!")
+
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.get("/api/rbac/roles/", HTTP_AUTHORIZATION=f"Bearer {access}")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertFalse([q for q in ctx.captured_queries if "rbac_userrole" in q["sql"]])
+
+    def test_role_change_rejects_stale_access_token_until_refresh(self):
+        UserRole.objects.create(user=self.user, role=self.admin_role)
+        access, refresh = self._login_tokens("user1", "UserPassw0rd!!")
+
+        UserRole.objects.filter(user=self.user, role=self.admin_role).delete()
+        resp = self.client.get("/api/rbac/roles/", HTTP_AUTHORIZATION=f"Bearer {access}")
+        self.assertEqual(resp.status_code, status.HTTP_401_UNAUTHORIZED)
+
+        resp = self.client.post("/api/auth/refresh/", {"refresh": refresh}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.data)
+        resp = self.client.get("/api/rbac/roles/", HTTP_AUTHORIZATION=f"Bearer {resp.data['access']}")
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,37 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from accounts.identifiers import rebuild, resolve_login_user
+from accounts.models import LoginIdentifier
+
+User = get_user_model()
+
+
+class LoginIdentifierTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username="Alice", email="Alice@Example.com", phone="09121234567", national_id="0012345678", password="x"
+        )
+
+    def test_resolves_every_identifier_case_insensitively_in_one_query(self):
+        for identifier in ("alice", "ALICE@example.COM", " 09121234567 ", "۰۰۱۲۳۴۵۶۷۸"):
+            with self.assertNumQueries(1):
+                self.assertEqual(resolve_login_user(identifier), self.user, identifier)
+        self.assertIsNone(resolve_login_user("nobody"))
+        self.assertIsNone(resolve_login_user("  "))
+
+    def test_follows_profile_changes(self):
+        self.user.email = "new@example.com"
+        self.user.save(update_fields=["email"])
+        self.assertIsNone(resolve_login_user("alice@example.com"))
+        self.assertEqual(resolve_login_user("new@example.com"), self.user)
+
+    def test_username_wins_over_another_users_phone(self):
+        other = User.objects.create_user(username="bob", email="bob@example.com", phone="alice", password="x")
+        self.assertEqual(resolve_login_user("alice"), self.user)
+        self.assertEqual(resolve_login_user("bob"), other)
+
+    def test_rebuild_matches_signal_maintained_rows(self):
+        before = set(LoginIdentifier.objects.values_list("user_id", "kind", "value"))
+        self.assertEqual(rebuild(), len(before))
+        self.assertEqual(set(LoginIdentifier.objects.values_list("user_id", "kind", "value")), before)
@@ -0,0 +1,66 @@
+from unittest import mock
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from django.urls import resolve
+
+from accounts import passwords
+
+User = get_user_model()
+
+
+@override_settings(PASSWORD_PBKDF2_ITERATIONS=1000, ROOT_URLCONF="config.asgi_urls")
+class LoginPasswordTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(username="cadet", email="cadet@example.com", password="Passw0rd!!")
+
+    def test_async_login_returns_tokens(self):
+        resp = self.async_client_post({"identifier": "CADET@example.com", "password": "Passw0rd!!"})
+        self.assertEqual(resp.status_code, 200, resp.content)
+        body = resp.json()
+        self.assertEqual(body["user"]["id"], self.user.id)
+        self.assertIn("access", body)
+        self.assertIn("refresh", body)
+
+    def test_async_login_errors_use_the_api_envelope(self):
+        resp = self.async_client_post({"identifier": "cadet", "password": "wrong"})
+        self.assertEqual(resp.status_code, 401)
+        self.assertEqual(resp.json()["error"]["details"], {"detail": "Invalid credentials."})
+
+        resp = self.async_client_post({"identifier": "cadet"})
+        self.assertEqual(resp.status_code, 400)
+        self.assertEqual(resp.json()["error"]["code"], "validation_error")
+        self.assertIn("password", resp.json()["error"]["details"])
+
+    @override_settings(ROOT_URLCONF="config.urls")
+    def test_repeated_failure_skips_hashing(self):
+        # WSGI routing: the plain DRF view, with no event loop in between.
+        self.assertFalse(iscoroutinefunction(resolve("/api/auth/login/").func))
+        with mock.patch.object(passwords, "_verify", wraps=passwords._verify) as verify:
+            for _ in range(3):
+                resp = self.client.post("/api/auth/login/", {"identifier": "cadet", "password": "nope"}, format="json")
+                self.assertEqual(resp.status_code, 401)
+            self.assertEqual(verify.call_count, 1)
+
+            resp = self.client.post("/api/auth/login/", {"identifier": "cadet", "password": "Passw0rd!!"}, format="json")
+            self.assertEqual(resp.status_code, 200)
+
+            # A changed password is not refused because it failed before.
+            self.user.set_password("nope")
+            self.user.save()
+            resp = self.client.post("/api/auth/login/", {"identifier": "cadet", "password": "nope"}, format="json")
+            self.assertEqual(resp.status_code, 200)
+
+    def test_login_rehashes_with_the_configured_cost(self):
+        with override_settings(PASSWORD_PBKDF2_ITERATIONS=1200):
+            resp = self.async_client_post({"identifier": "cadet", "password": "Passw0rd!!"})
+            self.assertEqual(resp.status_code, 200)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("pbkdf2_sha256$1200$"))
+        self.assertTrue(self.user.check_password("Passw0rd!!"))
+
+    def async_client_post(self, data):
+        return async_to_sync(self.async_client.post)("/api/auth/login/", data, content_type="application/json")
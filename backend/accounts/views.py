@@ -1,10 +1,17 @@
+import json
+
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
 from rest_framework import status
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from drf_spectacular.utils import extend_schema, OpenApiResponse
 
-from .serializers import RegisterSerializer, LoginSerializer, UserPublicSerializer
+from .identifiers import resolve_login_user
+from .passwords import HashingBusy, acheck_login_password
+from .serializers import RegisterSerializer, LoginSerializer, UserPublicSerializer, login_payload
 
 
 class RegisterView(APIView):
@@ -21,6 +28,19 @@ class RegisterView(APIView):
 
 
 class LoginView(APIView):
+    # config.asgi_urls serves this path with ``as_asgi_view`` instead.
+    @classmethod
+    def as_asgi_view(cls, **initkwargs):
+        """The login view for ASGI: passwords are hashed without holding a worker thread."""
+        sync_view = cls.as_view(**initkwargs)
+
+        async def view(request, *args, **kwargs):
+            return await async_login(request)
+
+        # Keep what DRF's view carries, for CSRF exemption and schema generation.
+        view.cls, view.initkwargs, view.csrf_exempt = sync_view.cls, sync_view.initkwargs, True
+        return view
+
     @extend_schema(
         tags=["Auth"],
         request=LoginSerializer,
@@ -32,6 +52,44 @@ class LoginView(APIView):
         return Response(serializer.validated_data, status=status.HTTP_200_OK)
 
 
+def _error(status_code, code, message, details):
+    # Same envelope as config.exception_handler.
+    return JsonResponse(
+        {"error": {"status_code": status_code, "code": code, "message": message, "details": details}},
+        status=status_code,
+    )
+
+
+async def async_login(request):
+    """Login without holding a worker thread while the password is hashed."""
+    if request.method != "POST":
+        return _error(405, "error", "Request failed", {"detail": f'Method "{request.method}" not allowed.'})
+
+    if request.content_type == "application/json":
+        try:
+            data = json.loads(request.body or b"{}")
+        except ValueError as exc:
+            return _error(400, "error", "Request failed", {"detail": f"JSON parse error - {exc}"})
+    else:
+        data = request.POST
+    try:
+        attrs = LoginSerializer().to_internal_value(data)
+    except ValidationError as exc:
+        return _error(400, "validation_error", "Validation failed", exc.detail)
+
+    user = await sync_to_async(resolve_login_user)(attrs["identifier"].strip())
+    try:
+        valid = user is not None and await acheck_login_password(user, attrs["password"])
+    except HashingBusy:
+        response = _error(503, "error", "Request failed", {"detail": "Too many logins in progress; retry shortly."})
+        response["Retry-After"] = "1"
+        return response
+    if not valid:
+        return _error(401, "auth_error", "Authentication failed", {"detail": "Invalid credentials."})
+
+    return JsonResponse(await sync_to_async(login_payload)(user))
+
+
 class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
@@ -0,0 +1,111 @@
+"""Graph queries over a detective board's items and links.
+
+A board is loaded into an adjacency map once per board revision (two
+queries) and cached, so repeated queries on a large board cost no database
+work until the board changes. Links are treated as undirected: an analyst
+asking how two items are connected does not care which way a string was
+pinned.
+"""
+
+from collections import deque
+
+from django.core.cache import cache
+
+from .models import DetectiveBoardItem, DetectiveBoardLink
+
+GRAPH_CACHE_TIMEOUT = 60 * 60
+
+
+class BoardGraph:
+    def __init__(self, nodes: dict, adjacency: dict):
+        # nodes: item id -> {"id", "title", "item_type", "ref_model", "ref_id"}
+        self.nodes = nodes
+        self.adjacency = adjacency
+
+    @classmethod
+    def load(cls, board):
+        nodes = {
+            row["id"]: row
+            for row in DetectiveBoardItem.objects.filter(board=board).values("id", "title", "item_type", "ref_model", "ref_id")
+        }
+        adjacency = {item_id: set() for item_id in nodes}
+        for source, target in DetectiveBoardLink.objects.filter(board=board).values_list("source_id", "target_id"):
+            adjacency[source].add(target)
+            adjacency[target].add(source)
+        return cls(nodes, adjacency)
+
+    def components(self) -> list[list[int]]:
+        """Connected components, largest first; ids within a component are sorted."""
+        seen, components = set(), []
+        for start in sorted(self.nodes):
+            if start in seen:
+                continue
+            seen.add(start)
+            component, queue = [], deque([start])
+            while queue:
+                node = queue.popleft()
+                component.append(node)
+                for neighbour in self.adjacency[node]:
+                    if neighbour not in seen:
+                        seen.add(neighbour)
+                        queue.append(neighbour)
+            components.append(sorted(component))
+        components.sort(key=lambda c: (-len(c), c[0]))
+        return components
+
+    def shortest_path(self, source: int, target: int) -> list[int] | None:
+        """Fewest-links path from ``source`` to ``target`` (inclusive), or None."""
+        if source not in self.nodes or target not in self.nodes:
+            return None
+        previous = {source: None}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if node == target:
+                path = []
+                while node is not None:
+                    path.append(node)
+                    node = previous[node]
+                return path[::-1]
+            for neighbour in sorted(self.adjacency[node]):
+                if neighbour not in previous:
+                    previous[neighbour] = node
+                    queue.append(neighbour)
+        return None
+
+    def degree_centrality(self) -> list[tuple[int, int, float]]:
+        """``(item id, degree, degree / (n - 1))`` for every item, most connected first."""
+        scale = max(len(self.nodes) - 1, 1)
+        ranked = sorted(self.adjacency.items(), key=lambda kv: (-len(kv[1]), kv[0]))
+        return [(item_id, len(neighbours), len(neighbours) / scale) for item_id, neighbours in ranked]
+
+    def suspect_items(self, suspect_id: int) -> list[int]:
+        return sorted(
+            item_id
+            for item_id, node in self.nodes.items()
+            if node["ref_id"] == suspect_id
+            and (node["item_type"] == "SUSPECT" or node["ref_model"].lower() == "suspect")
+        )
+
+    def linked_to_suspect(self, suspect_id: int, depth: int = 1) -> dict[int, int]:
+        """Items within ``depth`` links of the suspect's items, mapped to their distance."""
+        distances = {item_id: 0 for item_id in self.suspect_items(suspect_id)}
+        frontier = list(distances)
+        for distance in range(1, depth + 1):
+            next_frontier = []
+            for node in frontier:
+                for neighbour in self.adjacency[node]:
+                    if neighbour not in distances:
+                        distances[neighbour] = distance
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        return {item_id: d for item_id, d in distances.items() if d > 0}
+
+
+def get_board_graph(board) -> BoardGraph:
+    key = f"board-graph:{board.pk}:{board.revision}"
+    graph = cache.get(key)
+    if graph is None:
+        graph = BoardGraph.load(board)
+        cache.set(key, graph, timeout=GRAPH_CACHE_TIMEOUT)
+    return graph
@@ -0,0 +1,270 @@
+"""Live collaborative editing of a detective board over a WebSocket.
+
+Clients connect to ``/ws/cases/<case_id>/board/?token=<access token>`` and
+exchange JSON text frames. From the client:
+
+- ``{"type": "move", "items": [{"id": 1, "x": 10.5, "y": 20}]}`` drags items.
+  Moves are relayed to the other clients at once but only persisted every
+  ``BOARD_SOCKET_FLUSH_INTERVAL`` seconds, latest position per item, in one
+  ``bulk_update``.
+- ``{"type": "ops", "ref": "...", "operations": [...]}`` applies a batch in the
+  format of ``cases.boards.apply_board_operations`` and broadcasts the diff.
+
+Every broadcast carries a per-board ``seq`` assigned by the server, so all
+clients see edits in the same order. ``diff`` and ``revision`` frames carry the
+board revision they bring the client to; ``revision`` frames also announce
+writes made by anyone else, including REST clients. Revisions are consecutive,
+so a client that sees one more than one past its last (or reconnects) catches
+up with ``GET detective_board/?since=<last revision>``.
+The REST endpoints remain the fallback for clients that cannot keep a socket.
+
+Rooms live in the serving process, so all sockets for a board must reach the
+same ASGI worker (e.g. sticky routing on the case id). The socket is closed
+with 4401 when its access token expires; the client reconnects with a fresh one.
+"""
+
+import asyncio
+import json
+import logging
+import math
+import re
+import time
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections
+from django.dispatch import receiver
+from rest_framework.exceptions import ValidationError
+from rest_framework.utils.encoders import JSONEncoder
+
+from rbac.authentication import user_and_expiry_for_token
+from rbac.permissions import user_has_role
+
+from .boards import BOARD_EDITOR_ROLES, apply_board_operations, board_revised, save_positions
+from .models import Case, DetectiveBoard
+
+logger = logging.getLogger(__name__)
+
+BOARD_SOCKET_PATH = re.compile(r"^/ws/cases/(?P<case_id>\d+)/board/?$")
+
+# Close codes sent before accepting, mirroring the HTTP status they stand for.
+CLOSE_UNAUTHORIZED = 4401
+CLOSE_FORBIDDEN = 4403
+CLOSE_NOT_FOUND = 4404
+
+
+def _database(fn):
+    """Run ``fn`` in the sync thread with fresh connections, like a request would."""
+
+    def wrapped(*args, **kwargs):
+        close_old_connections()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            close_old_connections()
+
+    return sync_to_async(wrapped)
+
+
+class BoardRoom:
+    def __init__(self, board):
+        self.board = board
+        self.members = set()
+        self.seq = 0
+        self.revision = board.revision
+        self.pending = {}
+        self.lock = asyncio.Lock()
+        self.loop = asyncio.get_running_loop()
+        self._deferred_revision = 0
+        self._flusher = None
+
+    def join(self, queue):
+        self.members.add(queue)
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._flush_periodically())
+
+    async def leave(self, queue):
+        self.members.discard(queue)
+        if not self.members:
+            if self._flusher is not None:
+                self._flusher.cancel()
+                self._flusher = None
+            await self.flush()
+
+    def broadcast(self, message, exclude=None):
+        self.seq += 1
+        message = {**message, "seq": self.seq}
+        for queue in self.members:
+            if queue is not exclude:
+                queue.put_nowait(message)
+
+    def announce_revision(self, revision):
+        if self.lock.locked():
+            # A socket write is landing; announce once it has, in order.
+            self._deferred_revision = max(self._deferred_revision, revision)
+        elif revision > self.revision:
+            self.revision = revision
+            self.broadcast({"type": "revision", "revision": revision})
+
+    def _release_deferred(self):
+        revision, self._deferred_revision = self._deferred_revision, 0
+        self.announce_revision(revision)
+
+    async def _save_pending(self):
+        # Caller holds the lock.
+        positions, self.pending = self.pending, {}
+        try:
+            revision = await _database(save_positions)(self.board, positions)
+        except Exception:
+            # Keep the drags for the next flush, under any newer positions.
+            self.pending = {**positions, **self.pending}
+            raise
+        if revision is not None and revision > self.revision:
+            self.revision = revision
+            self.broadcast({"type": "revision", "revision": revision})
+
+    async def flush(self):
+        if not self.pending:
+            return
+        async with self.lock:
+            await self._save_pending()
+        self._release_deferred()
+
+    async def _flush_periodically(self):
+        while True:
+            await asyncio.sleep(settings.BOARD_SOCKET_FLUSH_INTERVAL)
+            try:
+                await self.flush()
+            except Exception:
+                logger.exception("Saving board %s drags failed; retrying next interval", self.board.pk)
+
+    async def handle(self, queue, user, message):
+        kind = message.get("type") if isinstance(message, dict) else None
+        if kind == "move":
+            moves = _parse_moves(message.get("items"))
+            if moves is None:
+                queue.put_nowait({"type": "error", "detail": "items must be a list of {id, x, y}."})
+                return
+            self.pending.update(moves)
+            self.broadcast(
+                {"type": "moved", "by": user.pk, "items": [{"id": i, "x": x, "y": y} for i, (x, y) in moves.items()]},
+                exclude=queue,
+            )
+        elif kind == "ops":
+            ref = message.get("ref")
+            async with self.lock:
+                # Land pending drags first so the batch sees (and may delete) them.
+                if self.pending:
+                    await self._save_pending()
+                try:
+                    diff = await _database(apply_board_operations)(self.board, user, message.get("operations"))
+                except ValidationError as exc:
+                    queue.put_nowait({"type": "error", "ref": ref, "detail": exc.detail})
+                else:
+                    self.revision = max(self.revision, diff["revision"])
+                    self.broadcast({"type": "diff", "by": user.pk, "ref": ref, "diff": diff})
+            self._release_deferred()
+        else:
+            queue.put_nowait({"type": "error", "detail": "Unknown message type."})
+
+
+def _parse_moves(items):
+    if not isinstance(items, list):
+        return None
+    moves = {}
+    for entry in items:
+        if not isinstance(entry, dict):
+            return None
+        item_id, x, y = entry.get("id"), entry.get("x"), entry.get("y")
+        if isinstance(item_id, bool) or not isinstance(item_id, int):
+            return None
+        if not all(isinstance(v, (int, float)) and not isinstance(v, bool) and math.isfinite(v) for v in (x, y)):
+            return None
+        moves[item_id] = (float(x), float(y))
+    return moves
+
+
+def _dumps(payload) -> str:
+    return json.dumps(payload, cls=JSONEncoder)
+
+
+_rooms: dict[int, BoardRoom] = {}
+
+
+@receiver(board_revised)
+def _announce_revision(sender, board_id, revision, **kwargs):
+    # May run in a worker thread (REST writes under ASGI) or on the loop itself.
+    room = _rooms.get(board_id)
+    if room is not None:
+        room.loop.call_soon_threadsafe(room.announce_revision, revision)
+
+
+def _open_board(case_id, raw_token):
+    user, expires_at = user_and_expiry_for_token(raw_token) if raw_token else (None, None)
+    if user is None:
+        return None, CLOSE_UNAUTHORIZED
+    if not user_has_role(user, *BOARD_EDITOR_ROLES):
+        return None, CLOSE_FORBIDDEN
+    case = Case.objects.filter(pk=case_id).first()
+    if case is None:
+        return None, CLOSE_NOT_FOUND
+    board, _ = DetectiveBoard.objects.get_or_create(case=case, defaults={"created_by": user})
+    return (user, board, expires_at), None
+
+
+async def board_socket(scope, receive, send, case_id):
+    if (await receive())["type"] != "websocket.connect":
+        return
+
+    raw_token = (parse_qs(scope.get("query_string", b"").decode()).get("token") or [None])[0]
+    opened, close_code = await _database(_open_board)(case_id, raw_token)
+    if opened is None:
+        await send({"type": "websocket.close", "code": close_code})
+        return
+    user, board, expires_at = opened
+
+    await send({"type": "websocket.accept"})
+    room = _rooms.get(board.pk)
+    if room is None:
+        room = _rooms[board.pk] = BoardRoom(board)
+    queue = asyncio.Queue()
+    room.join(queue)
+    queue.put_nowait({"type": "hello", "board": board.pk, "revision": room.revision, "seq": room.seq})
+
+    async def pump():
+        while True:
+            await send({"type": "websocket.send", "text": _dumps(await queue.get())})
+
+    sender = asyncio.create_task(pump())
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(receive(), timeout=expires_at - time.time())
+            except TimeoutError:
+                await send({"type": "websocket.close", "code": CLOSE_UNAUTHORIZED})
+                break
+            if event["type"] == "websocket.disconnect":
+                break
+            if event["type"] != "websocket.receive":
+                continue
+            try:
+                message = json.loads(event.get("text") or event.get("bytes") or b"")
+            except ValueError:
+                queue.put_nowait({"type": "error", "detail": "Frames must be JSON."})
+                continue
+            await room.handle(queue, user, message)
+    finally:
+        sender.cancel()
+        await room.leave(queue)
+        if not room.members and _rooms.get(board.pk) is room:
+            del _rooms[board.pk]
+
+
+async def websocket_application(scope, receive, send):
+    match = BOARD_SOCKET_PATH.match(scope["path"])
+    if match is None:
+        await receive()
+        await send({"type": "websocket.close", "code": CLOSE_NOT_FOUND})
+        return
+    await board_socket(scope, receive, send, case_id=int(match["case_id"]))
@@ -0,0 +1,272 @@
+"""Batched edits to a detective board.
+
+``apply_board_operations`` takes a list of operations such as::
+
+    {"op": "create", "type": "item", "temp_id": "n1", "data": {"title": "...", "x": 10, "y": 20}}
+    {"op": "update", "type": "item", "id": 12, "data": {"x": 40, "y": 80}}
+    {"op": "delete", "type": "item", "id": 13}
+    {"op": "create", "type": "link", "data": {"source_id": "n1", "target_id": 12, "label": "..."}}
+    {"op": "delete", "type": "link", "id": 5}
+
+Links may point at items created earlier in the same batch through their
+``temp_id``. Every operation is validated before anything is written; the
+writes then happen in one transaction as one bulk statement per kind, so the
+query count does not grow with the batch size.
+
+Every write advances the board's ``revision`` once and stamps the rows it
+touched with it; deletions leave tombstones. ``board_delta`` uses both to
+return only what changed after a given revision.
+"""
+
+from django.db import connection, transaction
+from django.db.models import Q
+from django.dispatch import Signal
+from django.utils import timezone
+from rest_framework import serializers
+
+from .models import DetectiveBoard, DetectiveBoardItem, DetectiveBoardLink, DetectiveBoardTombstone
+from .serializers import DetectiveBoardItemSerializer, board_link_payload
+
+MAX_BOARD_OPERATIONS = 500
+
+BOARD_EDITOR_ROLES = ("Detective", "Sergent", "Captain", "Supervisor", "Chief", "Admin")
+
+# Sent after the transaction that advanced a board's revision commits, with
+# ``board_id`` and ``revision``. Live board sockets listen to it.
+board_revised = Signal()
+
+OPS = ("create", "update", "delete")
+TYPES = ("item", "link")
+
+
+class _LinkDataSerializer(serializers.Serializer):
+    source_id = serializers.JSONField()
+    target_id = serializers.JSONField()
+    label = serializers.CharField(max_length=200, required=False, allow_blank=True, default="")
+    meta = serializers.DictField(required=False, default=dict)
+
+    def validate(self, attrs):
+        for key in ("source_id", "target_id"):
+            value = attrs[key]
+            if isinstance(value, bool) or not isinstance(value, (int, str)):
+                raise serializers.ValidationError({key: "Must be an item id or a temp_id from this batch."})
+        return attrs
+
+
+def bump_revision(board: DetectiveBoard) -> int:
+    """Advance ``board.revision`` by one and return the new value.
+
+    Call it inside the writing transaction: the row lock it takes serialises
+    concurrent writers, so revisions become visible in increasing order.
+    """
+    now = timezone.now()
+    table = connection.ops.quote_name(DetectiveBoard._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"UPDATE {table} SET revision = revision + 1, updated_at = %s WHERE id = %s RETURNING revision",
+            [now, board.pk],
+        )
+        revision = cursor.fetchone()[0]
+    board.revision, board.updated_at = revision, now
+    transaction.on_commit(lambda: board_revised.send(sender=DetectiveBoard, board_id=board.pk, revision=revision))
+    return revision
+
+
+def delete_with_tombstones(board: DetectiveBoard, revision: int, item_ids=(), link_ids=()):
+    """Delete items and links, leaving tombstones for delta sync.
+
+    Links attached to a deleted item are removed (and tombstoned) with it.
+    Returns the sets of deleted item and link ids.
+    """
+    item_ids, link_ids = set(item_ids), set(link_ids)
+    if item_ids:
+        link_ids.update(
+            DetectiveBoardLink.objects.filter(board=board)
+            .filter(Q(source_id__in=item_ids) | Q(target_id__in=item_ids))
+            .values_list("id", flat=True)
+        )
+
+    DetectiveBoardTombstone.objects.bulk_create(
+        [DetectiveBoardTombstone(board=board, kind="item", object_id=i, revision=revision) for i in sorted(item_ids)]
+        + [DetectiveBoardTombstone(board=board, kind="link", object_id=i, revision=revision) for i in sorted(link_ids)]
+    )
+    if link_ids:
+        DetectiveBoardLink.objects.filter(id__in=link_ids).delete()
+    if item_ids:
+        DetectiveBoardItem.objects.filter(id__in=item_ids).delete()
+    return item_ids, link_ids
+
+
+def save_positions(board: DetectiveBoard, positions: dict) -> int | None:
+    """Persist ``{item_id: (x, y)}`` in one statement, skipping items no longer on the board.
+
+    Returns the new board revision, or None if nothing was saved.
+    """
+    with transaction.atomic():
+        items = list(DetectiveBoardItem.objects.filter(board=board, id__in=list(positions)).only("id"))
+        if not items:
+            return None
+        revision = bump_revision(board)
+        for item in items:
+            item.x, item.y = positions[item.id]
+            item.updated_at, item.revision = board.updated_at, revision
+        DetectiveBoardItem.objects.bulk_update(items, ["x", "y", "updated_at", "revision"])
+    return revision
+
+
+def board_delta(board: DetectiveBoard, since: int) -> dict:
+    """Items and links changed after revision ``since``, plus the ids deleted since."""
+    items = board.items.filter(revision__gt=since).order_by("id")
+    links = board.links.filter(revision__gt=since).order_by("id")
+    deleted = {"items": [], "links": []}
+    tombstones = board.tombstones.filter(revision__gt=since).order_by("id").values_list("kind", "object_id")
+    for kind, object_id in tombstones:
+        deleted[f"{kind}s"].append(object_id)
+
+    return {
+        "id": board.id,
+        "case": board.case_id,
+        "revision": board.revision,
+        "since": since,
+        "items": DetectiveBoardItemSerializer(items, many=True).data,
+        "links": [board_link_payload(link) for link in links],
+        "deleted": deleted,
+    }
+
+
+def _parse(operations):
+    """Validate the shape and data of every operation, collecting all errors."""
+    if not isinstance(operations, list) or not operations:
+        raise serializers.ValidationError({"operations": "Provide a non-empty list of operations."})
+    if len(operations) > MAX_BOARD_OPERATIONS:
+        raise serializers.ValidationError({"operations": f"At most {MAX_BOARD_OPERATIONS} operations per request."})
+
+    parsed, errors = [], {}
+    for index, raw in enumerate(operations):
+        if not isinstance(raw, dict) or raw.get("op") not in OPS or raw.get("type") not in TYPES:
+            errors[index] = {"op": f"Each operation needs op in {OPS} and type in {TYPES}."}
+            continue
+
+        op, kind = raw["op"], raw["type"]
+        if op != "create" and (isinstance(raw.get("id"), bool) or not isinstance(raw.get("id"), int)):
+            errors[index] = {"id": "An integer id is required."}
+            continue
+        if kind == "link" and op == "update":
+            errors[index] = {"op": "Links cannot be updated; delete and recreate them."}
+            continue
+
+        data = {}
+        if op != "delete":
+            if kind == "item":
+                ser = DetectiveBoardItemSerializer(data=raw.get("data") or {}, partial=op == "update")
+            else:
+                ser = _LinkDataSerializer(data=raw.get("data") or {})
+            if not ser.is_valid():
+                errors[index] = ser.errors
+                continue
+            data = ser.validated_data
+
+        parsed.append({"index": index, "op": op, "type": kind, "id": raw.get("id"), "temp_id": raw.get("temp_id"), "data": data})
+
+    if errors:
+        raise serializers.ValidationError({"operations": errors})
+    return parsed
+
+
+def apply_board_operations(board: DetectiveBoard, user, operations) -> dict:
+    """Apply a batch of item/link operations to ``board`` and return the diff.
+
+    Raises ``ValidationError`` (nothing is written) if any operation is
+    malformed or refers to an item or link that is not on this board.
+    """
+    ops = _parse(operations)
+    by_kind = {}
+    for op in ops:
+        by_kind.setdefault((op["op"], op["type"]), []).append(op)
+
+    item_creates = by_kind.get(("create", "item"), [])
+    item_updates = by_kind.get(("update", "item"), [])
+    item_deletes = by_kind.get(("delete", "item"), [])
+    link_creates = by_kind.get(("create", "link"), [])
+    link_deletes = by_kind.get(("delete", "link"), [])
+
+    temp_ids = {op["temp_id"] for op in item_creates if op["temp_id"] is not None}
+    if len(temp_ids) != len([op for op in item_creates if op["temp_id"] is not None]):
+        raise serializers.ValidationError({"operations": "temp_id values must be unique within a batch."})
+
+    # Every existing item the batch touches, fetched in one query.
+    item_ids = {op["id"] for op in item_updates + item_deletes}
+    for op in link_creates:
+        item_ids.update(ref for ref in (op["data"]["source_id"], op["data"]["target_id"]) if isinstance(ref, int))
+    items = DetectiveBoardItem.objects.filter(board=board).in_bulk(item_ids) if item_ids else {}
+    links = DetectiveBoardLink.objects.filter(board=board).in_bulk({op["id"] for op in link_deletes}) if link_deletes else {}
+
+    errors = {}
+    deleted_item_ids = {op["id"] for op in item_deletes}
+    for op in item_updates + item_deletes:
+        if op["id"] not in items:
+            errors[op["index"]] = {"id": "Item not found on this board."}
+        elif op["op"] == "update" and op["id"] in deleted_item_ids:
+            errors[op["index"]] = {"id": "Item is deleted in the same batch."}
+    for op in link_deletes:
+        if op["id"] not in links:
+            errors[op["index"]] = {"id": "Link not found on this board."}
+    for op in link_creates:
+        for key in ("source_id", "target_id"):
+            ref = op["data"][key]
+            known = ref in temp_ids if isinstance(ref, str) else ref in items and ref not in deleted_item_ids
+            if not known:
+                errors.setdefault(op["index"], {})[key] = f"Invalid {key} for this board."
+    if errors:
+        raise serializers.ValidationError({"operations": errors})
+
+    with transaction.atomic():
+        revision = bump_revision(board)
+
+        created_items = [
+            DetectiveBoardItem(board=board, created_by=user, revision=revision, **op["data"]) for op in item_creates
+        ]
+        DetectiveBoardItem.objects.bulk_create(created_items)
+        by_temp_id = {op["temp_id"]: item for op, item in zip(item_creates, created_items) if op["temp_id"] is not None}
+
+        # Later updates to the same item win, field by field.
+        updated, fields = {}, set()
+        for op in item_updates:
+            item = items[op["id"]]
+            for field, value in op["data"].items():
+                setattr(item, field, value)
+                fields.add(field)
+            item.updated_at = board.updated_at
+            item.revision = revision
+            updated[item.id] = item
+        if updated:
+            DetectiveBoardItem.objects.bulk_update(list(updated.values()), sorted(fields | {"updated_at", "revision"}))
+
+        created_links = []
+        for op in link_creates:
+            data = dict(op["data"])
+            source, target = data.pop("source_id"), data.pop("target_id")
+            created_links.append(
+                DetectiveBoardLink(
+                    board=board,
+                    source=by_temp_id[source] if isinstance(source, str) else items[source],
+                    target=by_temp_id[target] if isinstance(target, str) else items[target],
+                    created_by=user,
+                    revision=revision,
+                    **data,
+                )
+            )
+        DetectiveBoardLink.objects.bulk_create(created_links)
+
+        deleted_item_ids, deleted_link_ids = delete_with_tombstones(board, revision, deleted_item_ids, links)
+
+    return {
+        "revision": revision,
+        "created": {
+            "items": DetectiveBoardItemSerializer(created_items, many=True).data,
+            "links": [board_link_payload(link) for link in created_links],
+        },
+        "updated": {"items": DetectiveBoardItemSerializer(list(updated.values()), many=True).data},
+        "deleted": {"items": sorted(deleted_item_ids), "links": sorted(deleted_link_ids)},
+        "temp_ids": {temp_id: item.id for temp_id, item in by_temp_id.items()},
+    }
@@ -0,0 +1,159 @@
+"""Streaming export of cases with their evidence, suspects, decision and trial.
+
+``iter_cases`` walks the case table with a server-side cursor and prefetches
+evidence and suspects once per chunk, so a full export costs a few queries
+per ``chunk_size`` cases and holds only one chunk in memory. ``ndjson_lines``
+writes one nested JSON document per case; ``csv_lines`` writes one flat row
+per case, with evidence and suspects reduced to counts and ``;``-joined lists.
+
+Under ASGI, wrap the lines in ``async_lines``: Django buffers a synchronous
+iterator whole before serving it asynchronously.
+"""
+
+import csv
+from itertools import islice
+
+from asgiref.sync import sync_to_async
+
+from django.core.exceptions import ObjectDoesNotExist
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Prefetch
+
+from evidence.models import Evidence
+from suspects.models import Suspect
+
+from .models import Case
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Lines pulled per hop to the sync thread when streaming under ASGI.
+ASYNC_BATCH_SIZE = 100
+
+CASE_FIELDS = ("id", "title", "description", "status", "crime_level", "created_by_id", "created_at")
+EVIDENCE_FIELDS = (
+    "id",
+    "evidence_type",
+    "title",
+    "description",
+    "created_at",
+    "created_by_id",
+    "plate_number",
+    "serial_number",
+    "medical_result",
+    "transcription",
+)
+SUSPECT_FIELDS = ("id", "full_name", "national_id", "phone", "chase_started_at", "max_l", "max_d")
+DECISION_FIELDS = ("decision", "comment", "decided_by_id", "decided_at", "chief_approved", "chief_at", "chief_comment")
+TRIAL_FIELDS = ("verdict", "punishment_title", "punishment_description", "judged_by_id", "judged_at")
+
+CSV_HEADER = (
+    *CASE_FIELDS,
+    "evidence_count",
+    "evidence_titles",
+    "suspect_count",
+    "suspect_names",
+    "decision",
+    "decided_at",
+    "chief_approved",
+    "verdict",
+    "punishment_title",
+    "judged_at",
+)
+
+
+def export_queryset(status=None, created_after=None, created_before=None):
+    queryset = Case.objects.all()
+    if status:
+        queryset = queryset.filter(status=status)
+    if created_after:
+        queryset = queryset.filter(created_at__gte=created_after)
+    if created_before:
+        queryset = queryset.filter(created_at__lt=created_before)
+    return queryset
+
+
+def iter_cases(queryset=None, chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Yield cases in id order, prefetching their related rows one chunk at a time."""
+    queryset = Case.objects.all() if queryset is None else queryset
+    return (
+        queryset.order_by("id")
+        .select_related("captain_decision", "trial")
+        .prefetch_related(
+            Prefetch("evidence", queryset=Evidence.objects.order_by("id").only("case_id", *EVIDENCE_FIELDS)),
+            Prefetch("suspects", queryset=Suspect.objects.order_by("id").only("case_id", *SUSPECT_FIELDS)),
+        )
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def _fields(obj, names):
+    return {name.removesuffix("_id") if name.endswith("_by_id") else name: getattr(obj, name) for name in names}
+
+
+def _related(case, name):
+    # Reverse one-to-ones raise when absent, even after select_related.
+    try:
+        return getattr(case, name)
+    except ObjectDoesNotExist:
+        return None
+
+
+def case_document(case) -> dict:
+    decision, trial = _related(case, "captain_decision"), _related(case, "trial")
+    return {
+        **_fields(case, CASE_FIELDS),
+        "evidence": [_fields(item, EVIDENCE_FIELDS) for item in case.evidence.all()],
+        "suspects": [_fields(suspect, SUSPECT_FIELDS) for suspect in case.suspects.all()],
+        "captain_decision": _fields(decision, DECISION_FIELDS) if decision else None,
+        "trial": _fields(trial, TRIAL_FIELDS) if trial else None,
+    }
+
+
+def ndjson_lines(cases):
+    encoder = DjangoJSONEncoder(ensure_ascii=False)
+    for case in cases:
+        yield encoder.encode(case_document(case)) + "\n"
+
+
+class _Echo:
+    """A file-like object whose ``write`` hands the written line straight back."""
+
+    def write(self, value):
+        return value
+
+
+def csv_lines(cases):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(CSV_HEADER)
+    for case in cases:
+        evidence, suspects = list(case.evidence.all()), list(case.suspects.all())
+        decision, trial = _related(case, "captain_decision"), _related(case, "trial")
+        yield writer.writerow(
+            (
+                *(getattr(case, name) for name in CASE_FIELDS),
+                len(evidence),
+                ";".join(item.title for item in evidence),
+                len(suspects),
+                ";".join(suspect.full_name for suspect in suspects),
+                decision.decision if decision else "",
+                decision.decided_at.isoformat() if decision else "",
+                "" if decision is None or decision.chief_approved is None else decision.chief_approved,
+                trial.verdict if trial else "",
+                trial.punishment_title if trial else "",
+                trial.judged_at.isoformat() if trial else "",
+            )
+        )
+
+
+WRITERS = {"ndjson": (ndjson_lines, "application/x-ndjson"), "csv": (csv_lines, "text/csv")}
+
+
+async def async_lines(lines, batch_size: int = ASYNC_BATCH_SIZE):
+    """Serve a synchronous line generator to an async response, a batch per thread hop."""
+    take = sync_to_async(lambda: "".join(islice(lines, batch_size)))
+    try:
+        while batch := await take():
+            yield batch
+    finally:
+        # Closes the server-side cursor on the same thread that opened it.
+        await sync_to_async(lines.close)()
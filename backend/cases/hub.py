@@ -0,0 +1,138 @@
+"""Fan-out of new case notifications to open event streams.
+
+``get_hub()`` returns the process-wide hub named by ``settings.NOTIFICATION_HUB``.
+A hub has three methods: ``subscribe(user_id)`` returns a ``Subscription`` bound
+to the running event loop, ``unsubscribe(sub)`` drops it, and
+``publish(user_id, payload)`` delivers a payload to every subscription of that
+user. ``publish`` may be called from any thread.
+
+``InProcessHub`` only reaches streams served by the same process. Deployments
+running several ASGI workers should use ``PostgresNotifyHub``, which relays each
+publish through Postgres ``LISTEN/NOTIFY`` so every worker sees it.
+"""
+
+import asyncio
+import json
+import logging
+import select
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+
+class Subscription:
+    # Events buffered for a slow client before it is cut off; it resumes from
+    # its Last-Event-ID on reconnect, so nothing is lost.
+    max_pending = 1000
+
+    def __init__(self, user_id):
+        self.user_id = user_id
+        self.loop = asyncio.get_running_loop()
+        self.queue = asyncio.Queue()
+        self.overflowed = False
+
+    def push(self, payload):
+        # Runs on the subscription's own loop.
+        if self.overflowed:
+            return
+        if self.queue.qsize() >= self.max_pending:
+            # The sentinel ends the stream; everything after it is dropped.
+            self.overflowed = True
+            self.queue.put_nowait(None)
+            return
+        self.queue.put_nowait(payload)
+
+
+class InProcessHub:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = defaultdict(set)
+
+    def subscribe(self, user_id) -> Subscription:
+        sub = Subscription(user_id)
+        with self._lock:
+            self._subscribers[user_id].add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.user_id)
+            if subs is None:
+                return
+            subs.discard(sub)
+            if not subs:
+                del self._subscribers[sub.user_id]
+
+    def publish(self, user_id, payload) -> None:
+        with self._lock:
+            subs = list(self._subscribers.get(user_id, ()))
+        for sub in subs:
+            try:
+                sub.loop.call_soon_threadsafe(sub.push, payload)
+            except RuntimeError:
+                # The stream's loop has already closed.
+                self.unsubscribe(sub)
+
+
+class PostgresNotifyHub(InProcessHub):
+    channel = "case_notifications"
+    poll_interval = 5
+
+    def __init__(self):
+        super().__init__()
+        self._listener = None
+
+    def subscribe(self, user_id) -> Subscription:
+        self._ensure_listener()
+        return super().subscribe(user_id)
+
+    def publish(self, user_id, payload) -> None:
+        message = json.dumps({"user_id": user_id, "payload": payload}, cls=DjangoJSONEncoder)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, %s)", [self.channel, message])
+
+    def _ensure_listener(self):
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(target=self._listen_forever, name="notification-listener", daemon=True)
+                self._listener.start()
+
+    def _listen_forever(self):
+        while True:
+            try:
+                self._listen()
+            except Exception:
+                logger.exception("Notification listener lost its connection; reconnecting.")
+                time.sleep(self.poll_interval)
+
+    def _listen(self):
+        import psycopg2
+        import psycopg2.extensions
+
+        conn = psycopg2.connect(**connection.get_connection_params())
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+            while True:
+                if select.select([conn], [], [], self.poll_interval) == ([], [], []):
+                    continue
+                conn.poll()
+                while conn.notifies:
+                    message = json.loads(conn.notifies.pop(0).payload)
+                    InProcessHub.publish(self, message["user_id"], message["payload"])
+        finally:
+            conn.close()
+
+
+@lru_cache(maxsize=None)
+def get_hub():
+    return import_string(settings.NOTIFICATION_HUB)()
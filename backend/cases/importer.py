@@ -0,0 +1,305 @@
+"""Bulk import of legacy cases from NDJSON or CSV.
+
+Each NDJSON line is one case::
+
+    {"external_id": "LEG-1", "title": "...", "description": "...", "crime_level": 2,
+     "status": "OPEN", "created_at": "2019-05-01T10:00:00Z", "created_by": "officer7",
+     "complainants": ["citizen@example.com"],
+     "complaint": {"complainant": "0912...", "details": "..."},
+     "crime_scene": {"report": "...", "reporter": "officer7", "witnessed_phone": "...",
+                     "witnessed_national_id": "...", "is_approved": true}}
+
+CSV files carry the same fields flat: ``complainants`` separated by ``;``,
+``complainant`` and ``complaint_details`` for the complaint, and
+``scene_report``, ``reporter``, ``witnessed_phone``, ``witnessed_national_id``
+and ``scene_approved`` for the crime scene. People are named by any login
+identifier and resolved in one query per chunk; ``created_by`` and
+``reporter`` default to the user running the import.
+
+Records are read lazily and handled in chunks. A chunk is validated in
+Python, then written with one ``bulk_create`` per table inside a single
+transaction that also advances the job's checkpoint, so an interrupted
+import resumes exactly where the last committed chunk ended. Invalid records
+are skipped and reported on the job.
+
+``bulk_create`` bypasses the save signals, so the dashboard counters and
+cache, the entity index and the search index are updated here directly. Imports send no
+case notifications; the job itself is the report.
+"""
+
+import csv
+import json
+from itertools import islice
+
+from django.db import transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from accounts.identifiers import resolve_login_user_ids
+from config.stats import invalidate_dashboard_stats
+from entities import index as entity_index
+from metrics import counters
+from search import documents as search_documents
+
+from .models import Case, CaseComplainant, CaseImportJob, Complaint, CrimeSceneReport
+
+DEFAULT_CHUNK_SIZE = 2000
+
+# Errors kept on the job; the counts stay exact beyond it.
+MAX_REPORTED_ERRORS = 1000
+
+CASE_STATUSES = {value for value, _ in Case.STATUS_CHOICES}
+
+
+def read_records(stream, fmt: str):
+    """Yield one dict per record from a text stream, or a ``ValueError`` for an unreadable one."""
+    if fmt == "csv":
+        for row in csv.DictReader(stream):
+            yield _from_csv(row)
+        return
+
+    for line in stream:
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield ValueError(f"Invalid JSON: {exc}")
+            continue
+        yield record if isinstance(record, dict) else ValueError("Each line must be a JSON object.")
+
+
+def _from_csv(row: dict) -> dict:
+    get = lambda key: (row.get(key) or "").strip()  # noqa: E731
+    record = {key: get(key) for key in ("external_id", "title", "description", "status", "created_at", "created_by")}
+    record = {key: value for key, value in record.items() if value}
+    if get("crime_level"):
+        record["crime_level"] = get("crime_level")
+    if get("complainants"):
+        record["complainants"] = [c.strip() for c in get("complainants").split(";") if c.strip()]
+    if get("complaint_details") or get("complainant"):
+        record["complaint"] = {"complainant": get("complainant"), "details": get("complaint_details")}
+    if get("scene_report"):
+        record["crime_scene"] = {
+            "report": get("scene_report"),
+            "reporter": get("reporter") or None,
+            "witnessed_phone": get("witnessed_phone"),
+            "witnessed_national_id": get("witnessed_national_id"),
+            "is_approved": get("scene_approved").lower() in {"1", "true", "yes"},
+        }
+    return record
+
+
+def _text(errors, data, key, max_length=None, required=False):
+    value = data.get(key)
+    if value is None or value == "":
+        if required:
+            errors[key] = "This field is required."
+        return ""
+    if not isinstance(value, str):
+        errors[key] = "Must be a string."
+        return ""
+    value = value.strip()
+    if required and not value:
+        errors[key] = "This field is required."
+    if max_length and len(value) > max_length:
+        errors[key] = f"At most {max_length} characters."
+    return value
+
+
+def _identifier(errors, data, key, required=False):
+    value = data.get(key)
+    if value is None or value == "":
+        if required:
+            errors[key] = "This field is required."
+        return None
+    if not isinstance(value, (str, int)) or isinstance(value, bool):
+        errors[key] = "Must be a username, email, phone or national id."
+        return None
+    return str(value).strip()
+
+
+def clean_record(record: dict) -> tuple[dict, dict]:
+    """Validate one record; returns ``(cleaned, errors)``."""
+    errors = {}
+    cleaned = {
+        "title": _text(errors, record, "title", max_length=200, required=True),
+        "description": _text(errors, record, "description"),
+        "created_by": _identifier(errors, record, "created_by"),
+    }
+
+    level = record.get("crime_level", 1)
+    try:
+        cleaned["crime_level"] = int(level)
+    except (TypeError, ValueError):
+        cleaned["crime_level"] = None
+    if isinstance(level, bool) or cleaned["crime_level"] not in (1, 2, 3, 4):
+        errors["crime_level"] = "Must be a crime level from 1 to 4."
+
+    cleaned["status"] = record.get("status") or "OPEN"
+    if not isinstance(cleaned["status"], str) or cleaned["status"] not in CASE_STATUSES:
+        errors["status"] = f"Must be one of {sorted(CASE_STATUSES)}."
+
+    cleaned["created_at"] = None
+    if record.get("created_at"):
+        try:
+            created_at = parse_datetime(record["created_at"]) if isinstance(record["created_at"], str) else None
+        except ValueError:
+            # Well formed but out of range, e.g. month 13.
+            created_at = None
+        if created_at is None:
+            errors["created_at"] = "Must be an ISO 8601 datetime."
+        else:
+            cleaned["created_at"] = created_at if timezone.is_aware(created_at) else timezone.make_aware(created_at)
+
+    complainants = record.get("complainants") or []
+    if not isinstance(complainants, list):
+        errors["complainants"] = "Must be a list of identifiers."
+        complainants = []
+    cleaned["complainants"] = [str(c).strip() for c in complainants if isinstance(c, (str, int)) and str(c).strip()]
+
+    cleaned["complaint"] = None
+    if record.get("complaint") is not None:
+        raw, complaint_errors = record["complaint"], {}
+        if not isinstance(raw, dict):
+            errors["complaint"] = "Must be an object."
+        else:
+            cleaned["complaint"] = {
+                "complainant": _identifier(complaint_errors, raw, "complainant", required=True),
+                "details": _text(complaint_errors, raw, "details", required=True),
+            }
+            if complaint_errors:
+                errors["complaint"] = complaint_errors
+
+    cleaned["crime_scene"] = None
+    if record.get("crime_scene") is not None:
+        raw, scene_errors = record["crime_scene"], {}
+        if not isinstance(raw, dict):
+            errors["crime_scene"] = "Must be an object."
+        else:
+            cleaned["crime_scene"] = {
+                "report": _text(scene_errors, raw, "report", required=True),
+                "reporter": _identifier(scene_errors, raw, "reporter"),
+                "witnessed_phone": _text(scene_errors, raw, "witnessed_phone", max_length=20),
+                "witnessed_national_id": _text(scene_errors, raw, "witnessed_national_id", max_length=20),
+                "is_approved": raw.get("is_approved") is True,
+            }
+            if scene_errors:
+                errors["crime_scene"] = scene_errors
+    return cleaned, errors
+
+
+def _people(cleaned: dict) -> list:
+    people = [cleaned["created_by"], *cleaned["complainants"]]
+    if cleaned["complaint"]:
+        people.append(cleaned["complaint"]["complainant"])
+    if cleaned["crime_scene"]:
+        people.append(cleaned["crime_scene"]["reporter"])
+    return [person for person in people if person]
+
+
+def _report_error(job, number, record, errors):
+    job.rejected += 1
+    if len(job.errors) < MAX_REPORTED_ERRORS:
+        external_id = record.get("external_id") if isinstance(record, dict) else None
+        job.errors.append({"record": number, "external_id": external_id, "errors": errors})
+
+
+def import_chunk(job: CaseImportJob, chunk: list) -> None:
+    """Validate and write ``[(record number, record), ...]``, then advance the checkpoint."""
+    valid = []
+    for number, record in chunk:
+        if isinstance(record, Exception):
+            _report_error(job, number, None, {"record": str(record)})
+            continue
+        cleaned, errors = clean_record(record)
+        if errors:
+            _report_error(job, number, record, errors)
+        else:
+            valid.append((number, record, cleaned))
+
+    users = resolve_login_user_ids({person for _, _, cleaned in valid for person in _people(cleaned)})
+    rows = []
+    for number, record, cleaned in valid:
+        unknown = sorted({person for person in _people(cleaned) if person not in users})
+        if unknown:
+            _report_error(job, number, record, {"users": f"Unknown users: {', '.join(unknown)}."})
+        else:
+            rows.append(cleaned)
+
+    now = timezone.now()
+    with transaction.atomic():
+        cases = Case.objects.bulk_create(
+            [
+                Case(
+                    title=row["title"],
+                    description=row["description"],
+                    crime_level=row["crime_level"],
+                    status=row["status"],
+                    created_by_id=users.get(row["created_by"], job.created_by_id),
+                    created_at=row["created_at"] or now,
+                )
+                for row in rows
+            ]
+        )
+
+        reports, complaints, complainants = [], [], []
+        for case, row in zip(cases, rows):
+            scene = row["crime_scene"]
+            if scene:
+                reports.append(
+                    CrimeSceneReport(
+                        case_id=case.pk,
+                        reporter_id=users.get(scene["reporter"], case.created_by_id),
+                        report=scene["report"],
+                        witnessed_phone=scene["witnessed_phone"],
+                        witnessed_national_id=scene["witnessed_national_id"],
+                        is_approved=scene["is_approved"],
+                        created_at=case.created_at,
+                    )
+                )
+            people = {users[person] for person in row["complainants"]}
+            if row["complaint"]:
+                complainant_id = users[row["complaint"]["complainant"]]
+                complaints.append(Complaint(case_id=case.pk, complainant_id=complainant_id, details=row["complaint"]["details"]))
+                people.add(complainant_id)
+            complainants.extend(
+                CaseComplainant(case_id=case.pk, user_id=user_id, status=CaseComplainant.STATUS_APPROVED)
+                for user_id in sorted(people)
+            )
+        CrimeSceneReport.objects.bulk_create(reports)
+        Complaint.objects.bulk_create(complaints)
+        CaseComplainant.objects.bulk_create(complainants)
+
+        deltas = {counters.CASES_TOTAL: len(cases)}
+        for case in cases:
+            key = counters.case_status_key(case.status)
+            deltas[key] = deltas.get(key, 0) + 1
+        counters.bump(deltas)
+        transaction.on_commit(invalidate_dashboard_stats)
+        entity_index.index_rows("cases.crimescenereport", reports)
+        search_documents.index_rows("cases.case", cases)
+
+        job.records_done += len(chunk)
+        job.imported += len(cases)
+        job.save(update_fields=["records_done", "imported", "rejected", "errors", "updated_at"])
+
+
+def run_import(job: CaseImportJob, stream, chunk_size: int = DEFAULT_CHUNK_SIZE) -> CaseImportJob:
+    """Import ``stream`` into ``job``, starting after its checkpoint."""
+    records = enumerate(read_records(stream, job.fmt), start=1)
+    records = islice(records, job.records_done, None)
+    job.status, job.failure = CaseImportJob.STATUS_RUNNING, ""
+    job.save(update_fields=["status", "failure", "updated_at"])
+    try:
+        while chunk := list(islice(records, chunk_size)):
+            import_chunk(job, chunk)
+    except Exception as exc:
+        # Counts reflect the last committed chunk; rerunning resumes from there.
+        job.refresh_from_db()
+        job.status, job.failure = CaseImportJob.STATUS_FAILED, f"{type(exc).__name__}: {exc}"
+        job.save(update_fields=["status", "failure", "updated_at"])
+        raise
+    job.status = CaseImportJob.STATUS_COMPLETED
+    job.save(update_fields=["status", "updated_at"])
+    return job
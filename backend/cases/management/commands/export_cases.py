@@ -0,0 +1,53 @@
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from cases.exporter import DEFAULT_CHUNK_SIZE, WRITERS, export_queryset, iter_cases
+
+
+class Command(BaseCommand):
+    help = "Export cases with their evidence, suspects, decision and trial as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=sorted(WRITERS), help="Defaults to the output extension, else ndjson.")
+        parser.add_argument("--output", default="-", help="File to write, or - for stdout.")
+        parser.add_argument("--status", help="Only cases in this status.")
+        parser.add_argument("--created-after", help="ISO 8601 datetime, inclusive.")
+        parser.add_argument("--created-before", help="ISO 8601 datetime, exclusive.")
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def _datetime(self, option, raw):
+        if not raw:
+            return None
+        try:
+            value = parse_datetime(raw)
+        except ValueError:
+            value = None
+        if value is None:
+            raise CommandError(f"--{option} must be an ISO 8601 datetime.")
+        return value if timezone.is_aware(value) else timezone.make_aware(value)
+
+    def handle(self, *args, output, **options):
+        fmt = options["format"] or ("csv" if output.lower().endswith(".csv") else "ndjson")
+        queryset = export_queryset(
+            status=options["status"],
+            created_after=self._datetime("created-after", options["created_after"]),
+            created_before=self._datetime("created-before", options["created_before"]),
+        )
+        write = WRITERS[fmt][0]
+
+        started, count = time.perf_counter(), 0
+        stream = sys.stdout if output == "-" else open(output, "w", encoding="utf-8", newline="")
+        try:
+            for count, line in enumerate(write(iter_cases(queryset, chunk_size=options["chunk_size"])), start=1):
+                stream.write(line)
+        finally:
+            if stream is not sys.stdout:
+                stream.close()
+        elapsed = time.perf_counter() - started
+
+        cases = count - 1 if fmt == "csv" else count
+        self.stderr.write(f"Exported {cases} cases in {elapsed:.1f}s.")
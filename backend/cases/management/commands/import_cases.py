@@ -0,0 +1,51 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from cases.importer import DEFAULT_CHUNK_SIZE, run_import
+from cases.models import CaseImportJob
+
+
+class Command(BaseCommand):
+    help = "Import legacy cases from an NDJSON or CSV file (see cases.importer for the record format)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--format", choices=["ndjson", "csv"], help="Defaults to the file extension.")
+        parser.add_argument("--user", help="Username recorded as the importer and default case creator.")
+        parser.add_argument("--resume", type=int, metavar="JOB_ID", help="Continue a job from its checkpoint.")
+        parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+
+    def handle(self, *args, path, **options):
+        if options["resume"]:
+            job = CaseImportJob.objects.filter(pk=options["resume"]).first()
+            if job is None:
+                raise CommandError(f"No import job {options['resume']}.")
+            if job.status == CaseImportJob.STATUS_COMPLETED:
+                raise CommandError(f"Import job {job.pk} already completed.")
+        else:
+            User = get_user_model()
+            users = User.objects.filter(username=options["user"]) if options["user"] else User.objects.filter(is_superuser=True)
+            user = users.order_by("id").first()
+            if user is None:
+                raise CommandError("Pass --user, or create a superuser to record as the importer.")
+            fmt = options["format"] or ("csv" if path.lower().endswith(".csv") else "ndjson")
+            job = CaseImportJob.objects.create(source=path, fmt=fmt, created_by=user)
+
+        started = time.perf_counter()
+        with open(path, encoding="utf-8-sig", newline="") as stream:
+            try:
+                run_import(job, stream, chunk_size=options["chunk_size"])
+            except Exception as exc:
+                raise CommandError(f"Import job {job.pk} stopped after {job.records_done} records: {exc}. Rerun with --resume {job.pk}.")
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Import job {job.pk}: {job.imported} cases imported, {job.rejected} records rejected "
+                f"in {elapsed:.1f}s ({job.imported / elapsed if elapsed else 0:.0f} cases/s)."
+            )
+        )
+        for error in job.errors[:20]:
+            self.stdout.write(f"  record {error['record']}: {error['errors']}")
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.11 on 2026-10-18 01:08
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0006_rename_casecomp_case_status_idx_cases_casec_case_id_baf018_idx_and_more'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='casenotification',
+            index=models.Index(fields=['recipient', 'read_at', 'created_at'], name='casenotif_recipient_read_idx'),
+        ),
+    ]
@@ -0,0 +1,64 @@
+# Generated by Django 5.2.11 on 2026-10-18 01:15
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_revisions(apps, schema_editor):
+    # Existing rows start at revision 1 so a client syncing from 0 receives them.
+    for name in ("DetectiveBoard", "DetectiveBoardItem", "DetectiveBoardLink"):
+        apps.get_model("cases", name).objects.update(revision=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0007_casenotification_recipient_read_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DetectiveBoardTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('item', 'Item'), ('link', 'Link')], max_length=10)),
+                ('object_id', models.PositiveIntegerField()),
+                ('revision', models.PositiveBigIntegerField()),
+            ],
+        ),
+        migrations.AddField(
+            model_name='detectiveboard',
+            name='revision',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='detectiveboarditem',
+            name='revision',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='detectiveboardlink',
+            name='revision',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+        migrations.RunPython(backfill_revisions, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='detectiveboarditem',
+            index=models.Index(fields=['board', 'revision'], name='boarditem_board_rev_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='detectiveboardlink',
+            index=models.Index(fields=['board', 'revision'], name='boardlink_board_rev_idx'),
+        ),
+        migrations.AddField(
+            model_name='detectiveboardtombstone',
+            name='board',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tombstones', to='cases.detectiveboard'),
+        ),
+        migrations.AddIndex(
+            model_name='detectiveboardtombstone',
+            index=models.Index(fields=['board', 'revision'], name='boardtomb_board_rev_idx'),
+        ),
+    ]
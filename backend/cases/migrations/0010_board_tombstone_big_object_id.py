@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-18 02:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0009_case_import_job'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='detectiveboardtombstone',
+            name='object_id',
+            field=models.PositiveBigIntegerField(),
+        ),
+    ]
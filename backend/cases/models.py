@@ -120,6 +120,9 @@ class DetectiveBoard(models.Model):
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name="detective_boards_created")
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
+    # Bumped once per write; items, links and tombstones carry the revision
+    # that last touched them so clients can sync with ?since=<revision>.
+    revision = models.PositiveBigIntegerField(default=0)
 
 
 class DetectiveBoardItem(models.Model):
@@ -148,6 +151,12 @@ class DetectiveBoardItem(models.Model):
     created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name="detective_board_items_created")
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
+    revision = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["board", "revision"], name="boarditem_board_rev_idx"),
+        ]
 
 
 class DetectiveBoardLink(models.Model):
@@ -158,6 +167,31 @@ class DetectiveBoardLink(models.Model):
     meta = models.JSONField(blank=True, default=dict)
     created_by = models.ForeignKey(settings.AUTH_user_MODEL if hasattr(settings, "AUTH_user_MODEL") else settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name="detective_board_links_created")
     created_at = models.DateTimeField(default=timezone.now)
+    revision = models.PositiveBigIntegerField(default=0)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["board", "revision"], name="boardlink_board_rev_idx"),
+        ]
+
+
+class DetectiveBoardTombstone(models.Model):
+    """Marks an item or link deleted at a board revision, for delta sync."""
+
+    KIND_CHOICES = [
+        ("item", "Item"),
+        ("link", "Link"),
+    ]
+
+    board = models.ForeignKey(DetectiveBoard, on_delete=models.CASCADE, related_name="tombstones")
+    kind = models.CharField(max_length=10, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    revision = models.PositiveBigIntegerField()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["board", "revision"], name="boardtomb_board_rev_idx"),
+        ]
 
 
 # =========================
@@ -273,6 +307,48 @@ class CaseNotification(models.Model):
     created_at = models.DateTimeField(default=timezone.now)
     read_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["recipient", "read_at", "created_at"], name="casenotif_recipient_read_idx"),
+        ]
+
     @property
     def is_read(self) -> bool:
         return self.read_at is not None
+
+
+class CaseImportJob(models.Model):
+    """A bulk import of legacy cases (see ``cases.importer``).
+
+    ``records_done`` is the resume checkpoint: records before it were either
+    written or rejected in a committed chunk, so a rerun skips them.
+    """
+
+    STATUS_RUNNING = "RUNNING"
+    STATUS_COMPLETED = "COMPLETED"
+    STATUS_FAILED = "FAILED"
+    STATUS_CHOICES = [
+        (STATUS_RUNNING, "Running"),
+        (STATUS_COMPLETED, "Completed"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    FORMAT_CHOICES = [("ndjson", "NDJSON"), ("csv", "CSV")]
+
+    source = models.CharField(max_length=255, blank=True, default="")
+    fmt = models.CharField(max_length=10, choices=FORMAT_CHOICES, default="ndjson")
+    status = models.CharField(max_length=20, choices=STATUS_CHOICES, default=STATUS_RUNNING)
+
+    records_done = models.PositiveIntegerField(default=0)
+    imported = models.PositiveIntegerField(default=0)
+    rejected = models.PositiveIntegerField(default=0)
+    # [{"record": n, "external_id": ..., "errors": {...}}], capped (see cases.importer).
+    errors = models.JSONField(default=list, blank=True)
+    failure = models.TextField(blank=True, default="")
+
+    created_by = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.PROTECT, related_name="case_imports")
+    created_at = models.DateTimeField(default=timezone.now)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"CaseImportJob #{self.pk} ({self.status}, {self.records_done} records)"
@@ -12,6 +12,7 @@ from .models import (
     Trial,
     CaseNotification,
     CaseComplainant,
+    CaseImportJob,
 )
 
 
@@ -79,8 +80,9 @@ class DetectiveBoardItemSerializer(serializers.ModelSerializer):
             "created_by",
             "created_at",
             "updated_at",
+            "revision",
         )
-        read_only_fields = ("id", "board", "created_by", "created_at", "updated_at")
+        read_only_fields = ("id", "board", "created_by", "created_at", "updated_at", "revision")
 
     def validate(self, attrs):
         ref_id = attrs.get("ref_id", getattr(self.instance, "ref_id", None))
@@ -153,29 +155,31 @@ class DetectiveBoardLinkSerializer(serializers.ModelSerializer):
         return link
 
 
+def board_link_payload(link) -> dict:
+    return {
+        "id": link.id,
+        "source": link.source_id,
+        "target": link.target_id,
+        "label": link.label,
+        "meta": link.meta,
+        "created_by": link.created_by_id,
+        "created_at": link.created_at,
+        "revision": link.revision,
+    }
+
+
 class DetectiveBoardSerializer(serializers.ModelSerializer):
     items = DetectiveBoardItemSerializer(many=True, read_only=True)
     links = serializers.SerializerMethodField()
 
     class Meta:
         model = DetectiveBoard
-        fields = ("id", "case", "created_by", "created_at", "updated_at", "items", "links")
+        fields = ("id", "case", "created_by", "created_at", "updated_at", "revision", "items", "links")
         read_only_fields = fields
 
     def get_links(self, obj):
-        qs = obj.links.all().order_by("id")
-        return [
-            {
-                "id": l.id,
-                "source": l.source_id,
-                "target": l.target_id,
-                "label": l.label,
-                "meta": l.meta,
-                "created_by": l.created_by_id,
-                "created_at": l.created_at,
-            }
-            for l in qs
-        ]
+        # Sorted in Python so a prefetched ``links`` is used as is.
+        return [board_link_payload(l) for l in sorted(obj.links.all(), key=lambda l: l.id)]
 
 
 # =========================
@@ -274,3 +278,23 @@ class CaseNotificationSerializer(serializers.ModelSerializer):
 
     def get_is_read(self, obj):
         return obj.read_at is not None
+
+
+class CaseImportJobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = CaseImportJob
+        fields = (
+            "id",
+            "source",
+            "fmt",
+            "status",
+            "records_done",
+            "imported",
+            "rejected",
+            "errors",
+            "failure",
+            "created_by",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = fields
@@ -0,0 +1,28 @@
+from django.db import transaction
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .hub import get_hub
+from .models import CaseNotification
+from .serializers import CaseNotificationSerializer
+
+
+@receiver(post_save, sender=CaseNotification)
+def _publish_notification(sender, instance, created, **kwargs):
+    if created:
+        publish_notifications([instance])
+
+
+def publish_notifications(notifications) -> None:
+    """Push new notifications to their recipients' streams once the transaction commits.
+
+    Called directly by writers that use ``bulk_create``, which skips ``post_save``.
+    """
+    messages = [(n.recipient_id, CaseNotificationSerializer(n).data) for n in notifications]
+
+    def publish():
+        hub = get_hub()
+        for recipient_id, payload in messages:
+            hub.publish(recipient_id, payload)
+
+    transaction.on_commit(publish)
@@ -0,0 +1,138 @@
+"""Server-sent event stream of a user's case notifications.
+
+``GET /api/cases/notifications/stream/`` replaces polling the notification
+list. Each event carries the notification id, so a reconnecting
+``EventSource`` sends ``Last-Event-ID`` and receives whatever it missed before
+the live feed resumes. Browsers cannot set headers on ``EventSource``, so the
+access token may also be passed as ``?token=``; ``?last_id=`` stands in for
+``Last-Event-ID`` on the first connection.
+
+The live feed needs an ASGI server (see ``config/asgi.py``). Under WSGI the
+endpoint answers with the missed backlog (or just a resume id) and asks the
+client to reconnect shortly, which degrades to cheap polling rather than tying
+up a worker. The live feed ends when the access token expires, so the client
+reconnects with a fresh one.
+"""
+
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import HttpResponse, JsonResponse, StreamingHttpResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from rbac.authentication import RoleClaimJWTAuthentication, user_and_expiry_for_token
+
+from .hub import get_hub
+from .models import CaseNotification
+from .serializers import CaseNotificationSerializer
+
+# Notifications replayed per query to a reconnecting client.
+BACKLOG_LIMIT = 500
+
+# Client reconnect delay (ms) advertised in the ``retry:`` field.
+RETRY_MS = 3000
+
+
+def _authenticate(request):
+    """``(user, exp)`` for the request's access token, or ``(None, None)``."""
+    raw_token = request.GET.get("token")
+    if raw_token:
+        return user_and_expiry_for_token(raw_token)
+    try:
+        result = RoleClaimJWTAuthentication().authenticate(request)
+    except (InvalidToken, AuthenticationFailed):
+        return None, None
+    return (result[0], result[1]["exp"]) if result else (None, None)
+
+
+def _last_event_id(request):
+    raw = request.headers.get("Last-Event-ID") or request.GET.get("last_id")
+    try:
+        return int(raw) if raw is not None else None
+    except ValueError:
+        return None
+
+
+def _backlog(user, after_id):
+    qs = CaseNotification.objects.filter(recipient=user, id__gt=after_id).order_by("id")[:BACKLOG_LIMIT]
+    return list(CaseNotificationSerializer(qs, many=True).data)
+
+
+def _latest_id(user):
+    return CaseNotification.objects.filter(recipient=user).order_by("-id").values_list("id", flat=True).first() or 0
+
+
+def _event(payload) -> str:
+    return f"id: {payload['id']}\nevent: notification\ndata: {json.dumps(payload)}\n\n"
+
+
+async def notification_stream(request):
+    if request.method != "GET":
+        return JsonResponse({"detail": "Method not allowed."}, status=405)
+
+    user, expires_at = await sync_to_async(_authenticate)(request)
+    if user is None:
+        return JsonResponse({"detail": "Authentication credentials were not provided or are invalid."}, status=401)
+
+    last_id = _last_event_id(request)
+
+    if not isinstance(request, ASGIRequest):
+        if last_id is None:
+            # An id-only event gives the client a resume point for its next poll.
+            latest = await sync_to_async(_latest_id)(user)
+            body = f"retry: {RETRY_MS}\nid: {latest}\n\n"
+        else:
+            backlog = await sync_to_async(_backlog)(user, last_id)
+            body = f"retry: {RETRY_MS}\n\n" + "".join(_event(item) for item in backlog)
+        return _sse_headers(HttpResponse(body, content_type="text/event-stream"))
+
+    # Subscribe before reading the backlog so nothing created in between is missed;
+    # duplicates are dropped by id below.
+    hub = get_hub()
+    sub = hub.subscribe(user.pk)
+    heartbeat = settings.NOTIFICATION_STREAM_HEARTBEAT
+
+    async def events():
+        sent = last_id
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            while sent is not None:
+                backlog = await sync_to_async(_backlog)(user, sent)
+                for item in backlog:
+                    sent = item["id"]
+                    yield _event(item)
+                if len(backlog) < BACKLOG_LIMIT:
+                    break
+
+            while True:
+                left = expires_at - time.time()
+                if left <= 0:
+                    # The token has expired; the client reconnects with a fresh one.
+                    return
+                try:
+                    item = await asyncio.wait_for(sub.queue.get(), timeout=min(heartbeat, left))
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                if item is None:
+                    # Fell too far behind; the client reconnects with its Last-Event-ID.
+                    return
+                if sent is not None and item["id"] <= sent:
+                    continue
+                sent = item["id"]
+                yield _event(item)
+        finally:
+            hub.unsubscribe(sub)
+
+    return _sse_headers(StreamingHttpResponse(events(), content_type="text/event-stream"))
+
+
+def _sse_headers(response):
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
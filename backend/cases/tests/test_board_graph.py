@@ -0,0 +1,54 @@
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase
+from rest_framework.test import APITestCase
+
+from cases.board_graph import BoardGraph
+from cases.models import Case, DetectiveBoard, DetectiveBoardItem, DetectiveBoardLink
+from rbac.models import Role, UserRole
+
+User = get_user_model()
+
+
+def _graph(edges, extra_nodes=(), suspects=()):
+    ids = {n for edge in edges for n in edge} | set(extra_nodes)
+    nodes = {
+        i: {"id": i, "title": "", "item_type": "SUSPECT" if i in suspects else "NOTE", "ref_model": "", "ref_id": 7 if i in suspects else None}
+        for i in ids
+    }
+    adjacency = {i: set() for i in ids}
+    for a, b in edges:
+        adjacency[a].add(b)
+        adjacency[b].add(a)
+    return BoardGraph(nodes, adjacency)
+
+
+class BoardGraphTests(SimpleTestCase):
+    def test_queries(self):
+        graph = _graph([(1, 2), (2, 3), (3, 4), (1, 5), (6, 7)], extra_nodes=[8], suspects=[1])
+
+        self.assertEqual(graph.components(), [[1, 2, 3, 4, 5], [6, 7], [8]])
+        self.assertEqual(graph.shortest_path(5, 4), [5, 1, 2, 3, 4])
+        self.assertIsNone(graph.shortest_path(1, 6))
+        self.assertEqual(graph.degree_centrality()[0][:2], (1, 2))
+        self.assertEqual(graph.linked_to_suspect(7, depth=2), {2: 1, 5: 1, 3: 2})
+
+
+class BoardGraphApiTests(APITestCase):
+    def test_path_is_served_from_the_cached_graph(self):
+        cache.clear()
+        detective = User.objects.create_user(username="d", email="d@test.com", password="x")
+        UserRole.objects.create(user=detective, role=Role.objects.create(name="Detective"))
+        case = Case.objects.create(title="c", created_by=detective)
+        board = DetectiveBoard.objects.create(case=case, created_by=detective)
+        a, b, c = (DetectiveBoardItem.objects.create(board=board, title=t, created_by=detective) for t in "abc")
+        for source, target in ((a, b), (b, c)):
+            DetectiveBoardLink.objects.create(board=board, source=source, target=target, created_by=detective)
+
+        self.client.force_authenticate(user=detective)
+        url = f"/api/cases/{case.id}/detective_board/graph/path/?from={a.id}&to={c.id}"
+        resp = self.client.get(url)
+        self.assertEqual([n["title"] for n in resp.data["path"]], ["a", "b", "c"])
+
+        with self.assertNumQueries(3):  # roles, case, board; the graph comes from the cache
+            self.client.get(url)
@@ -0,0 +1,134 @@
+import asyncio
+import json
+from datetime import timedelta
+from unittest import mock
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.db import OperationalError
+from django.test import TransactionTestCase, override_settings
+
+from cases import board_socket
+from cases.board_socket import websocket_application
+from cases.models import Case, DetectiveBoard, DetectiveBoardItem
+from rbac.models import Role, UserRole
+from rbac.tokens import RoleRefreshToken
+
+User = get_user_model()
+
+
+class FakeSocket:
+    def __init__(self, path):
+        self.scope = {"type": "websocket", "path": path, "query_string": path.split("?", 1)[-1].encode()}
+        self.scope["path"] = path.split("?", 1)[0]
+        self.incoming = asyncio.Queue()
+        self.outgoing = asyncio.Queue()
+
+    async def open(self):
+        await self.incoming.put({"type": "websocket.connect"})
+        self.task = asyncio.create_task(websocket_application(self.scope, self.incoming.get, self.outgoing.put))
+        return await self.outgoing.get()
+
+    async def send(self, message):
+        await self.incoming.put({"type": "websocket.receive", "text": json.dumps(message)})
+
+    async def frame(self):
+        event = await asyncio.wait_for(self.outgoing.get(), timeout=5)
+        return json.loads(event["text"])
+
+    async def close(self):
+        await self.incoming.put({"type": "websocket.disconnect", "code": 1000})
+        await asyncio.wait_for(self.task, timeout=5)
+
+
+@override_settings(BOARD_SOCKET_FLUSH_INTERVAL=60)
+class BoardSocketTests(TransactionTestCase):
+    def open_board(self, lifetime=None):
+        detective = User.objects.create_user(username="d", email="d@test.com", password="x")
+        UserRole.objects.create(user=detective, role=Role.objects.create(name="Detective"))
+        case = Case.objects.create(title="c", created_by=detective)
+        board = DetectiveBoard.objects.create(case=case, created_by=detective)
+        note = DetectiveBoardItem.objects.create(board=board, title="n", created_by=detective)
+        detective.refresh_from_db()  # pick up the role_version bumped by the role grant
+        token = RoleRefreshToken.for_user(detective).access_token
+        if lifetime is not None:
+            token.set_exp(lifetime=lifetime)
+        return f"/ws/cases/{case.id}/board/?token={token}", note
+
+    def test_moves_are_relayed_and_coalesced(self):
+        path, note = self.open_board()
+
+        async def scenario():
+            a, b = FakeSocket(path), FakeSocket(path)
+            self.assertEqual((await a.open())["type"], "websocket.accept")
+            await b.open()
+            await a.frame(), await b.frame()  # hello
+
+            for x in (1, 2, 3):
+                await a.send({"type": "move", "items": [{"id": note.id, "x": x, "y": 0}]})
+            moved = [await b.frame() for _ in range(3)]
+
+            await b.send({"type": "ops", "ref": "r1", "operations": [{"op": "create", "type": "item", "data": {"title": "x"}}]})
+            revision_a, diff_a = await a.frame(), await a.frame()
+            await b.frame(), await b.frame()
+
+            await a.close()
+            await b.close()
+            return moved, revision_a, diff_a
+
+        moved, revision, diff = async_to_sync(scenario)()
+        self.assertEqual([m["items"][0]["x"] for m in moved], [1, 2, 3])
+        self.assertEqual([m["seq"] for m in moved], [1, 2, 3])
+        # The three drags land as one write before the batch, then the batch.
+        self.assertEqual((revision["type"], revision["revision"]), ("revision", 1))
+        self.assertEqual((diff["type"], diff["ref"], diff["diff"]["revision"]), ("diff", "r1", 2))
+        note.refresh_from_db()
+        self.assertEqual(note.x, 3)
+
+    def test_rejects_missing_token(self):
+        async def scenario():
+            return await FakeSocket("/ws/cases/1/board/").open()
+
+        self.assertEqual(async_to_sync(scenario)(), {"type": "websocket.close", "code": 4401})
+
+    @override_settings(BOARD_SOCKET_FLUSH_INTERVAL=0.05)
+    def test_failed_flush_is_logged_and_retried(self):
+        path, note = self.open_board()
+        save_positions = board_socket.save_positions
+        calls = []
+
+        def flaky_save(board, positions):
+            calls.append(dict(positions))
+            if len(calls) == 1:
+                raise OperationalError("database went away")
+            return save_positions(board, positions)
+
+        async def scenario():
+            socket = FakeSocket(path)
+            await socket.open()
+            await socket.frame()  # hello
+            await socket.send({"type": "move", "items": [{"id": note.id, "x": 7, "y": 0}]})
+            revision = await socket.frame()
+            await socket.close()
+            return revision
+
+        with mock.patch.object(board_socket, "save_positions", flaky_save):
+            with self.assertLogs("cases.board_socket", "ERROR"):
+                revision = async_to_sync(scenario)()
+        self.assertEqual(revision["type"], "revision")
+        self.assertEqual(calls, [{note.id: (7.0, 0.0)}] * 2)
+        note.refresh_from_db()
+        self.assertEqual(note.x, 7)
+
+    def test_closes_when_the_token_expires(self):
+        path, _ = self.open_board(lifetime=timedelta(seconds=1))
+
+        async def scenario():
+            socket = FakeSocket(path)
+            await socket.open()
+            await socket.frame()  # hello
+            closed = await asyncio.wait_for(socket.outgoing.get(), timeout=5)
+            await asyncio.wait_for(socket.task, timeout=5)
+            return closed
+
+        self.assertEqual(async_to_sync(scenario)(), {"type": "websocket.close", "code": 4401})
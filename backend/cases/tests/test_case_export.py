@@ -0,0 +1,96 @@
+import csv
+import io
+import json
+import tempfile
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from cases.exporter import iter_cases, ndjson_lines
+from cases.models import Case, CaptainDecision, Trial
+from evidence.models import Evidence
+from rbac.models import Role, UserRole
+from rbac.tokens import RoleRefreshToken
+from suspects.models import Suspect
+
+User = get_user_model()
+
+
+class CaseExportTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.captain = User.objects.create_user(username="captain", email="captain@test.com", password="x")
+        UserRole.objects.create(user=cls.captain, role=Role.objects.create(name="Captain"))
+        cls.cases = [
+            Case.objects.create(title=f"Case {i}", status="OPEN" if i % 2 else "CLOSED", created_by=cls.captain)
+            for i in range(5)
+        ]
+        robbery = cls.cases[0]
+        Evidence.objects.create(case=robbery, title="Crowbar", created_by=cls.captain)
+        Evidence.objects.create(case=robbery, title="Glove", created_by=cls.captain)
+        Suspect.objects.create(case=robbery, full_name="Cole Phelps", national_id="0012345678")
+        CaptainDecision.objects.create(case=robbery, decision="SEND_TO_TRIAL", decided_by=cls.captain)
+        Trial.objects.create(case=robbery, verdict="GUILTY", punishment_title="Prison", judged_by=cls.captain)
+
+    def test_ndjson_nests_related_rows_per_case(self):
+        self.client.force_authenticate(self.captain)
+        resp = self.client.get("/api/cases/export/")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp["Content-Type"], "application/x-ndjson")
+
+        documents = [json.loads(line) for line in b"".join(resp.streaming_content).decode().splitlines()]
+        self.assertEqual([d["id"] for d in documents], [c.pk for c in self.cases])
+        robbery, empty = documents[0], documents[1]
+        self.assertEqual([e["title"] for e in robbery["evidence"]], ["Crowbar", "Glove"])
+        self.assertEqual(robbery["suspects"][0]["national_id"], "0012345678")
+        self.assertEqual((robbery["captain_decision"]["decision"], robbery["trial"]["punishment_title"]), ("SEND_TO_TRIAL", "Prison"))
+        self.assertEqual((empty["evidence"], empty["captain_decision"], empty["trial"]), ([], None, None))
+
+    def test_asgi_streams_asynchronously(self):
+        self.captain.refresh_from_db()  # role_version moved when the role was granted
+        token = str(RoleRefreshToken.for_user(self.captain).access_token)
+
+        async def scenario():
+            resp = await self.async_client.get("/api/cases/export/", headers={"Authorization": f"Bearer {token}"})
+            self.assertEqual(resp.status_code, 200)
+            self.assertTrue(resp.is_async)
+            return [chunk async for chunk in resp.streaming_content]
+
+        chunks = async_to_sync(scenario)()
+        documents = [json.loads(line) for line in b"".join(chunks).decode().splitlines()]
+        self.assertEqual([d["id"] for d in documents], [c.pk for c in self.cases])
+
+    def test_csv_flattens_and_filters(self):
+        self.client.force_authenticate(self.captain)
+        resp = self.client.get("/api/cases/export/", {"fmt": "csv", "status": "CLOSED"})
+        rows = list(csv.DictReader(io.StringIO(b"".join(resp.streaming_content).decode())))
+        self.assertEqual([int(r["id"]) for r in rows], [self.cases[0].pk, self.cases[2].pk, self.cases[4].pk])
+        self.assertEqual((rows[0]["evidence_count"], rows[0]["evidence_titles"]), ("2", "Crowbar;Glove"))
+        self.assertEqual((rows[0]["suspect_names"], rows[0]["verdict"]), ("Cole Phelps", "GUILTY"))
+
+        self.assertEqual(self.client.get("/api/cases/export/", {"fmt": "xml"}).status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            self.client.get("/api/cases/export/", {"created_after": "yesterday"}).status_code,
+            status.HTTP_400_BAD_REQUEST,
+        )
+
+    def test_export_requires_role(self):
+        self.client.force_authenticate(User.objects.create_user(username="cadet", email="cadet@test.com", password="x"))
+        self.assertEqual(self.client.get("/api/cases/export/").status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_queries_grow_per_chunk_not_per_case(self):
+        # One query for the cases, then evidence and suspects once per chunk of two.
+        with self.assertNumQueries(7):
+            lines = list(ndjson_lines(iter_cases(chunk_size=2)))
+        self.assertEqual(len(lines), 5)
+
+    def test_command_writes_file(self):
+        out = io.StringIO()
+        with tempfile.NamedTemporaryFile(suffix=".csv", mode="r", encoding="utf-8") as target:
+            call_command("export_cases", output=target.name, status="OPEN", stderr=out)
+            rows = list(csv.DictReader(target))
+        self.assertEqual([r["title"] for r in rows], ["Case 1", "Case 3"])
+        self.assertIn("Exported 2 cases", out.getvalue())
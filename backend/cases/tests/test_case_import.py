@@ -0,0 +1,124 @@
+import io
+import json
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from cases.importer import run_import
+from config.stats import get_dashboard_stats
+from cases.models import Case, CaseComplainant, CaseImportJob, Complaint, CrimeSceneReport
+from entities.models import EntityReference
+from metrics import counters
+from rbac.models import Role, UserRole
+from search.models import SearchDocument
+
+User = get_user_model()
+
+
+def ndjson(*records):
+    return io.StringIO("\n".join(r if isinstance(r, str) else json.dumps(r) for r in records) + "\n")
+
+
+class CaseImportTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.chief = User.objects.create_user(username="chief", email="chief@test.com", password="x")
+        UserRole.objects.create(user=cls.chief, role=Role.objects.create(name="Chief"))
+        cls.officer = User.objects.create_user(username="officer7", email="o7@test.com", password="x")
+        cls.citizen = User.objects.create_user(
+            username="citizen", email="citizen@test.com", phone="09120000000", password="x"
+        )
+
+    def test_import_writes_cases_with_related_rows_and_reports_bad_records(self):
+        job = CaseImportJob.objects.create(created_by=self.chief)
+        stream = ndjson(
+            {
+                "external_id": "LEG-1",
+                "title": "Bank robbery",
+                "crime_level": 3,
+                "status": "CLOSED",
+                "created_at": "2019-05-01T10:00:00Z",
+                "created_by": "OFFICER7",
+                "complaint": {"complainant": "09120000000", "details": "They took everything"},
+                "crime_scene": {"report": "Glass on floor", "witnessed_national_id": "0012345678"},
+            },
+            {"external_id": "LEG-2", "title": "", "crime_level": 9},
+            "not json",
+            {"external_id": "LEG-4", "title": "Ghost", "complainants": ["nobody@test.com"]},
+            {"title": "Pickpocket"},
+        )
+        run_import(job, stream, chunk_size=2)
+
+        job.refresh_from_db()
+        self.assertEqual((job.status, job.records_done, job.imported, job.rejected), ("COMPLETED", 5, 2, 3))
+        self.assertEqual([e["record"] for e in job.errors], [2, 3, 4])
+        self.assertEqual(set(job.errors[0]["errors"]), {"title", "crime_level"})
+        self.assertEqual(job.errors[2]["external_id"], "LEG-4")
+
+        robbery = Case.objects.get(title="Bank robbery")
+        self.assertEqual((robbery.created_by, robbery.crime_level, robbery.created_at.year), (self.officer, 3, 2019))
+        self.assertEqual(Case.objects.get(title="Pickpocket").created_by, self.chief)
+        self.assertEqual(Complaint.objects.get(case=robbery).complainant, self.citizen)
+        self.assertEqual(CrimeSceneReport.objects.get(case=robbery).reporter, self.officer)
+        self.assertTrue(CaseComplainant.objects.filter(case=robbery, user=self.citizen, status="APPROVED").exists())
+
+        # Side tables normally kept by signals were updated too.
+        self.assertTrue(EntityReference.objects.filter(value="0012345678", case=robbery).exists())
+        self.assertTrue(SearchDocument.objects.filter(kind=SearchDocument.KIND_CASE, object_id=robbery.pk).exists())
+        self.assertEqual(counters.mismatches(), {})
+
+    def test_resume_skips_records_before_the_checkpoint(self):
+        job = CaseImportJob.objects.create(created_by=self.chief, records_done=1, imported=1, status="FAILED")
+        run_import(job, ndjson({"title": "Already imported"}, {"title": "Second"}))
+        self.assertEqual(list(Case.objects.values_list("title", flat=True)), ["Second"])
+        self.assertEqual((job.records_done, job.imported, job.status), (2, 2, "COMPLETED"))
+
+    def test_out_of_range_dates_and_non_string_statuses_reject_only_their_record(self):
+        job = CaseImportJob.objects.create(created_by=self.chief)
+        run_import(
+            job,
+            ndjson(
+                {"title": "Bad date", "created_at": "2019-13-45T10:00:00"},
+                {"title": "Bad status", "status": ["OPEN"]},
+                {"title": "Fine"},
+            ),
+        )
+        self.assertEqual((job.status, job.imported, job.rejected), ("COMPLETED", 1, 2))
+        self.assertEqual([list(e["errors"]) for e in job.errors], [["created_at"], ["status"]])
+        self.assertEqual(list(Case.objects.values_list("title", flat=True)), ["Fine"])
+
+    def test_import_refreshes_the_cached_dashboard(self):
+        cache.clear()
+        self.assertEqual(get_dashboard_stats()["cases_total"], 0)
+        with self.captureOnCommitCallbacks(execute=True):
+            run_import(CaseImportJob.objects.create(created_by=self.chief), ndjson({"title": "Imported"}))
+        self.assertEqual(get_dashboard_stats()["cases_total"], 1)
+
+    def test_api_imports_uploaded_csv(self):
+        csv_body = (
+            "external_id,title,crime_level,complainants,scene_report,reporter\n"
+            "A1,Arson,4,citizen@test.com;officer7,Burnt car,officer7\n"
+            "A2,,1,,,\n"
+        )
+        self.client.force_authenticate(self.officer)
+        upload = SimpleUploadedFile("legacy.csv", csv_body.encode(), content_type="text/csv")
+        self.assertEqual(
+            self.client.post("/api/cases/import/", {"file": upload}).status_code, status.HTTP_403_FORBIDDEN
+        )
+
+        self.client.force_authenticate(self.chief)
+        upload = SimpleUploadedFile("legacy.csv", csv_body.encode(), content_type="text/csv")
+        resp = self.client.post("/api/cases/import/", {"file": upload})
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+        self.assertEqual((resp.data["fmt"], resp.data["imported"], resp.data["rejected"]), ("csv", 1, 1))
+        arson = Case.objects.get(title="Arson")
+        self.assertEqual(set(arson.complainant_links.values_list("user__username", flat=True)), {"citizen", "officer7"})
+
+        resp = self.client.post(
+            "/api/cases/import/", '{"title": "Raw body"}\n', content_type="application/x-ndjson"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+        self.assertEqual(self.client.get(f"/api/cases/imports/{resp.data['id']}/").data["imported"], 1)
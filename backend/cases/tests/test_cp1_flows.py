@@ -1,11 +1,20 @@
 from datetime import timedelta
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.test import APITestCase
 from rest_framework import status
 
 from rbac.models import Role, UserRole
-from cases.models import Case
+from cases.models import (
+    Case,
+    CaseNotification,
+    CrimeSceneReport,
+    DetectiveBoard,
+    DetectiveBoardItem,
+    Interrogation,
+    SolveRequest,
+)
 from suspects.models import Suspect
 from rewards.models import RewardTip
 
@@ -64,6 +73,113 @@ class CP1FlowTests(APITestCase):
         self.assertEqual(c.created_by_id, self.citizen.id)
         self.assertEqual(c.status, "OPEN")
 
+    def test_case_list_is_cursor_paginated(self):
+        ids = [self._create_case_as(self.citizen, f"Case {i}") for i in range(3)]
+
+        resp = self.client.get("/api/cases/?page_size=2")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual([c["id"] for c in resp.data["results"]], ids[:0:-1])
+        self.assertIsNotNone(resp.data["next"])
+
+        resp = self.client.get(resp.data["next"])
+        self.assertEqual([c["id"] for c in resp.data["results"]], ids[:1])
+        self.assertIsNone(resp.data["next"])
+
+    def test_dossier_fits_query_budget(self):
+        case_id = self._create_case_as(self.detective, "Case Dossier")
+        CrimeSceneReport.objects.create(case_id=case_id, reporter=self.officer, report="scene")
+        SolveRequest.objects.create(case_id=case_id, suspect_ids=[1], submitted_by=self.detective)
+        Interrogation.objects.create(case_id=case_id, suspect_id=1, detective_score=5)
+
+        self.client.force_authenticate(user=self.detective)
+        # role lookup + case with joined one-to-ones + solve requests + interrogations
+        with self.assertNumQueries(4):
+            resp = self.client.get(f"/api/cases/{case_id}/dossier/")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(resp.data["crime_scene"]["report"], "scene")
+        self.assertIsNone(resp.data["complaint"])
+        self.assertEqual(len(resp.data["interrogations"]), 1)
+
+        with self.assertNumQueries(2):
+            resp = self.client.get(f"/api/cases/{case_id}/dossier/?include=trial,crime_scene")
+        self.assertEqual(set(resp.data), {"case", "trial", "crime_scene"})
+
+    def test_detective_board_batch_applies_operations_in_bulk(self):
+        case_id = self._create_case_as(self.detective, "Case Board")
+        self.client.get(f"/api/cases/{case_id}/detective_board/")
+        board = DetectiveBoard.objects.get(case_id=case_id)
+        notes = DetectiveBoardItem.objects.bulk_create(
+            DetectiveBoardItem(board=board, title=f"n{i}", created_by=self.detective) for i in range(20)
+        )
+        url = f"/api/cases/{case_id}/detective_board/batch/"
+
+        moves = [{"op": "update", "type": "item", "id": n.id, "data": {"x": 5, "y": i}} for i, n in enumerate(notes)]
+        # roles, case, board, items, savepoint, one bulk UPDATE, board touch, release
+        with self.assertNumQueries(8):
+            resp = self.client.post(url, {"operations": moves}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(DetectiveBoardItem.objects.filter(board=board, x=5).count(), 20)
+
+        ops = [
+            {"op": "create", "type": "item", "temp_id": "new", "data": {"title": "lead"}},
+            {"op": "create", "type": "link", "data": {"source_id": "new", "target_id": notes[0].id}},
+            {"op": "delete", "type": "item", "id": notes[1].id},
+        ]
+        resp = self.client.post(url, {"operations": ops}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        new_id = resp.data["temp_ids"]["new"]
+        self.assertEqual(resp.data["created"]["links"][0]["source"], new_id)
+        self.assertEqual(resp.data["deleted"]["items"], [notes[1].id])
+
+        bad = [{"op": "update", "type": "item", "id": notes[1].id, "data": {"x": 1}}]
+        resp = self.client.post(url, {"operations": bad}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(self.client.post(url, [1], format="json").status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_detective_board_delta_since_revision(self):
+        case_id = self._create_case_as(self.detective, "Case Delta")
+        base = f"/api/cases/{case_id}/detective_board/"
+        a = self.client.post(f"{base}items/", {"title": "a"}, format="json").data
+        b = self.client.post(f"{base}items/", {"title": "b"}, format="json").data
+        self.client.post(f"{base}links/", {"source_id": a["id"], "target_id": b["id"]}, format="json")
+
+        with self.assertNumQueries(5):  # roles, case, board, items, links
+            full = self.client.get(base).data
+        self.assertEqual((len(full["items"]), len(full["links"])), (2, 1))
+        since = full["revision"]
+
+        self.client.patch(f"{base}items/{a['id']}/", {"x": 9}, format="json")
+        self.client.delete(f"{base}items/{b['id']}/")
+
+        delta = self.client.get(f"{base}?since={since}").data
+        self.assertEqual(delta["revision"], since + 2)
+        self.assertEqual([i["id"] for i in delta["items"]], [a["id"]])
+        self.assertEqual(delta["deleted"], {"items": [b["id"]], "links": [full["links"][0]["id"]]})
+        self.assertEqual(self.client.get(f"{base}?since={since + 5}").status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_notification_unread_count_and_bulk_mark_read(self):
+        case_id = self._create_case_as(self.citizen, "Case Notify")  # "Case created" notification
+        for i in range(2):
+            CaseNotification.objects.create(case_id=case_id, recipient=self.citizen, message=f"n{i}")
+
+        with self.assertNumQueries(1):
+            resp = self.client.get("/api/cases/notifications/unread_count/")
+        self.assertEqual(resp.data["unread_count"], 3)
+
+        first = CaseNotification.objects.filter(recipient=self.citizen).order_by("id").first()
+        resp = self.client.post("/api/cases/notifications/mark_read/", {"ids": [first.id]}, format="json")
+        self.assertEqual(resp.data["marked"], 1)
+        resp = self.client.post("/api/cases/notifications/mark_read/", [first.id], format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+        resp = self.client.get("/api/cases/notifications/?unread=1")
+        self.assertEqual(len(resp.data["results"]), 2)
+
+        resp = self.client.post("/api/cases/notifications/mark_all_read/", format="json")
+        self.assertEqual(resp.data["marked"], 2)
+        resp = self.client.get("/api/cases/notifications/unread_count/")
+        self.assertEqual(resp.data["unread_count"], 0)
+
     def test_complaint_create_and_three_strikes_invalidates_case(self):
         case_id = self._create_case_as(self.citizen, "Case Complaint")
         self.client.force_authenticate(user=self.citizen)
@@ -170,7 +286,7 @@ class CP1FlowTests(APITestCase):
         resp = self.client.get("/api/suspects/most-wanted/")
         self.assertEqual(resp.status_code, status.HTTP_200_OK)
 
-        data = resp.json()
+        data = resp.json()["results"]
         self.assertEqual(len(data), 2)
         self.assertEqual(data[0]["full_name"], "S2")
         self.assertEqual(data[0]["rank_score"], 10)
@@ -221,3 +337,20 @@ class CP1FlowTests(APITestCase):
         self.assertIn("cases_closed", resp.data)
         self.assertIn("most_wanted", resp.data)
         self.assertIn("tips_pending", resp.data)
+
+    def test_stats_snapshot_is_cached_until_a_write(self):
+        cache.clear()
+        self.client.force_authenticate(user=self.officer)
+        # counter lookup + most-wanted count
+        with self.assertNumQueries(2):
+            resp = self.client.get("/api/stats/")
+        self.assertEqual(resp.data["cases_total"], 0)
+
+        with self.assertNumQueries(0):
+            self.client.get("/api/stats/")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self._create_case_as(self.officer, "Case Stats Cache")
+        resp = self.client.get("/api/stats/")
+        self.assertEqual(resp.data["cases_total"], 1)
+        self.assertEqual(resp.data["cases_open"], 1)
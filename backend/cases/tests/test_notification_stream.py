@@ -0,0 +1,76 @@
+import asyncio
+from datetime import timedelta
+
+from asgiref.sync import async_to_sync
+from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from cases.hub import InProcessHub, Subscription
+from cases.models import Case, CaseNotification
+from rbac.tokens import RoleRefreshToken
+
+User = get_user_model()
+
+
+class InProcessHubTests(SimpleTestCase):
+    def test_publish_reaches_only_the_recipient(self):
+        hub = InProcessHub()
+
+        async def scenario():
+            mine, theirs = hub.subscribe(1), hub.subscribe(2)
+            hub.publish(1, {"id": 7})
+            received = await asyncio.wait_for(mine.queue.get(), timeout=1)
+            hub.unsubscribe(mine)
+            hub.unsubscribe(theirs)
+            return received, theirs.queue.empty()
+
+        received, other_empty = asyncio.run(scenario())
+        self.assertEqual(received, {"id": 7})
+        self.assertTrue(other_empty)
+        self.assertEqual(dict(hub._subscribers), {})
+
+    def test_stalled_subscriber_queue_stops_growing_after_overflow(self):
+        async def scenario():
+            sub = Subscription(1)
+            sub.max_pending = 2
+            for n in range(10):
+                sub.push({"id": n})
+            return [sub.queue.get_nowait() for _ in range(sub.queue.qsize())]
+
+        self.assertEqual(asyncio.run(scenario()), [{"id": 0}, {"id": 1}, None])
+
+
+class NotificationStreamTests(TestCase):
+    def test_backlog_resumes_after_last_event_id(self):
+        user = User.objects.create_user(username="u", email="u@test.com", password="x")
+        case = Case.objects.create(title="c", created_by=user)
+        seen, missed = (CaseNotification.objects.create(case=case, recipient=user, message=m) for m in ("a", "b"))
+        token = str(RoleRefreshToken.for_user(user).access_token)
+
+        resp = self.client.get(f"/api/cases/notifications/stream/?token={token}", HTTP_LAST_EVENT_ID=str(seen.id))
+        self.assertEqual(resp["Content-Type"], "text/event-stream")
+        body = resp.content.decode()
+        self.assertIn(f"id: {missed.id}\n", body)
+        self.assertNotIn(f"id: {seen.id}\n", body)
+
+        self.assertEqual(self.client.get("/api/cases/notifications/stream/").status_code, 401)
+
+    @override_settings(NOTIFICATION_STREAM_HEARTBEAT=60)
+    def test_live_feed_ends_when_the_token_expires(self):
+        user = User.objects.create_user(username="u", email="u@test.com", password="x")
+        token = RoleRefreshToken.for_user(user).access_token
+        token.set_exp(lifetime=timedelta(seconds=1))
+
+        async def scenario():
+            resp = await self.async_client.get(f"/api/cases/notifications/stream/?token={token}")
+            self.assertTrue(resp.is_async)
+
+            async def drain():
+                return [chunk async for chunk in resp.streaming_content]
+
+            return await asyncio.wait_for(drain(), timeout=5)
+
+        # The stream finishes on its own instead of idling until the client leaves.
+        body = b"".join(async_to_sync(scenario)()).decode()
+        self.assertTrue(body.startswith("retry: 3000\n\n"))
+        self.assertNotIn("event:", body)
@@ -1,13 +1,25 @@
+import codecs
+import logging
+
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Prefetch
+from django.http import StreamingHttpResponse
 from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from rest_framework import status, viewsets
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from django.db import transaction
 
-from rbac.models import UserRole
+from config.pagination import CreatedAtCursorPagination, paginated_response
+from metrics import counters
 from rbac.permissions import HasRole, user_has_role
 
+from .board_graph import get_board_graph
+from .boards import apply_board_operations, board_delta, bump_revision, delete_with_tombstones
+from .exporter import WRITERS, async_lines, export_queryset, iter_cases
+from .importer import run_import
 from .models import (
     Case,
     Complaint,
@@ -21,6 +33,7 @@ from .models import (
     Trial,
     CaseNotification,
     CaseComplainant,
+    CaseImportJob,
 )
 from .serializers import (
     CaseSerializer,
@@ -44,14 +57,48 @@ from .serializers import (
     TrialVerdictSerializer,
     TrialSerializer,
     CaseNotificationSerializer,
+    CaseImportJobSerializer,
+    board_link_payload,
 )
 
+logger = logging.getLogger(__name__)
+
+
+DOSSIER_SECTIONS = ("complaint", "crime_scene", "solve_request", "interrogations", "captain_decision", "trial")
+
 
 class CaseViewSet(viewsets.ModelViewSet):
     queryset = Case.objects.all().order_by("-id")
     serializer_class = CaseSerializer
     permission_classes = [IsAuthenticated]
 
+    def get_queryset(self):
+        qs = super().get_queryset()
+        if self.action == "dossier":
+            qs = self._dossier_queryset(qs, self._dossier_sections())
+        return qs
+
+    def _dossier_sections(self):
+        raw = self.request.query_params.get("include")
+        if not raw:
+            return set(DOSSIER_SECTIONS)
+        return {s.strip() for s in raw.split(",")} & set(DOSSIER_SECTIONS)
+
+    def _dossier_queryset(self, qs, sections):
+        # One-to-ones are joined into the case row; lists cost one query each.
+        one_to_one = [s for s in ("complaint", "crime_scene", "captain_decision", "trial") if s in sections]
+        if one_to_one:
+            qs = qs.select_related(*one_to_one)
+        if "solve_request" in sections:
+            qs = qs.prefetch_related(
+                Prefetch("solve_requests", queryset=SolveRequest.objects.order_by("-id"), to_attr="dossier_solve_requests")
+            )
+        if "interrogations" in sections:
+            qs = qs.prefetch_related(
+                Prefetch("interrogations", queryset=Interrogation.objects.order_by("suspect_id"), to_attr="dossier_interrogations")
+            )
+        return qs
+
     def perform_create(self, serializer):
         case = serializer.save(created_by=self.request.user, status="OPEN")
         CaseComplainant.objects.get_or_create(
@@ -101,13 +148,12 @@ class CaseViewSet(viewsets.ModelViewSet):
         serializer.is_valid(raise_exception=True)
         data = serializer.validated_data
 
-        if not any(
-            user_has_role(request.user, r)
-            for r in ["Officer", "Patrol", "Detective", "Sergeant", "Supervisor", "Captain", "Chief", "Admin"]
+        if not user_has_role(
+            request.user, "Officer", "Patrol", "Detective", "Sergeant", "Supervisor", "Captain", "Chief", "Admin"
         ):
             return Response({"detail": "Forbidden"}, status=status.HTTP_403_FORBIDDEN)
 
-        is_chief = user_has_role(request.user, "Chief") or user_has_role(request.user, "Admin") or getattr(request.user, "is_superuser", False)
+        is_chief = user_has_role(request.user, "Chief", "Admin")
 
         with transaction.atomic():
             case = Case.objects.create(
@@ -157,8 +203,7 @@ class CaseViewSet(viewsets.ModelViewSet):
 
         allowed = (
             case.created_by_id == request.user.id
-            or user_has_role(request.user, "Cadet")
-            or user_has_role(request.user, "Admin")
+            or user_has_role(request.user, "Cadet", "Admin")
             or case.complainant_links.filter(user=request.user, status=CaseComplainant.STATUS_APPROVED).exists()
         )
         if not allowed:
@@ -297,7 +342,7 @@ class CaseViewSet(viewsets.ModelViewSet):
             **ser.validated_data,
         )
 
-        is_chief = UserRole.objects.filter(user=request.user, role__name="Chief").exists() or getattr(request.user, "is_superuser", False)
+        is_chief = user_has_role(request.user, "Chief")
         if is_chief:
             report.is_approved = True
             report.approved_by = request.user
@@ -358,7 +403,20 @@ class CaseViewSet(viewsets.ModelViewSet):
     )
     def detective_board(self, request, pk=None):
         case = self.get_object()
-        board = self._get_or_create_board(case, request.user)
+
+        since = request.query_params.get("since")
+        if since is not None:
+            if not since.isdigit():
+                return Response({"detail": "since must be a board revision."}, status=status.HTTP_400_BAD_REQUEST)
+            board = self._get_or_create_board(case, request.user)
+            if int(since) > board.revision:
+                return Response({"detail": "since is ahead of the board revision."}, status=status.HTTP_400_BAD_REQUEST)
+            return Response(board_delta(board, int(since)), status=status.HTTP_200_OK)
+
+        board, _ = DetectiveBoard.objects.prefetch_related(
+            Prefetch("items", queryset=DetectiveBoardItem.objects.order_by("id")),
+            "links",
+        ).get_or_create(case=case, defaults={"created_by": request.user})
         return Response(DetectiveBoardSerializer(board, context={"request": request}).data, status=status.HTTP_200_OK)
 
     @action(
@@ -373,7 +431,8 @@ class CaseViewSet(viewsets.ModelViewSet):
 
         ser = DetectiveBoardItemSerializer(data=request.data)
         ser.is_valid(raise_exception=True)
-        item = ser.save(board=board, created_by=request.user)
+        with transaction.atomic():
+            item = ser.save(board=board, created_by=request.user, revision=bump_revision(board))
 
         return Response(DetectiveBoardItemSerializer(item, context={"request": request}).data, status=status.HTTP_201_CREATED)
 
@@ -394,16 +453,12 @@ class CaseViewSet(viewsets.ModelViewSet):
 
         ser = DetectiveBoardItemSerializer(item, data=request.data, partial=True)
         ser.is_valid(raise_exception=True)
-        item = ser.save()
+        with transaction.atomic():
+            item = ser.save(revision=bump_revision(board))
 
         return Response(DetectiveBoardItemSerializer(item, context={"request": request}).data, status=status.HTTP_200_OK)
 
-    @action(
-        detail=True,
-        methods=["delete"],
-        url_path=r"detective_board/items/(?P<item_id>\d+)",
-        permission_classes=[HasRole.with_roles("Detective", "Sergent", "Captain", "Supervisor", "Chief", "Admin")],
-    )
+    @detective_board_update_item.mapping.delete
     def detective_board_delete_item(self, request, pk=None, item_id=None):
         case = self.get_object()
         board = self._get_or_create_board(case, request.user)
@@ -413,7 +468,8 @@ class CaseViewSet(viewsets.ModelViewSet):
         except DetectiveBoardItem.DoesNotExist:
             return Response({"detail": "Item not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        item.delete()
+        with transaction.atomic():
+            delete_with_tombstones(board, bump_revision(board), item_ids=[item.id])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(
@@ -428,20 +484,10 @@ class CaseViewSet(viewsets.ModelViewSet):
 
         ser = DetectiveBoardLinkSerializer(data=request.data, context={"request": request, "board": board})
         ser.is_valid(raise_exception=True)
-        link = ser.save()
+        with transaction.atomic():
+            link = ser.save(revision=bump_revision(board))
 
-        return Response(
-            {
-                "id": link.id,
-                "source": link.source_id,
-                "target": link.target_id,
-                "label": link.label,
-                "meta": link.meta,
-                "created_by": link.created_by_id,
-                "created_at": link.created_at,
-            },
-            status=status.HTTP_201_CREATED,
-        )
+        return Response(board_link_payload(link), status=status.HTTP_201_CREATED)
 
     @action(
         detail=True,
@@ -458,9 +504,125 @@ class CaseViewSet(viewsets.ModelViewSet):
         except DetectiveBoardLink.DoesNotExist:
             return Response({"detail": "Link not found"}, status=status.HTTP_404_NOT_FOUND)
 
-        link.delete()
+        with transaction.atomic():
+            delete_with_tombstones(board, bump_revision(board), link_ids=[link.id])
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path=r"detective_board/batch",
+        permission_classes=[HasRole.with_roles("Detective", "Sergent", "Captain", "Supervisor", "Chief", "Admin")],
+    )
+    def detective_board_batch(self, request, pk=None):
+        case = self.get_object()
+        if not isinstance(request.data, dict):
+            return Response(
+                {"detail": "Body must be an object with an operations list."}, status=status.HTTP_400_BAD_REQUEST
+            )
+        board = self._get_or_create_board(case, request.user)
+
+        diff = apply_board_operations(board, request.user, request.data.get("operations"))
+        return Response(diff, status=status.HTTP_200_OK)
+
+    def _board_graph(self, request):
+        board = self._get_or_create_board(self.get_object(), request.user)
+        return board, get_board_graph(board)
+
+    @staticmethod
+    def _int_param(request, name, default=None):
+        raw = request.query_params.get(name)
+        if raw is None:
+            return default
+        return int(raw) if raw.isdigit() else None
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"detective_board/graph/components",
+        permission_classes=[HasRole.with_roles("Detective", "Sergent", "Captain", "Supervisor", "Chief", "Admin")],
+    )
+    def detective_board_graph_components(self, request, pk=None):
+        board, graph = self._board_graph(request)
+        components = graph.components()
+        return Response(
+            {
+                "revision": board.revision,
+                "count": len(components),
+                "components": [{"size": len(c), "items": c} for c in components],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"detective_board/graph/path",
+        permission_classes=[HasRole.with_roles("Detective", "Sergent", "Captain", "Supervisor", "Chief", "Admin")],
+    )
+    def detective_board_graph_path(self, request, pk=None):
+        source, target = self._int_param(request, "from"), self._int_param(request, "to")
+        if source is None or target is None:
+            return Response({"detail": "from and to must be item ids."}, status=status.HTTP_400_BAD_REQUEST)
+
+        board, graph = self._board_graph(request)
+        path = graph.shortest_path(source, target)
+        if path is None:
+            return Response({"detail": "No path between these items."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(
+            {"revision": board.revision, "length": len(path) - 1, "path": [graph.nodes[i] for i in path]},
+            status=status.HTTP_200_OK,
+        )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"detective_board/graph/centrality",
+        permission_classes=[HasRole.with_roles("Detective", "Sergent", "Captain", "Supervisor", "Chief", "Admin")],
+    )
+    def detective_board_graph_centrality(self, request, pk=None):
+        limit = self._int_param(request, "limit", 20)
+        if not limit:
+            return Response({"detail": "limit must be a positive integer."}, status=status.HTTP_400_BAD_REQUEST)
+
+        board, graph = self._board_graph(request)
+        ranked = graph.degree_centrality()[:limit]
+        return Response(
+            {
+                "revision": board.revision,
+                "items": [
+                    {"item": graph.nodes[item_id], "degree": degree, "centrality": round(score, 4)}
+                    for item_id, degree, score in ranked
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
+    @action(
+        detail=True,
+        methods=["get"],
+        url_path=r"detective_board/graph/suspects/(?P<suspect_id>\d+)",
+        permission_classes=[HasRole.with_roles("Detective", "Sergent", "Captain", "Supervisor", "Chief", "Admin")],
+    )
+    def detective_board_graph_suspect(self, request, pk=None, suspect_id=None):
+        depth = self._int_param(request, "depth", 1)
+        if not depth or depth > 5:
+            return Response({"detail": "depth must be between 1 and 5."}, status=status.HTTP_400_BAD_REQUEST)
+
+        board, graph = self._board_graph(request)
+        linked = graph.linked_to_suspect(int(suspect_id), depth=depth)
+        return Response(
+            {
+                "revision": board.revision,
+                "suspect_items": [graph.nodes[i] for i in graph.suspect_items(int(suspect_id))],
+                "items": [
+                    {"item": graph.nodes[item_id], "distance": distance}
+                    for item_id, distance in sorted(linked.items(), key=lambda kv: (kv[1], kv[0]))
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
+
     @action(
         detail=True,
         methods=["post"],
@@ -676,32 +838,71 @@ class CaseViewSet(viewsets.ModelViewSet):
         permission_classes=[HasRole.with_roles("Detective", "Sergent", "Captain", "Supervisor", "Chief", "Admin")],
     )
     def dossier(self, request, pk=None):
+        sections = self._dossier_sections()
         case = self.get_object()
 
-        solve_latest = case.solve_requests.order_by("-id").first()
-        interrogations = case.interrogations.order_by("suspect_id")
-        captain_decision = getattr(case, "captain_decision", None)
-        trial = getattr(case, "trial", None)
-
-        payload = {
-            "case": CaseSerializer(case, context={"request": request}).data,
-            "complaint": getattr(case, "complaint", None).details if hasattr(case, "complaint") else None,
-            "crime_scene": {
-                "exists": hasattr(case, "crime_scene"),
-                "is_approved": case.crime_scene.is_approved if hasattr(case, "crime_scene") else None,
-                "report": case.crime_scene.report if hasattr(case, "crime_scene") else None,
-            },
-            "solve_request": SolveRequestSerializer(solve_latest).data if solve_latest else None,
-            "interrogations": InterrogationSerializer(interrogations, many=True).data,
-            "captain_decision": CaptainDecisionSerializer(captain_decision).data if captain_decision else None,
-            "trial": TrialSerializer(trial).data if trial else None,
-        }
+        payload = {"case": CaseSerializer(case, context={"request": request}).data}
+
+        if "complaint" in sections:
+            payload["complaint"] = case.complaint.details if hasattr(case, "complaint") else None
+
+        if "crime_scene" in sections:
+            crime_scene = getattr(case, "crime_scene", None)
+            payload["crime_scene"] = {
+                "exists": crime_scene is not None,
+                "is_approved": crime_scene.is_approved if crime_scene else None,
+                "report": crime_scene.report if crime_scene else None,
+            }
+
+        if "solve_request" in sections:
+            solve_latest = case.dossier_solve_requests[0] if case.dossier_solve_requests else None
+            payload["solve_request"] = SolveRequestSerializer(solve_latest).data if solve_latest else None
+
+        if "interrogations" in sections:
+            payload["interrogations"] = InterrogationSerializer(case.dossier_interrogations, many=True).data
+
+        if "captain_decision" in sections:
+            captain_decision = getattr(case, "captain_decision", None)
+            payload["captain_decision"] = CaptainDecisionSerializer(captain_decision).data if captain_decision else None
+
+        if "trial" in sections:
+            trial = getattr(case, "trial", None)
+            payload["trial"] = TrialSerializer(trial).data if trial else None
+
         return Response(payload, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["get"], url_path="notifications", permission_classes=[IsAuthenticated])
     def notifications(self, request):
-        qs = CaseNotification.objects.filter(recipient=request.user).order_by("-created_at")
-        return Response(CaseNotificationSerializer(qs, many=True).data, status=status.HTTP_200_OK)
+        qs = CaseNotification.objects.filter(recipient=request.user)
+        if request.query_params.get("unread") in ("1", "true"):
+            qs = qs.filter(read_at__isnull=True)
+        return paginated_response(self, qs, CaseNotificationSerializer, CreatedAtCursorPagination)
+
+    @action(detail=False, methods=["get"], url_path="notifications/unread_count", permission_classes=[IsAuthenticated])
+    def notification_unread_count(self, request):
+        key = counters.unread_notifications_key(request.user.pk)
+        unread = max(counters.read([key])[key], 0)
+        return Response({"unread_count": unread}, status=status.HTTP_200_OK)
+
+    def _mark_notifications_read(self, qs):
+        marked = qs.filter(recipient=self.request.user, read_at__isnull=True).update(read_at=timezone.now())
+        if marked:
+            counters.bump({counters.unread_notifications_key(self.request.user.pk): -marked})
+        return marked
+
+    @action(detail=False, methods=["post"], url_path="notifications/mark_read", permission_classes=[IsAuthenticated])
+    def notifications_mark_read(self, request):
+        ids = request.data.get("ids") if isinstance(request.data, dict) else None
+        if not isinstance(ids, list) or not all(isinstance(i, int) for i in ids):
+            return Response({"detail": "ids must be a list of notification ids."}, status=status.HTTP_400_BAD_REQUEST)
+
+        marked = self._mark_notifications_read(CaseNotification.objects.filter(id__in=ids))
+        return Response({"marked": marked}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["post"], url_path="notifications/mark_all_read", permission_classes=[IsAuthenticated])
+    def notifications_mark_all_read(self, request):
+        marked = self._mark_notifications_read(CaseNotification.objects.all())
+        return Response({"marked": marked}, status=status.HTTP_200_OK)
 
     @action(detail=False, methods=["post"], url_path=r"notifications/(?P<notif_id>\d+)/mark_read", permission_classes=[IsAuthenticated])
     def notification_mark_read(self, request, notif_id=None):
@@ -711,7 +912,97 @@ class CaseViewSet(viewsets.ModelViewSet):
             return Response({"detail": "Notification not found."}, status=status.HTTP_404_NOT_FOUND)
 
         if n.read_at is None:
-            n.read_at = timezone.now()
-            n.save(update_fields=["read_at"])
+            self._mark_notifications_read(CaseNotification.objects.filter(id=n.id))
+            n.refresh_from_db(fields=["read_at"])
 
         return Response(CaseNotificationSerializer(n).data, status=status.HTTP_200_OK)
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="import",
+        permission_classes=[HasRole.with_roles("Chief", "Admin")],
+    )
+    def import_cases(self, request):
+        """Import legacy cases from an uploaded NDJSON or CSV ``file`` (or the raw body).
+
+        ``?fmt=csv|ndjson`` overrides detection; ``?resume=<job id>`` continues a
+        failed job with the same file from its checkpoint.
+        """
+        # Read the raw body without DRF parsing it, unless it is a form upload.
+        upload = request.FILES.get("file") if request.content_type.startswith("multipart/") else None
+        if upload is None and request.content_type.startswith("multipart/"):
+            return Response({"detail": "Upload the records as 'file'."}, status=status.HTTP_400_BAD_REQUEST)
+        name = upload.name if upload else ""
+        fmt = request.query_params.get("fmt") or (
+            "csv" if name.lower().endswith(".csv") or request.content_type == "text/csv" else "ndjson"
+        )
+        if fmt not in ("csv", "ndjson"):
+            return Response({"detail": "fmt must be csv or ndjson."}, status=status.HTTP_400_BAD_REQUEST)
+
+        resume = request.query_params.get("resume")
+        if resume:
+            job = CaseImportJob.objects.filter(pk=resume if resume.isdigit() else None, created_by=request.user).first()
+            if job is None:
+                return Response({"detail": "Import job not found."}, status=status.HTTP_404_NOT_FOUND)
+            if job.status == CaseImportJob.STATUS_COMPLETED:
+                return Response({"detail": "Import job already completed."}, status=status.HTTP_400_BAD_REQUEST)
+        else:
+            job = CaseImportJob.objects.create(source=name, fmt=fmt, created_by=request.user)
+
+        # Decoded line by line, so the body is never held in memory whole.
+        stream = codecs.iterdecode(upload if upload else request.stream or [], "utf-8-sig")
+        try:
+            run_import(job, stream)
+        except Exception:
+            logger.exception("Case import job %s failed", job.pk)
+            return Response(CaseImportJobSerializer(job).data, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+        return Response(CaseImportJobSerializer(job).data, status=status.HTTP_201_CREATED)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        permission_classes=[HasRole.with_roles("Captain", "Chief", "Admin")],
+    )
+    def export(self, request):
+        """Stream every case with its evidence, suspects, decision and trial.
+
+        ``?fmt=ndjson|csv`` (default ndjson); ``?status=``, ``?created_after=``
+        and ``?created_before=`` narrow the export.
+        """
+        fmt = request.query_params.get("fmt") or "ndjson"
+        if fmt not in WRITERS:
+            return Response({"detail": "fmt must be csv or ndjson."}, status=status.HTTP_400_BAD_REQUEST)
+        bounds = {}
+        for name in ("created_after", "created_before"):
+            raw = request.query_params.get(name)
+            if raw:
+                try:
+                    bound = parse_datetime(raw)
+                except ValueError:
+                    bound = None
+                if bound is None:
+                    return Response({"detail": f"{name} must be an ISO 8601 datetime."}, status=status.HTTP_400_BAD_REQUEST)
+                bounds[name] = bound if timezone.is_aware(bound) else timezone.make_aware(bound)
+
+        queryset = export_queryset(status=request.query_params.get("status"), **bounds)
+        write, content_type = WRITERS[fmt]
+        lines = write(iter_cases(queryset))
+        if isinstance(request._request, ASGIRequest):
+            lines = async_lines(lines)
+        response = StreamingHttpResponse(lines, content_type=content_type)
+        response["Content-Disposition"] = f'attachment; filename="cases.{fmt}"'
+        return response
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path=r"imports/(?P<job_id>\d+)",
+        permission_classes=[HasRole.with_roles("Chief", "Admin")],
+    )
+    def import_job(self, request, job_id=None):
+        job = CaseImportJob.objects.filter(pk=int(job_id)).first()
+        if job is None:
+            return Response({"detail": "Import job not found."}, status=status.HTTP_404_NOT_FOUND)
+        return Response(CaseImportJobSerializer(job).data, status=status.HTTP_200_OK)
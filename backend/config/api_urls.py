@@ -2,6 +2,7 @@ from django.urls import include, path
 from rest_framework.routers import DefaultRouter
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
 
+from cases.streams import notification_stream
 from cases.views import CaseViewSet
 from evidence.views import EvidenceViewSet
 from config.stats_api import StatsView  
@@ -11,6 +12,7 @@ router.register(r"cases", CaseViewSet, basename="cases")
 router.register(r"evidence", EvidenceViewSet, basename="evidence")
 
 urlpatterns = [
+    path("cases/notifications/stream/", notification_stream, name="case-notification-stream"),
     path("", include(router.urls)),
     path("stats/", StatsView.as_view(), name="stats"),
     path("token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
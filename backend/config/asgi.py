@@ -3,14 +3,38 @@ ASGI config for config project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+The Docker image and docker-compose serve the API through this entry point
+with uvicorn, which provides the live notification stream at
+``/api/cases/notifications/stream/``, the collaborative board socket at
+``/ws/cases/<case_id>/board/`` and the async login. ``manage.py runserver``
+(WSGI) still works, but there the stream only answers with the backlog and
+boards are edited over REST.
+
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
 """
 
 import os
 
+from django.conf import settings
+from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# Same routes, with logins served by an async view (see config/asgi_urls.py).
+os.environ.setdefault('DJANGO_ROOT_URLCONF', 'config.asgi_urls')
+
+django_application = get_asgi_application()
+if settings.DEBUG:
+    # Serve static files (admin assets) as runserver does in development.
+    django_application = ASGIStaticFilesHandler(django_application)
+
+# Imported once Django is set up.
+from cases.board_socket import websocket_application  # noqa: E402
+
 
-application = get_asgi_application()
+async def application(scope, receive, send):
+    if scope["type"] == "websocket":
+        await websocket_application(scope, receive, send)
+    else:
+        await django_application(scope, receive, send)
@@ -0,0 +1,17 @@
+"""URLconf used under ASGI (``config/asgi.py`` selects it).
+
+The same routes as ``config.urls``, except that logins are served by an async
+view, so password hashing does not tie up a worker thread. Under WSGI the
+plain sync login view is used and no event loop is involved.
+"""
+
+from django.urls import path
+
+from accounts.views import LoginView
+
+from .urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+    path("api/auth/login/", LoginView.as_asgi_view(), name="login"),
+    *sync_urlpatterns,
+]
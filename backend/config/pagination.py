@@ -0,0 +1,25 @@
+from django.conf import settings
+from rest_framework.pagination import CursorPagination
+
+
+class IdCursorPagination(CursorPagination):
+    """Keyset pagination over the primary key, newest first.
+
+    Page size defaults to ``REST_FRAMEWORK["PAGE_SIZE"]`` and can be lowered or
+    raised (up to ``API_MAX_PAGE_SIZE``) with ``?page_size=``.
+    """
+
+    ordering = "-id"
+    page_size_query_param = "page_size"
+    max_page_size = getattr(settings, "API_MAX_PAGE_SIZE", 200)
+
+
+class CreatedAtCursorPagination(IdCursorPagination):
+    ordering = ("-created_at", "-id")
+
+
+def paginated_response(view, queryset, serializer_class, pagination_class=None, **serializer_kwargs):
+    """Paginate ``queryset`` for a custom action or plain APIView."""
+    paginator = (pagination_class or view.pagination_class)()
+    page = paginator.paginate_queryset(queryset, view.request, view=view)
+    return paginator.get_paginated_response(serializer_class(page, many=True, **serializer_kwargs).data)
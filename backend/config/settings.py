@@ -54,6 +54,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     "rest_framework",
     "accounts",
     "rbac",
@@ -65,6 +66,9 @@ INSTALLED_APPS = [
     "rewards",
     "intake",
     "payments",
+    "metrics",
+    "entities",
+    "search",
 
 
 
@@ -75,10 +79,42 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "rbac.authentication.RoleClaimJWTAuthentication",
     ),
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "EXCEPTION_HANDLER": "config.exception_handler.exception_handler",
+    "DEFAULT_PAGINATION_CLASS": "config.pagination.IdCursorPagination",
+    "PAGE_SIZE": int(os.getenv("API_PAGE_SIZE", "50")),
+}
+
+API_MAX_PAGE_SIZE = int(os.getenv("API_MAX_PAGE_SIZE", "200"))
+
+# Seconds a dashboard stats snapshot is served before being recomputed.
+STATS_CACHE_TTL = int(os.getenv("STATS_CACHE_TTL", "30"))
+
+# Fan-out hub behind the notification event stream. Use
+# "cases.hub.PostgresNotifyHub" when running more than one ASGI worker.
+NOTIFICATION_HUB = os.getenv("NOTIFICATION_HUB", "cases.hub.InProcessHub")
+NOTIFICATION_STREAM_HEARTBEAT = int(os.getenv("NOTIFICATION_STREAM_HEARTBEAT", "15"))
+
+# Minimum trigram similarity (0-1) for a name to count as a suspect match.
+SUSPECT_MATCH_THRESHOLD = float(os.getenv("SUSPECT_MATCH_THRESHOLD", "0.45"))
+
+# Seconds a complaint claimed from an intake review queue stays with the reviewer.
+INTAKE_CLAIM_LEASE_SECONDS = int(os.getenv("INTAKE_CLAIM_LEASE_SECONDS", "900"))
+# Open complaints auto-assignment gives one reviewer at most (see intake.assignment).
+INTAKE_ASSIGN_MAX_OPEN = int(os.getenv("INTAKE_ASSIGN_MAX_OPEN", "25"))
+
+# Most evidence records accepted by one POST /api/evidence/bulk/.
+EVIDENCE_BULK_MAX_ITEMS = int(os.getenv("EVIDENCE_BULK_MAX_ITEMS", "500"))
+
+# Seconds between writes of coalesced item drags from live board sockets.
+BOARD_SOCKET_FLUSH_INTERVAL = float(os.getenv("BOARD_SOCKET_FLUSH_INTERVAL", "0.5"))
+
+SIMPLE_JWT = {
+    # Access tokens carry the user's role names + role version (see rbac.tokens).
+    "TOKEN_OBTAIN_SERIALIZER": "rbac.tokens.RoleTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "rbac.tokens.RoleTokenRefreshSerializer",
 }
 
 
@@ -108,11 +144,13 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    "rbac.middleware.role_cache_middleware",
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
-ROOT_URLCONF = 'config.urls'
+# config/asgi.py switches to config.asgi_urls (async login view).
+ROOT_URLCONF = os.getenv("DJANGO_ROOT_URLCONF", "config.urls")
 
 TEMPLATES = [
     {
@@ -162,6 +200,29 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# The first hasher hashes new passwords; any other listed hasher still verifies
+# old ones, which are re-hashed with the first on the next successful login.
+PASSWORD_HASHERS = [
+    "accounts.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+if os.getenv("PASSWORD_HASHER") in PASSWORD_HASHERS:
+    PASSWORD_HASHERS.remove(os.environ["PASSWORD_HASHER"])
+    PASSWORD_HASHERS.insert(0, os.environ["PASSWORD_HASHER"])
+PASSWORD_PBKDF2_ITERATIONS = int(os.getenv("PASSWORD_PBKDF2_ITERATIONS", "1000000"))
+
+# Threads that check login passwords for the async login path, and how many
+# checks may wait for one before logins are turned away with a 503.
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", "64"))
+
+# Seconds a failed identifier/password pair is refused without re-hashing.
+LOGIN_FAILURE_CACHE_TTL = int(os.getenv("LOGIN_FAILURE_CACHE_TTL", "300"))
+
+
 # Internationalization
 # https://docs.djangoproject.com/en/6.0/topics/i18n/
 
@@ -1,18 +1,56 @@
-from rest_framework.views import APIView
-from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated
+"""Dashboard statistics engine.
+
+Totals come from the ``metrics`` counter table, which is kept in step with
+the source tables on every write, so a snapshot is one primary-key lookup plus
+an indexed count of most-wanted suspects (that one depends on the clock and
+cannot be maintained incrementally). The snapshot is also cached for
+``STATS_CACHE_TTL`` seconds and dropped when a counted model is written
+(see ``metrics.signals``; bulk writers call ``invalidate_dashboard_stats``).
+"""
+
+from django.conf import settings
+from django.core.cache import cache
 
 from cases.models import Case
-from suspects.models import Suspect
+from metrics import counters
 from rewards.models import RewardTip
+from suspects.models import Suspect
+
+STATS_CACHE_KEY = "dashboard-stats"
+
+
+def compute_dashboard_stats() -> dict:
+    values = counters.read(counters.dashboard_keys())
+    cases_by_status = {
+        status: values[counters.case_status_key(status)]
+        for status, _ in Case.STATUS_CHOICES
+        if values[counters.case_status_key(status)]
+    }
+    tips_by_status = {
+        status: values[counters.tip_status_key(status)]
+        for status, _ in RewardTip.STATUS
+        if values[counters.tip_status_key(status)]
+    }
+    most_wanted = Suspect.objects.most_wanted().count()
+
+    return {
+        "cases_total": values[counters.CASES_TOTAL],
+        "cases_by_status": cases_by_status,
+        "cases_open": cases_by_status.get("OPEN", 0),
+        "cases_closed": cases_by_status.get("CLOSED", 0),
+        "evidence_total": values[counters.EVIDENCE_TOTAL],
+        "suspects_total": values[counters.SUSPECTS_TOTAL],
+        "most_wanted_total": most_wanted,
+        "most_wanted": most_wanted,
+        "tips_total": values[counters.TIPS_TOTAL],
+        "tips_by_status": tips_by_status,
+        "tips_pending": tips_by_status.get(RewardTip.STATUS_SUBMITTED, 0),
+    }
+
+
+def get_dashboard_stats() -> dict:
+    return cache.get_or_set(STATS_CACHE_KEY, compute_dashboard_stats, timeout=settings.STATS_CACHE_TTL)
 
-class StatsView(APIView):
-    permission_classes = [IsAuthenticated]
 
-    def get(self, request):
-        return Response({
-            "cases_open": Case.objects.filter(status="OPEN").count(),
-            "cases_closed": Case.objects.filter(status="CLOSED").count(),
-            "most_wanted": sum(1 for s in Suspect.objects.all() if s.is_most_wanted),
-            "tips_pending": RewardTip.objects.filter(status="SUBMITTED").count(),
-        })
+def invalidate_dashboard_stats() -> None:
+    cache.delete(STATS_CACHE_KEY)
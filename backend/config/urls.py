@@ -13,5 +13,7 @@ urlpatterns = [
     path("api/", include("config.api_urls")),
     path("api/suspects/", include("suspects.urls")),
     path("api/rewards/", include("rewards.urls")),
+    path("api/entities/", include("entities.urls")),
+    path("api/search/", include("search.urls")),
     path("payments/", include("payments.urls")),
 ]
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import EntityReference
+
+
+@admin.register(EntityReference)
+class EntityReferenceAdmin(admin.ModelAdmin):
+    list_display = ("kind", "value", "case", "source_model", "source_id", "source_field")
+    list_filter = ("kind", "source_model")
+    search_fields = ("value",)
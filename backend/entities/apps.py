@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class EntitiesConfig(AppConfig):
+    default_auto_field = "django.db.models.BigAutoField"
+    name = "entities"
+
+    def ready(self):
+        from entities import signals  # noqa: F401
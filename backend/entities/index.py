@@ -0,0 +1,130 @@
+"""Normalization and maintenance of the cross-case entity index.
+
+``SOURCES`` lists which fields of which models feed the index. The
+models are named by label so the same code can run against the historical
+models inside a migration.
+"""
+
+import re
+
+from django.apps import apps as global_apps
+from django.db import transaction
+
+from .models import EntityReference
+
+# Persian and Arabic-Indic digits are common in typed identifiers.
+_DIGITS = str.maketrans("۰۱۲۳۴۵۶۷۸۹٠١٢٣٤٥٦٧٨٩", "01234567890123456789")
+_NON_DIGITS = re.compile(r"\D+")
+_SEPARATORS = re.compile(r"[\W_]+")
+
+
+def _digits(value: str) -> str:
+    return _NON_DIGITS.sub("", value.translate(_DIGITS))
+
+
+def normalize_phone(value: str) -> str:
+    """Reduce a phone number to its national form: ``+98 912-345 6789`` -> ``09123456789``."""
+    digits = _digits(value)
+    if digits.startswith("0098"):
+        digits = "0" + digits[4:]
+    elif digits.startswith("98") and len(digits) == 12:
+        digits = "0" + digits[2:]
+    elif len(digits) == 10 and digits.startswith("9"):
+        digits = "0" + digits
+    return digits
+
+
+def normalize_code(value: str) -> str:
+    """Plates and serials: drop separators and fold case, keeping letters of any script."""
+    return _SEPARATORS.sub("", value.translate(_DIGITS)).upper()
+
+
+NORMALIZERS = {
+    EntityReference.KIND_NATIONAL_ID: _digits,
+    EntityReference.KIND_PHONE: normalize_phone,
+    EntityReference.KIND_PLATE: normalize_code,
+    EntityReference.KIND_SERIAL: normalize_code,
+}
+
+
+def normalize(kind: str, value) -> str:
+    return NORMALIZERS[kind](str(value or "").strip())[:64]
+
+
+# model label -> ({field: kind}, name of the case foreign key or None)
+SOURCES = {
+    "suspects.suspect": (
+        {"national_id": EntityReference.KIND_NATIONAL_ID, "phone": EntityReference.KIND_PHONE},
+        "case_id",
+    ),
+    "evidence.evidence": (
+        {"plate_number": EntityReference.KIND_PLATE, "serial_number": EntityReference.KIND_SERIAL},
+        "case_id",
+    ),
+    "cases.crimescenereport": (
+        {"witnessed_national_id": EntityReference.KIND_NATIONAL_ID, "witnessed_phone": EntityReference.KIND_PHONE},
+        "case_id",
+    ),
+    "rewards.rewardtip": (
+        {"citizen_national_id": EntityReference.KIND_NATIONAL_ID, "citizen_phone": EntityReference.KIND_PHONE},
+        None,
+    ),
+}
+
+
+def references_for(label: str, row, model=EntityReference) -> list:
+    """Build (unsaved) references for one source row, given as an instance or a values() dict."""
+    fields, case_attr = SOURCES[label]
+    get = row.get if isinstance(row, dict) else lambda name: getattr(row, name)
+    case_id = get(case_attr) if case_attr else None
+    references = []
+    for field, kind in fields.items():
+        value = normalize(kind, get(field))
+        if value:
+            references.append(
+                model(kind=kind, value=value, case_id=case_id, source_model=label, source_id=get("id"), source_field=field)
+            )
+    return references
+
+
+def is_indexed_change(label: str, update_fields) -> bool:
+    if update_fields is None:
+        return True
+    fields, case_attr = SOURCES[label]
+    watched = set(fields) | ({case_attr.removesuffix("_id")} if case_attr else set())
+    return not watched.isdisjoint(update_fields)
+
+
+def index_instance(instance) -> None:
+    label = instance._meta.label_lower
+    with transaction.atomic():
+        EntityReference.objects.filter(source_model=label, source_id=instance.pk).delete()
+        EntityReference.objects.bulk_create(references_for(label, instance))
+
+
+def index_rows(label: str, rows) -> None:
+    """Index rows written in bulk (``bulk_create`` skips the save signals)."""
+    EntityReference.objects.bulk_create([ref for row in rows for ref in references_for(label, row)])
+
+
+def unindex_instance(instance) -> None:
+    EntityReference.objects.filter(source_model=instance._meta.label_lower, source_id=instance.pk).delete()
+
+
+def rebuild(apps=global_apps, batch_size=2000) -> int:
+    """Re-derive the whole index from the source tables; returns the row count."""
+    reference_model = apps.get_model("entities", "EntityReference")
+    total = 0
+    with transaction.atomic():
+        reference_model.objects.all().delete()
+        for label, (fields, case_attr) in SOURCES.items():
+            columns = ["id", *fields, *([case_attr] if case_attr else [])]
+            batch = []
+            for row in apps.get_model(label).objects.values(*columns).iterator(chunk_size=batch_size):
+                batch.extend(references_for(label, row, model=reference_model))
+                if len(batch) >= batch_size:
+                    reference_model.objects.bulk_create(batch)
+                    total, batch = total + len(batch), []
+            reference_model.objects.bulk_create(batch)
+            total += len(batch)
+    return total
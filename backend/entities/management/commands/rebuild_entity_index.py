@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from entities import index
+
+
+class Command(BaseCommand):
+    help = "Rebuild the cross-case entity index from the source tables."
+
+    def handle(self, *args, **options):
+        total = index.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} entity references."))
@@ -0,0 +1,32 @@
+# Generated by Django 5.2.11 on 2026-10-18 01:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('cases', '0008_board_revisions'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EntityReference',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('national_id', 'National ID'), ('phone', 'Phone'), ('plate', 'Plate number'), ('serial', 'Serial number')], max_length=20)),
+                ('value', models.CharField(max_length=64)),
+                ('source_model', models.CharField(max_length=50)),
+                ('source_id', models.PositiveBigIntegerField()),
+                ('source_field', models.CharField(max_length=50)),
+                ('case', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='entity_references', to='cases.case')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', 'value'], name='entityref_kind_value_idx')],
+                'constraints': [models.UniqueConstraint(fields=('source_model', 'source_id', 'source_field'), name='entityref_source_uniq')],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+from django.db import migrations
+
+
+def backfill(apps, schema_editor):
+    from entities.index import rebuild
+
+    rebuild(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("entities", "0001_initial"),
+        ("cases", "0008_board_revisions"),
+        ("evidence", "0007_alter_evidence_image_urls"),
+        ("rewards", "0002_rename_info_rewardtip_message_and_more"),
+        ("suspects", "0003_suspect_rank_score"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,44 @@
+from django.db import models
+
+from cases.models import Case
+
+
+class EntityReference(models.Model):
+    """One normalized identifier (national ID, phone, plate, ...) seen in one source row.
+
+    Rows are written by ``entities.index`` whenever a source model is saved,
+    so finding every case that mentions an identifier is one lookup on
+    ``(kind, value)`` instead of a scan of each app's tables.
+    """
+
+    KIND_NATIONAL_ID = "national_id"
+    KIND_PHONE = "phone"
+    KIND_PLATE = "plate"
+    KIND_SERIAL = "serial"
+
+    KIND_CHOICES = [
+        (KIND_NATIONAL_ID, "National ID"),
+        (KIND_PHONE, "Phone"),
+        (KIND_PLATE, "Plate number"),
+        (KIND_SERIAL, "Serial number"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    value = models.CharField(max_length=64)
+    case = models.ForeignKey(Case, on_delete=models.CASCADE, null=True, blank=True, related_name="entity_references")
+
+    # Where the value was seen, e.g. ("suspects.suspect", 12, "national_id").
+    source_model = models.CharField(max_length=50)
+    source_id = models.PositiveBigIntegerField()
+    source_field = models.CharField(max_length=50)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["kind", "value"], name="entityref_kind_value_idx"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["source_model", "source_id", "source_field"], name="entityref_source_uniq"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind}:{self.value}"
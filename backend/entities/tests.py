@@ -0,0 +1,46 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from cases.models import Case, CrimeSceneReport
+from entities.index import normalize_code, normalize_phone
+from entities.models import EntityReference
+from evidence.models import Evidence
+from rbac.models import Role, UserRole
+from suspects.models import Suspect
+
+User = get_user_model()
+
+
+class EntityIndexTests(APITestCase):
+    def test_normalizers(self):
+        self.assertEqual(normalize_phone("+98 912-345 6789"), "09123456789")
+        self.assertEqual(normalize_phone("۰۹۱۲۳۴۵۶۷۸۹"), "09123456789")
+        self.assertEqual(normalize_code("12 ب 345-67"), "12ب34567")
+
+    def test_lookup_finds_every_case_touching_an_identifier(self):
+        officer = User.objects.create_user(username="o", email="o@test.com", password="x")
+        UserRole.objects.create(user=officer, role=Role.objects.create(name="Officer"))
+        first = Case.objects.create(title="first", created_by=officer)
+        second = Case.objects.create(title="second", created_by=officer)
+        suspect = Suspect.objects.create(case=first, full_name="S", national_id="001-234 5678")
+        CrimeSceneReport.objects.create(case=second, reporter=officer, report="r", witnessed_national_id="0012345678")
+        Evidence.objects.create(case=second, title="car", created_by=officer, plate_number="12 AB 345")
+
+        self.client.force_authenticate(user=officer)
+        with self.assertNumQueries(2):  # roles + one indexed lookup
+            resp = self.client.get("/api/entities/lookup/?value=0012345678&kind=national_id")
+        self.assertEqual([c["id"] for c in resp.data["cases"]], [first.id, second.id])
+
+        resp = self.client.get("/api/entities/lookup/?value=12-ab-345")
+        self.assertEqual([c["id"] for c in resp.data["cases"]], [second.id])
+
+        suspect.national_id = ""
+        suspect.save(update_fields=["national_id"])
+        self.assertFalse(EntityReference.objects.filter(source_model="suspects.suspect").exists())
+
+        EntityReference.objects.all().delete()
+        call_command("rebuild_entity_index", stdout=StringIO())
+        self.assertEqual(EntityReference.objects.count(), 2)
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from .views import EntityLookup
+
+urlpatterns = [
+    path("lookup/", EntityLookup.as_view(), name="entity_lookup"),
+]
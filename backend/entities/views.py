@@ -0,0 +1,68 @@
+from django.db.models import Q
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from rbac.permissions import HasRole
+
+from .index import NORMALIZERS, normalize
+from .models import EntityReference
+
+MAX_REFERENCES = 500
+
+
+class EntityLookup(APIView):
+    """Every case (and case-less record) that mentions an identifier.
+
+    ``GET /api/entities/lookup/?value=<identifier>[&kind=national_id|phone|plate|serial]``.
+    Without ``kind`` the value is tried as every kind.
+    """
+
+    permission_classes = [
+        HasRole.with_roles("Officer", "Patrol", "Detective", "Sergeant", "Supervisor", "Captain", "Chief", "Admin")
+    ]
+
+    def get(self, request):
+        raw = (request.query_params.get("value") or "").strip()
+        kind = request.query_params.get("kind")
+        if not raw:
+            return Response({"detail": "value is required"}, status=status.HTTP_400_BAD_REQUEST)
+        if kind is not None and kind not in NORMALIZERS:
+            return Response({"detail": f"kind must be one of {sorted(NORMALIZERS)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        wanted = {k: normalize(k, raw) for k in ([kind] if kind else NORMALIZERS)}
+        query = Q()
+        for k, value in wanted.items():
+            if value:
+                query |= Q(kind=k, value=value)
+        if not query:
+            return Response({"detail": "value has no searchable characters"}, status=status.HTTP_400_BAD_REQUEST)
+
+        refs = list(
+            EntityReference.objects.filter(query)
+            .select_related("case")
+            .order_by("case_id", "source_model", "source_id")[:MAX_REFERENCES]
+        )
+        cases = {}
+        for ref in refs:
+            if ref.case is not None and ref.case_id not in cases:
+                cases[ref.case_id] = {"id": ref.case.id, "title": ref.case.title, "status": ref.case.status}
+
+        return Response(
+            {
+                "query": {k: v for k, v in wanted.items() if v},
+                "cases": list(cases.values()),
+                "references": [
+                    {
+                        "kind": ref.kind,
+                        "value": ref.value,
+                        "case_id": ref.case_id,
+                        "source_model": ref.source_model,
+                        "source_id": ref.source_id,
+                        "source_field": ref.source_field,
+                    }
+                    for ref in refs
+                ],
+            },
+            status=status.HTTP_200_OK,
+        )
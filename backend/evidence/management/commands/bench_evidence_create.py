@@ -0,0 +1,56 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+
+from cases.models import Case
+from evidence.models import Evidence
+from evidence.serializers import EvidenceSerializer
+
+RECORDS = (
+    {"title": "Shell casing", "description": "9mm, found by the door"},
+    {"title": "Getaway car", "evidence_type": Evidence.TYPE_VEHICLE, "plate_number": "12 B 345 67"},
+    {"title": "X-ray", "evidence_type": Evidence.TYPE_MEDICAL, "image_url": "https://img.example.test/1.png"},
+    {"title": "Neighbour", "evidence_type": Evidence.TYPE_WITNESS, "transcription": "Heard two shots."},
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure evidence creation through EvidenceSerializer, with and without the model's "
+        "full_clean() on save. Rows are written inside a transaction that is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type=int, default=2000, help="Records created per mode.")
+
+    def handle(self, *args, count, **options):
+        with transaction.atomic():
+            user = get_user_model().objects.create_user(username="bench-evidence", password=None)
+            case = Case.objects.create(title="Evidence benchmark", created_by=user)
+            payloads = [{**RECORDS[n % len(RECORDS)], "case": case.pk} for n in range(count)]
+
+            for label, full_clean in (("save + full_clean", True), ("validated save", False)):
+                queries = [0]
+
+                def count_query(execute, sql, params, many, context):
+                    queries[0] += 1
+                    return execute(sql, params, many, context)
+
+                with connection.execute_wrapper(count_query):
+                    started = time.perf_counter()
+                    for payload in payloads:
+                        serializer = EvidenceSerializer(data=payload)
+                        serializer.is_valid(raise_exception=True)
+                        if full_clean:
+                            # What every API create did before the serializer skipped the model checks.
+                            Evidence(**serializer.validated_data, created_by=user).save()
+                        else:
+                            serializer.save(created_by=user)
+                    elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    f"{label:>18}: {count / elapsed:8.0f} creates/s  "
+                    f"{queries[0] / count:.1f} queries/create"
+                )
+            transaction.set_rollback(True)
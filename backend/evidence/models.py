@@ -5,13 +5,15 @@ from django.utils import timezone
 
 from cases.models import Case
 
+from . import validation
+
 
 class Evidence(models.Model):
-    TYPE_GENERIC = "GENERIC"
-    TYPE_MEDICAL = "MEDICAL"
-    TYPE_VEHICLE = "VEHICLE"
-    TYPE_ID_DOC = "ID_DOC"
-    TYPE_WITNESS = "WITNESS"
+    TYPE_GENERIC = validation.TYPE_GENERIC
+    TYPE_MEDICAL = validation.TYPE_MEDICAL
+    TYPE_VEHICLE = validation.TYPE_VEHICLE
+    TYPE_ID_DOC = validation.TYPE_ID_DOC
+    TYPE_WITNESS = validation.TYPE_WITNESS
 
     TYPE_CHOICES = [
         (TYPE_GENERIC, "Generic"),
@@ -46,37 +48,15 @@ class Evidence(models.Model):
     media_urls = models.JSONField(blank=True, default=list)
 
     def clean(self):
-        if self.evidence_type == self.TYPE_VEHICLE:
-            has_plate = bool((self.plate_number or "").strip())
-            has_serial = bool((self.serial_number or "").strip())
-            if has_plate and has_serial:
-                raise ValidationError("Vehicle evidence cannot have both plate_number and serial_number.")
-            if not has_plate and not has_serial:
-                raise ValidationError("Vehicle evidence must have either plate_number or serial_number.")
-
-        if self.evidence_type == self.TYPE_MEDICAL:
-            urls = self.image_urls if self.image_urls is not None else []
-            if not isinstance(urls, list):
-                raise ValidationError("image_urls must be a list of URLs.")
-            has_single = bool((self.image_url or "").strip())
-            has_list = any(isinstance(u, str) and u.strip() for u in urls)
-            if not has_single and not has_list:
-                raise ValidationError("Medical evidence must include at least one image URL.")
-
-        if self.evidence_type == self.TYPE_ID_DOC:
-            if self.id_fields is None:
-                self.id_fields = {}
-            if not isinstance(self.id_fields, dict):
-                raise ValidationError("id_fields must be an object/dict.")
-
-        if self.evidence_type == self.TYPE_WITNESS:
-            if not isinstance(self.media_urls, list):
-                raise ValidationError("media_urls must be a list of URLs.")
-            has_text = bool((self.transcription or "").strip())
-            has_media = any(isinstance(u, str) and u.strip() for u in (self.media_urls or []))
-            if not has_text and not has_media:
-                raise ValidationError("Witness evidence must include transcription or at least one media URL.")
-
-    def save(self, *args, **kwargs):
-        self.full_clean()
+        if self.evidence_type == self.TYPE_ID_DOC and self.id_fields is None:
+            self.id_fields = {}
+        errors = validation.evidence_errors({name: getattr(self, name) for name in validation.RULE_FIELDS})
+        if errors:
+            raise ValidationError(list(errors.values()))
+
+    def save(self, *args, full_clean=True, **kwargs):
+        # Callers that already validated the values (EvidenceSerializer) pass
+        # full_clean=False to skip repeating the rules and the foreign key lookups.
+        if full_clean:
+            self.full_clean()
         return super().save(*args, **kwargs)
@@ -1,5 +1,36 @@
+from django.db import transaction
+from django.utils import timezone
 from rest_framework import serializers
+
+from cases.models import Case, CaseNotification
+from cases.signals import publish_notifications
+from config.stats import invalidate_dashboard_stats
+from entities import index as entity_index
+from metrics import counters
+from search import documents as search_documents
+
 from .models import Evidence
+from .validation import RULE_FIELDS, evidence_errors
+
+
+def _fill_medical_images(data, instance=None):
+    """Keep ``image_url`` and ``image_urls`` of medical evidence in step.
+
+    Fields missing from ``data`` fall back to ``instance``'s current values.
+    """
+
+    def current(name):
+        return data[name] if name in data else getattr(instance, name, None)
+
+    if current("evidence_type") == Evidence.TYPE_MEDICAL:
+        urls = current("image_urls") or []
+        single = (current("image_url") or "").strip()
+        if (not urls) and single:
+            data["image_urls"] = [single]
+        if (not single) and urls:
+            first = next((u for u in urls if isinstance(u, str) and u.strip()), "")
+            data["image_url"] = first or ""
+    return data
 
 
 class EvidenceSerializer(serializers.ModelSerializer):
@@ -9,91 +40,115 @@ class EvidenceSerializer(serializers.ModelSerializer):
         read_only_fields = ("id", "created_at", "created_by")
 
     def validate(self, attrs):
-        evidence_type = attrs.get("evidence_type", getattr(self.instance, "evidence_type", None))
-
-        if evidence_type == Evidence.TYPE_VEHICLE:
-            plate = (
-                attrs.get("plate_number")
-                if "plate_number" in attrs
-                else getattr(self.instance, "plate_number", "")
-            ).strip()
-            serial = (
-                attrs.get("serial_number")
-                if "serial_number" in attrs
-                else getattr(self.instance, "serial_number", "")
-            ).strip()
-            if plate and serial:
-                raise serializers.ValidationError(
-                    {"vehicle": "Vehicle evidence cannot have both plate_number and serial_number."}
-                )
-            if not plate and not serial:
-                raise serializers.ValidationError(
-                    {"vehicle": "Vehicle evidence must have either plate_number or serial_number."}
-                )
+        values = {
+            name: attrs[name] if name in attrs else getattr(self.instance, name, None) for name in RULE_FIELDS
+        }
+        errors = evidence_errors(values)
+        if errors:
+            raise serializers.ValidationError(errors)
+        return attrs
 
-        if evidence_type == Evidence.TYPE_MEDICAL:
-            single = (
-                attrs.get("image_url") if "image_url" in attrs else getattr(self.instance, "image_url", "")
-            ).strip()
-            urls = attrs.get("image_urls") if "image_urls" in attrs else getattr(self.instance, "image_urls", [])
-            if urls is None:
-                urls = []
-            if not isinstance(urls, list):
-                raise serializers.ValidationError({"image_urls": "image_urls must be a list of URLs."})
-
-            has_single = bool(single)
-            has_list = any(isinstance(u, str) and u.strip() for u in urls)
-            if not has_single and not has_list:
-                raise serializers.ValidationError({"medical": "Medical evidence must include at least one image URL."})
-
-        if evidence_type == Evidence.TYPE_ID_DOC:
-            id_fields = attrs.get("id_fields") if "id_fields" in attrs else getattr(self.instance, "id_fields", {})
-            if id_fields is None:
-                id_fields = {}
-            if not isinstance(id_fields, dict):
-                raise serializers.ValidationError({"id_fields": "id_fields must be an object/dict."})
-
-        if evidence_type == Evidence.TYPE_WITNESS:
-            transcription = (
-                attrs.get("transcription")
-                if "transcription" in attrs
-                else getattr(self.instance, "transcription", "")
-            )
-            media_urls = (
-                attrs.get("media_urls") if "media_urls" in attrs else getattr(self.instance, "media_urls", [])
+    def create(self, validated_data):
+        evidence = Evidence(**_fill_medical_images(validated_data))
+        # validate() and the field validators already cover everything
+        # Evidence.full_clean() checks, so skip it.
+        evidence.save(full_clean=False)
+        return evidence
+
+    def update(self, instance, validated_data):
+        for name, value in _fill_medical_images(validated_data, instance).items():
+            setattr(instance, name, value)
+        # Already validated, as in create().
+        instance.save(full_clean=False)
+        return instance
+
+
+class PreloadedCaseField(serializers.PrimaryKeyRelatedField):
+    """Resolves case ids from ``cases`` (id -> case) when the caller has loaded them in one query."""
+
+    cases = None
+
+    def to_internal_value(self, data):
+        if self.cases is None:
+            return super().to_internal_value(data)
+        if isinstance(data, bool):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        try:
+            case = self.cases.get(int(data))
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+        if case is None:
+            self.fail("does_not_exist", pk_value=data)
+        return case
+
+
+class EvidenceListSerializer(serializers.ListSerializer):
+    """Validates a batch of evidence and writes it with one insert per table.
+
+    ``bulk_create`` skips the save signals, so the evidence counter, the
+    dashboard cache, the entity and search indexes and the notification
+    streams are updated here. Each detective board owner gets one
+    notification per case for the whole batch instead of one per item.
+    """
+
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            # Other values (lists, objects, bools) are left for the field to reject per item.
+            ids = {
+                pk
+                for pk in (item.get("case") for item in data if isinstance(item, dict))
+                if (isinstance(pk, int) and not isinstance(pk, bool)) or (isinstance(pk, str) and pk.isdigit())
+            }
+            self.child.fields["case"].cases = Case.objects.select_related("detective_board").in_bulk(ids)
+        return super().to_internal_value(data)
+
+    def create(self, validated_data):
+        with transaction.atomic():
+            evidence = Evidence.objects.bulk_create(
+                [Evidence(**_fill_medical_images(item)) for item in validated_data]
             )
-            if media_urls is None:
-                media_urls = []
-            if not isinstance(media_urls, list):
-                raise serializers.ValidationError({"media_urls": "media_urls must be a list of URLs."})
-
-            has_text = bool((transcription or "").strip())
-            has_media = any(isinstance(u, str) and u.strip() for u in media_urls)
-            if not has_text and not has_media:
-                raise serializers.ValidationError(
-                    {"witness": "Witness evidence must include transcription or at least one media URL."}
+            entity_index.index_rows("evidence.evidence", evidence)
+            search_documents.index_rows("evidence.evidence", evidence)
+
+            by_case = {}
+            for item in evidence:
+                by_case.setdefault(item.case_id, []).append(item)
+            notifications = []
+            for items in by_case.values():
+                board = getattr(items[0].case, "detective_board", None)
+                if board is None or not board.created_by_id:
+                    continue
+                case_id = items[0].case_id
+                if len(items) == 1:
+                    message = f"New evidence added to case #{case_id}: {items[0].title}"
+                else:
+                    message = f"{len(items)} new evidence items added to case #{case_id}: " + ", ".join(
+                        item.title for item in items
+                    )
+                notifications.append(
+                    CaseNotification(
+                        case_id=case_id,
+                        recipient_id=board.created_by_id,
+                        notif_type="EVIDENCE_ADDED",
+                        message=message,
+                        ref_model="Evidence",
+                        ref_id=items[0].id,
+                        created_at=timezone.now(),
+                    )
                 )
+            CaseNotification.objects.bulk_create(notifications)
+            deltas = {counters.EVIDENCE_TOTAL: len(evidence)}
+            for notification in notifications:
+                key = counters.unread_notifications_key(notification.recipient_id)
+                deltas[key] = deltas.get(key, 0) + 1
+            counters.bump(deltas)
+            transaction.on_commit(invalidate_dashboard_stats)
+            publish_notifications(notifications)
+        return evidence
 
-        return attrs
 
-    def create(self, validated_data):
-        if validated_data.get("evidence_type") == Evidence.TYPE_MEDICAL:
-            urls = validated_data.get("image_urls") or []
-            single = (validated_data.get("image_url") or "").strip()
-            if (not urls) and single:
-                validated_data["image_urls"] = [single]
-            if (not single) and urls:
-                first = next((u for u in urls if isinstance(u, str) and u.strip()), "")
-                validated_data["image_url"] = first or ""
-        return super().create(validated_data)
+class EvidenceBulkSerializer(EvidenceSerializer):
+    case = PreloadedCaseField(queryset=Case.objects.all())
 
-    def update(self, instance, validated_data):
-        if (validated_data.get("evidence_type", instance.evidence_type)) == Evidence.TYPE_MEDICAL:
-            urls = validated_data.get("image_urls", instance.image_urls) or []
-            single = (validated_data.get("image_url", instance.image_url) or "").strip()
-            if (not urls) and single:
-                validated_data["image_urls"] = [single]
-            if (not single) and urls:
-                first = next((u for u in urls if isinstance(u, str) and u.strip()), "")
-                validated_data["image_url"] = first or ""
-        return super().update(instance, validated_data)
+    class Meta(EvidenceSerializer.Meta):
+        list_serializer_class = EvidenceListSerializer
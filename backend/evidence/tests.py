@@ -1,3 +1,131 @@
-from django.test import TestCase
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from cases.models import Case, CaseNotification, DetectiveBoard
+from config.stats import get_dashboard_stats
+from entities.models import EntityReference
+from metrics import counters
+from search.models import SearchDocument
+
+from .models import Evidence
+
+User = get_user_model()
+
+
+class EvidenceBulkCreateTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.detective = User.objects.create_user(username="detective", email="detective@test.com", password="x")
+        cls.officer = User.objects.create_user(username="officer", email="officer@test.com", password="x")
+        cls.case = Case.objects.create(title="Scene", created_by=cls.detective)
+        DetectiveBoard.objects.create(case=cls.case, created_by=cls.detective)
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_authenticate(self.officer)
+
+    def _post(self, records):
+        with self.captureOnCommitCallbacks(execute=True):
+            return self.client.post("/api/evidence/bulk/", records, format="json")
+
+    def test_creates_all_records_with_one_notification(self):
+        self.assertEqual(get_dashboard_stats()["evidence_total"], 0)
+        records = [
+            {"case": self.case.pk, "title": "Shell casing"},
+            {"case": self.case.pk, "title": "Getaway car", "evidence_type": "VEHICLE", "plate_number": "12 ب 345"},
+            {"case": self.case.pk, "title": "X-ray", "evidence_type": "MEDICAL", "image_url": "https://img.test/1.png"},
+        ]
+        resp = self._post(records)
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([item["title"] for item in resp.data], ["Shell casing", "Getaway car", "X-ray"])
+
+        evidence = Evidence.objects.filter(case=self.case).order_by("id")
+        self.assertEqual(set(evidence.values_list("created_by", flat=True)), {self.officer.pk})
+        self.assertEqual(evidence.get(title="X-ray").image_urls, ["https://img.test/1.png"])
+
+        notification = CaseNotification.objects.get()
+        self.assertEqual((notification.recipient, notification.ref_id), (self.detective, evidence[0].pk))
+        self.assertIn("3 new evidence items", notification.message)
+
+        self.assertEqual(get_dashboard_stats()["evidence_total"], 3)
+        values = counters.read([counters.EVIDENCE_TOTAL, counters.unread_notifications_key(self.detective.pk)])
+        self.assertEqual(list(values.values()), [3, 1])
+        self.assertEqual(SearchDocument.objects.filter(kind="evidence").count(), 3)
+        self.assertTrue(EntityReference.objects.filter(source_model="evidence.evidence", source_field="plate_number").exists())
+
+    def test_query_count_does_not_grow_with_batch_size(self):
+        def count(n):
+            with CaptureQueriesContext(connection) as queries:
+                resp = self._post([{"case": self.case.pk, "title": f"Item {i}"} for i in range(n)])
+            self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+            return len(queries)
+
+        count(1)  # creates the counters
+        self.assertEqual(count(2), count(40))
+
+    def test_any_invalid_record_rejects_the_batch(self):
+        resp = self._post(
+            [
+                {"case": self.case.pk, "title": "Fine"},
+                {"case": self.case.pk, "title": "Car", "evidence_type": "VEHICLE"},
+                {"case": 999999, "title": "Lost"},
+            ]
+        )
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        details = resp.data["error"]["details"]
+        self.assertEqual(details[0], {})
+        self.assertIn("vehicle", details[1])
+        self.assertIn("case", details[2])
+        self.assertFalse(Evidence.objects.exists())
+
+        self.assertEqual(self._post([]).status_code, status.HTTP_400_BAD_REQUEST)
+
+        resp = self._post([{"case": [self.case.pk], "title": "t"}, {"case": {"id": 1}, "title": "t"}])
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual([set(item) for item in resp.data["error"]["details"]], [{"case"}, {"case"}])
+
+
+class EvidenceValidationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.officer = User.objects.create_user(username="officer", email="officer@test.com", password="x")
+        cls.case = Case.objects.create(title="Scene", created_by=cls.officer)
+
+    def test_api_and_model_apply_the_same_rules(self):
+        self.client.force_authenticate(self.officer)
+        resp = self.client.post("/api/evidence/", {"case": self.case.pk, "title": "Car", "evidence_type": "VEHICLE"}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn("vehicle", resp.data["error"]["details"])
+
+        with self.assertRaisesMessage(ValidationError, "Vehicle evidence must have either plate_number or serial_number."):
+            Evidence(case=self.case, title="Car", evidence_type="VEHICLE", created_by=self.officer).save()
+
+    def test_api_create_skips_model_full_clean(self):
+        self.client.force_authenticate(self.officer)
+        with mock.patch.object(Evidence, "full_clean") as full_clean:
+            resp = self.client.post("/api/evidence/", {"case": self.case.pk, "title": "Glove"}, format="json")
+            self.assertEqual(resp.status_code, status.HTTP_201_CREATED)
+            self.client.patch(f"/api/evidence/{resp.data['id']}/", {"title": "Left glove"}, format="json")
+        full_clean.assert_not_called()
+        self.assertEqual(Evidence.objects.get().title, "Left glove")
+
+    def test_update_fills_medical_images_from_the_stored_values(self):
+        self.client.force_authenticate(self.officer)
+        resp = self.client.post(
+            "/api/evidence/",
+            {"case": self.case.pk, "title": "X-ray", "evidence_type": "MEDICAL", "image_url": "https://img.test/1.png"},
+            format="json",
+        )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+        resp = self.client.patch(
+            f"/api/evidence/{resp.data['id']}/", {"image_url": "", "image_urls": ["https://img.test/2.png"]}, format="json"
+        )
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.data)
+        self.assertEqual(resp.data["image_url"], "https://img.test/2.png")
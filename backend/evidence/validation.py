@@ -0,0 +1,65 @@
+"""Cross-field rules for evidence records, shared by the API and the model.
+
+``EvidenceSerializer.validate`` and ``Evidence.clean`` both call
+``evidence_errors`` with the record's current values, so a rule is written
+once. Field-level checks (lengths, choices, URLs, foreign keys) stay with the
+serializer fields and ``Model.full_clean``.
+"""
+
+TYPE_GENERIC = "GENERIC"
+TYPE_MEDICAL = "MEDICAL"
+TYPE_VEHICLE = "VEHICLE"
+TYPE_ID_DOC = "ID_DOC"
+TYPE_WITNESS = "WITNESS"
+
+# Values the rules read; anything else about the record is irrelevant to them.
+RULE_FIELDS = (
+    "evidence_type",
+    "plate_number",
+    "serial_number",
+    "image_url",
+    "image_urls",
+    "id_fields",
+    "transcription",
+    "media_urls",
+)
+
+
+def _has_url(urls) -> bool:
+    return any(isinstance(u, str) and u.strip() for u in urls)
+
+
+def evidence_errors(values: dict) -> dict[str, str]:
+    """Check one record given as ``{field: value}``; returns ``{error key: message}``, empty when valid."""
+    evidence_type = values.get("evidence_type")
+
+    if evidence_type == TYPE_VEHICLE:
+        plate = (values.get("plate_number") or "").strip()
+        serial = (values.get("serial_number") or "").strip()
+        if plate and serial:
+            return {"vehicle": "Vehicle evidence cannot have both plate_number and serial_number."}
+        if not plate and not serial:
+            return {"vehicle": "Vehicle evidence must have either plate_number or serial_number."}
+
+    if evidence_type == TYPE_MEDICAL:
+        urls = values.get("image_urls")
+        urls = [] if urls is None else urls
+        if not isinstance(urls, list):
+            return {"image_urls": "image_urls must be a list of URLs."}
+        if not (values.get("image_url") or "").strip() and not _has_url(urls):
+            return {"medical": "Medical evidence must include at least one image URL."}
+
+    if evidence_type == TYPE_ID_DOC:
+        id_fields = values.get("id_fields")
+        if id_fields is not None and not isinstance(id_fields, dict):
+            return {"id_fields": "id_fields must be an object/dict."}
+
+    if evidence_type == TYPE_WITNESS:
+        media_urls = values.get("media_urls")
+        media_urls = [] if media_urls is None else media_urls
+        if not isinstance(media_urls, list):
+            return {"media_urls": "media_urls must be a list of URLs."}
+        if not (values.get("transcription") or "").strip() and not _has_url(media_urls):
+            return {"witness": "Witness evidence must include transcription or at least one media URL."}
+
+    return {}
@@ -1,10 +1,13 @@
+from django.conf import settings
 from django.utils import timezone
-from rest_framework import viewsets
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 
 from cases.models import CaseNotification
 from .models import Evidence
-from .serializers import EvidenceSerializer
+from .serializers import EvidenceBulkSerializer, EvidenceSerializer
 
 
 class EvidenceViewSet(viewsets.ModelViewSet):
@@ -38,3 +41,23 @@ class EvidenceViewSet(viewsets.ModelViewSet):
                 ref_id=evidence.id,
                 created_at=timezone.now(),
             )
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """Create a list of evidence records in one request.
+
+        Accepts a JSON list of evidence objects (or ``{"items": [...]}``). Nothing
+        is saved unless every record is valid; errors come back per record, in
+        order. Board owners get one notification per case for the whole batch.
+        """
+        records = request.data.get("items") if isinstance(request.data, dict) else request.data
+        serializer = EvidenceBulkSerializer(
+            data=records,
+            many=True,
+            allow_empty=False,
+            max_length=settings.EVIDENCE_BULK_MAX_ITEMS,
+            context=self.get_serializer_context(),
+        )
+        serializer.is_valid(raise_exception=True)
+        serializer.save(created_by=request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
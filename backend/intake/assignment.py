@@ -0,0 +1,92 @@
+"""Automatic assignment of waiting complaints to reviewers.
+
+``assign_pending`` hands the oldest unassigned complaints in a queue to the
+cadets (or officers) with the fewest open complaints. Each reviewer's open
+count is read from the ``metrics`` counters, which the complaint signals keep
+current, so choosing a reviewer never counts complaints per reviewer.
+Reviewers already holding ``INTAKE_ASSIGN_MAX_OPEN`` complaints are skipped;
+what cannot be placed stays in the queue for ``claim_next``. Assignments are
+leased like claims, so one left untouched returns to the queue.
+"""
+
+import heapq
+from datetime import timedelta
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.utils import timezone
+
+from metrics import counters
+
+from .models import Complaint
+from .queue import QUEUES
+
+# queue name -> role whose members review it
+REVIEWER_ROLES = {"cadet": "Cadet", "officer": "Officer"}
+
+
+def reviewer_ids(queue: str) -> list[int]:
+    User = get_user_model()
+    return list(
+        User.objects.filter(is_active=True, userrole__role__name=REVIEWER_ROLES[queue])
+        .order_by("id")
+        .values_list("id", flat=True)
+        .distinct()
+    )
+
+
+def assign_pending(queue: str, batch_size: int = 500, max_open: int | None = None) -> int:
+    """Assign up to ``batch_size`` waiting complaints in ``queue``; returns how many were assigned."""
+    statuses, field = QUEUES[queue]
+    max_open = settings.INTAKE_ASSIGN_MAX_OPEN if max_open is None else max_open
+    reviewers = reviewer_ids(queue)
+    if not reviewers:
+        return 0
+
+    with transaction.atomic():
+        loads = counters.read([counters.review_load_key(queue, user_id) for user_id in reviewers])
+        heap = [(loads[counters.review_load_key(queue, user_id)], user_id) for user_id in reviewers]
+        heap = [entry for entry in heap if entry[0] < max_open]
+        if not heap:
+            return 0
+        heapq.heapify(heap)
+        capacity = sum(max_open - load for load, _ in heap)
+
+        # Complaints being claimed right now are left to their claimer.
+        complaints = list(
+            Complaint.objects.filter(status__in=statuses, **{f"{field}__isnull": True})
+            .order_by("created_at", "id")
+            .select_for_update(skip_locked=True)[: min(batch_size, capacity)]
+        )
+        now, deltas = timezone.now(), {}
+        # Same lease as claim_next, so an absent reviewer's work returns to the queue.
+        lease_expires_at = now + timedelta(seconds=settings.INTAKE_CLAIM_LEASE_SECONDS)
+        for complaint in complaints:
+            load, user_id = heapq.heappop(heap)
+            setattr(complaint, f"{field}_id", user_id)
+            complaint.lease_expires_at = lease_expires_at
+            complaint.updated_at = now
+            key = counters.review_load_key(queue, user_id)
+            deltas[key] = deltas.get(key, 0) + 1
+            if load + 1 < max_open:
+                heapq.heappush(heap, (load + 1, user_id))
+
+        # bulk_update skips the signals that maintain the load counters.
+        Complaint.objects.bulk_update(complaints, [field, "lease_expires_at", "updated_at"])
+        counters.bump(deltas)
+    return len(complaints)
+
+
+def assign_all(batch_size: int = 500, max_open: int | None = None) -> dict[str, int]:
+    """Run ``assign_pending`` over every queue until each is drained or its reviewers are full."""
+    assigned = {}
+    for queue in QUEUES:
+        total = 0
+        while True:
+            count = assign_pending(queue, batch_size=batch_size, max_open=max_open)
+            total += count
+            if count < batch_size:
+                break
+        assigned[queue] = total
+    return assigned
@@ -0,0 +1,27 @@
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from intake.assignment import assign_all
+
+
+class Command(BaseCommand):
+    help = "Assign waiting intake complaints to the least loaded cadets and officers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--max-open", type=int, default=None, help="Open complaints a reviewer may hold.")
+        parser.add_argument("--loop", action="store_true", help="Keep assigning every --interval seconds.")
+        parser.add_argument("--interval", type=float, default=5.0)
+
+    def handle(self, *args, **options):
+        while True:
+            close_old_connections()
+            assigned = assign_all(batch_size=options["batch_size"], max_open=options["max_open"])
+            if any(assigned.values()) or not options["loop"]:
+                summary = ", ".join(f"{queue}: {count}" for queue, count in assigned.items())
+                self.stdout.write(f"Assigned complaints ({summary}).")
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
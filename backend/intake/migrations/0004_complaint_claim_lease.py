@@ -0,0 +1,29 @@
+# Generated by Django 5.2.11 on 2026-10-18 01:35
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0008_board_revisions'),
+        ('intake', '0003_alter_complaint_case'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='complaint',
+            name='lease_expires_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['status', 'cadet', 'created_at'], name='complaint_cadet_queue_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['status', 'officer', 'created_at'], name='complaint_officer_queue_idx'),
+        ),
+    ]
@@ -0,0 +1,52 @@
+# Generated by Django 5.2.11 on 2026-10-18 01:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+from intake.schemas import extract_fields
+
+
+def backfill_payload_columns(apps, schema_editor):
+    Complaint = apps.get_model("intake", "Complaint")
+    fields = ["title", "crime_level", "payload_version"]
+    batch = []
+    for complaint in Complaint.objects.only("id", "payload").iterator(chunk_size=1000):
+        for field, value in extract_fields(complaint.payload).items():
+            setattr(complaint, field, value)
+        batch.append(complaint)
+        if len(batch) >= 1000:
+            Complaint.objects.bulk_update(batch, fields)
+            batch = []
+    Complaint.objects.bulk_update(batch, fields)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0008_board_revisions'),
+        ('intake', '0004_complaint_claim_lease'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='complaint',
+            name='crime_level',
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='complaint',
+            name='payload_version',
+            field=models.PositiveSmallIntegerField(default=1, editable=False),
+        ),
+        migrations.AddField(
+            model_name='complaint',
+            name='title',
+            field=models.CharField(blank=True, default='', editable=False, max_length=200),
+        ),
+        migrations.RunPython(backfill_payload_columns, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='complaint',
+            index=models.Index(fields=['status', 'crime_level', 'created_at'], name='complaint_level_idx'),
+        ),
+    ]
@@ -1,6 +1,8 @@
 from django.conf import settings
 from django.db import models
 
+from .schemas import extract_fields
+
 
 class ComplaintStatus(models.TextChoices):
     SUBMITTED = "SUBMITTED", "Submitted"
@@ -29,6 +31,12 @@ class Complaint(models.Model):
 
     payload = models.JSONField(default=dict, blank=True)
 
+    # Copied out of ``payload`` on save (see intake.schemas.extract_fields) so
+    # inboxes and reviews can filter and read them without parsing JSON.
+    title = models.CharField(max_length=200, blank=True, default="", editable=False)
+    crime_level = models.PositiveSmallIntegerField(default=1, editable=False)
+    payload_version = models.PositiveSmallIntegerField(default=1, editable=False)
+
     status = models.CharField(
         max_length=32,
         choices=ComplaintStatus.choices,
@@ -55,14 +63,40 @@ class Complaint(models.Model):
         related_name="officer_assigned_intake_complaints",
     )
 
+    # Set while a reviewer holds the complaint through claim_next (see intake.queue);
+    # once it passes, another reviewer may claim it.
+    lease_expires_at = models.DateTimeField(null=True, blank=True)
+
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["status", "cadet", "created_at"], name="complaint_cadet_queue_idx"),
+            models.Index(fields=["status", "officer", "created_at"], name="complaint_officer_queue_idx"),
+            models.Index(fields=["status", "crime_level", "created_at"], name="complaint_level_idx"),
+        ]
+
+    def save(self, *args, **kwargs):
+        for field, value in extract_fields(self.payload).items():
+            setattr(self, field, value)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "payload" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "title", "crime_level", "payload_version"}
+        super().save(*args, **kwargs)
+
     def invalidate_if_needed(self) -> bool:
         if self.bad_submission_count >= 3 and self.status != ComplaintStatus.INVALIDATED:
             self.status = ComplaintStatus.INVALIDATED
             return True
         return False
 
+    def held_by_other(self, field: str, user, now) -> bool:
+        """Whether ``field`` ("cadet"/"officer") names someone else whose claim still stands."""
+        holder_id = getattr(self, f"{field}_id")
+        if holder_id is None or holder_id == user.id:
+            return False
+        return self.lease_expires_at is None or self.lease_expires_at > now
+
     def __str__(self) -> str:
         return f"Complaint #{self.pk} ({self.status})"
@@ -0,0 +1,55 @@
+"""Work queues over intake complaints.
+
+Each review stage is a queue: cadets drain complaints waiting for a cadet,
+officers those approved by a cadet. ``claim_next`` leases the oldest
+complaint nobody else holds to the caller for ``INTAKE_CLAIM_LEASE_SECONDS``.
+Rows another reviewer is claiming at the same moment are skipped rather than
+waited on (``FOR UPDATE SKIP LOCKED``), so any number of reviewers can claim
+concurrently and each gets a different complaint. A review ends the lease; a
+lease that runs out puts the complaint back in the queue.
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import Complaint, ComplaintStatus
+
+# queue name -> (statuses waiting in it, assignee field)
+QUEUES = {
+    "cadet": ((ComplaintStatus.SUBMITTED, ComplaintStatus.OFFICER_DEFECT), "cadet"),
+    "officer": ((ComplaintStatus.CADET_APPROVED,), "officer"),
+}
+
+
+def claimable(queue: str, user, now=None):
+    """Complaints in ``queue`` that ``user`` may take, oldest first."""
+    statuses, field = QUEUES[queue]
+    now = now or timezone.now()
+    return (
+        Complaint.objects.filter(status__in=statuses)
+        .filter(
+            Q(**{f"{field}__isnull": True})
+            # Sent back to this reviewer by a later stage.
+            | Q(**{field: user, "lease_expires_at__isnull": True})
+            | Q(lease_expires_at__lt=now)
+        )
+        .order_by("created_at", "id")
+    )
+
+
+def claim_next(queue: str, user):
+    """Lease the oldest claimable complaint in ``queue`` to ``user``, or return None."""
+    _, field = QUEUES[queue]
+    now = timezone.now()
+    with transaction.atomic():
+        complaint = claimable(queue, user, now).select_for_update(skip_locked=True).first()
+        if complaint is None:
+            return None
+        setattr(complaint, field, user)
+        complaint.lease_expires_at = now + timedelta(seconds=settings.INTAKE_CLAIM_LEASE_SECONDS)
+        complaint.save(update_fields=[field, "lease_expires_at", "updated_at"])
+    return complaint
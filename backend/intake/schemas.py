@@ -0,0 +1,113 @@
+"""Versioned JSON schemas for ``Complaint.payload``.
+
+A payload may name the schema it follows with ``"schema_version"``; without
+it the current version applies. Validators are built once per version (the
+app config warms them at startup) and reused for every request.
+
+``extract_fields`` pulls the fields the review workflow reads out of a
+payload into ``Complaint`` columns. It is lenient on purpose: it also runs
+over payloads stored before validation existed.
+"""
+
+from functools import lru_cache
+
+from jsonschema import Draft202012Validator
+from jsonschema.exceptions import SchemaError
+
+CURRENT_VERSION = 1
+
+_TEXT = {"type": "string", "maxLength": 10000}
+_TITLE = {"type": "string", "minLength": 1, "maxLength": 200, "pattern": r"\S"}
+
+SCHEMAS = {
+    1: {
+        "$schema": "https://json-schema.org/draft/2020-12/schema",
+        "type": "object",
+        "properties": {
+            "schema_version": {"const": 1},
+            "title": _TITLE,
+            "case_title": _TITLE,
+            "description": _TEXT,
+            "case_description": _TEXT,
+            "crime_level": {
+                "anyOf": [
+                    {"type": "integer", "minimum": 1, "maximum": 4},
+                    {"type": "string", "pattern": "^[1-4]$"},
+                ]
+            },
+        },
+        "anyOf": [{"required": ["title"]}, {"required": ["case_title"]}],
+    },
+}
+
+
+# Friendlier wording for errors whose schema message would be cryptic: (field, keyword) -> message
+_MESSAGES = {
+    ("title", "pattern"): "Must not be blank.",
+    ("case_title", "pattern"): "Must not be blank.",
+    ("crime_level", "anyOf"): "Must be a crime level from 1 to 4.",
+}
+
+
+class PayloadError(ValueError):
+    def __init__(self, errors: dict):
+        super().__init__(errors)
+        self.errors = errors
+
+
+@lru_cache(maxsize=None)
+def validator(version: int) -> Draft202012Validator:
+    schema = SCHEMAS[version]
+    Draft202012Validator.check_schema(schema)
+    return Draft202012Validator(schema)
+
+
+def compile_all() -> None:
+    """Build every validator up front so a broken schema fails at startup."""
+    for version in SCHEMAS:
+        try:
+            validator(version)
+        except SchemaError as exc:
+            raise SchemaError(f"intake payload schema v{version}: {exc.message}") from exc
+
+
+def payload_version(payload) -> int:
+    version = payload.get("schema_version", CURRENT_VERSION) if isinstance(payload, dict) else CURRENT_VERSION
+    return version if isinstance(version, int) and not isinstance(version, bool) else CURRENT_VERSION
+
+
+def validate_payload(payload) -> int:
+    """Check ``payload`` against its schema; return the version or raise ``PayloadError``."""
+    if not isinstance(payload, dict):
+        raise PayloadError({"payload": "Must be a JSON object."})
+    version = payload.get("schema_version", CURRENT_VERSION)
+    if version not in SCHEMAS or isinstance(version, bool):
+        raise PayloadError({"schema_version": f"Unknown version; supported: {sorted(SCHEMAS)}."})
+
+    errors = {}
+    for error in sorted(validator(version).iter_errors(payload), key=lambda e: list(e.absolute_path)):
+        if error.validator == "anyOf" and not error.absolute_path:
+            key, message = "title", "A title (or case_title) is required."
+        else:
+            key = ".".join(str(part) for part in error.absolute_path) or "payload"
+            message = _MESSAGES.get((key, error.validator), error.message)
+        errors.setdefault(key, message)
+    if errors:
+        raise PayloadError(errors)
+    return version
+
+
+def extract_fields(payload) -> dict:
+    """``title``, ``crime_level`` and ``payload_version`` for the Complaint columns."""
+    payload = payload if isinstance(payload, dict) else {}
+    title = payload.get("title") or payload.get("case_title") or ""
+    title = title.strip()[:200] if isinstance(title, str) else ""
+    try:
+        crime_level = int(payload.get("crime_level") or 1)
+    except (TypeError, ValueError):
+        crime_level = 1
+    return {
+        "title": title,
+        "crime_level": max(1, min(4, crime_level)),
+        "payload_version": payload_version(payload),
+    }
@@ -1,9 +1,19 @@
 from rest_framework import serializers
 
 from .models import Complaint
+from .schemas import PayloadError, validate_payload
 
 
-class ComplaintSerializer(serializers.ModelSerializer):
+class PayloadSchemaMixin:
+    def validate_payload(self, value):
+        try:
+            validate_payload(value)
+        except PayloadError as exc:
+            raise serializers.ValidationError(exc.errors)
+        return value
+
+
+class ComplaintSerializer(PayloadSchemaMixin, serializers.ModelSerializer):
     class Meta:
         model = Complaint
         fields = [
@@ -11,6 +21,8 @@ class ComplaintSerializer(serializers.ModelSerializer):
             "created_by",
             "created_at",
             "payload",
+            "title",
+            "crime_level",
             "case",
             "status",
             "bad_submission_count",
@@ -18,6 +30,7 @@ class ComplaintSerializer(serializers.ModelSerializer):
             "officer_error_message",
             "cadet",
             "officer",
+            "lease_expires_at",
         ]
         read_only_fields = [
             "id",
@@ -30,16 +43,17 @@ class ComplaintSerializer(serializers.ModelSerializer):
             "officer_error_message",
             "cadet",
             "officer",
+            "lease_expires_at",
         ]
 
 
-class ComplaintCreateSerializer(serializers.ModelSerializer):
+class ComplaintCreateSerializer(PayloadSchemaMixin, serializers.ModelSerializer):
     class Meta:
         model = Complaint
         fields = ["payload"]
 
 
-class ResubmitSerializer(serializers.ModelSerializer):
+class ResubmitSerializer(PayloadSchemaMixin, serializers.ModelSerializer):
     class Meta:
         model = Complaint
         fields = ["payload"]
@@ -1 +1,159 @@
-from django.test import TestCase
+import threading
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection, transaction
+from django.test import TransactionTestCase
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from cases.models import CaseNotification
+from metrics import counters
+from rbac.models import Role, UserRole
+
+from .assignment import assign_all
+from .models import Complaint, ComplaintStatus
+from .queue import claim_next
+
+User = get_user_model()
+
+
+class ClaimNextTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cadet_role = Role.objects.create(name="Cadet")
+        officer_role = Role.objects.create(name="Officer")
+        cls.citizen = User.objects.create_user(username="citizen", email="citizen@test.com", password="x")
+        cls.cadets = []
+        for n in range(2):
+            cadet = User.objects.create_user(username=f"cadet{n}", email=f"cadet{n}@test.com", password="x")
+            UserRole.objects.create(user=cadet, role=cadet_role)
+            cls.cadets.append(cadet)
+        cls.officer = User.objects.create_user(username="officer", email="officer@test.com", password="x")
+        UserRole.objects.create(user=cls.officer, role=officer_role)
+
+    def setUp(self):
+        self.complaints = [
+            Complaint.objects.create(created_by=self.citizen, payload={"title": f"C{n}", "crime_level": 2})
+            for n in range(2)
+        ]
+
+    def claim(self, user, queue="cadet"):
+        self.client.force_authenticate(user)
+        return self.client.post(f"/api/intake/complaints/{queue}_claim_next/")
+
+    def test_reviewers_claim_different_complaints_until_the_queue_drains(self):
+        first, second = self.claim(self.cadets[0]), self.claim(self.cadets[1])
+        self.assertEqual([first.data["id"], second.data["id"]], [c.id for c in self.complaints])
+        self.assertEqual(first.data["cadet"], self.cadets[0].id)
+        self.assertIsNotNone(first.data["lease_expires_at"])
+        self.assertEqual(self.claim(self.cadets[0]).status_code, status.HTTP_204_NO_CONTENT)
+
+        # The other cadet cannot review a complaint under someone else's lease.
+        self.client.force_authenticate(self.cadets[1])
+        resp = self.client.post(f"/api/intake/complaints/{first.data['id']}/cadet_review/", {"status": "approve"})
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_expired_lease_returns_the_complaint_to_the_queue(self):
+        claim_next("cadet", self.cadets[0])
+        Complaint.objects.filter(pk=self.complaints[0].pk).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+        self.assertEqual(claim_next("cadet", self.cadets[1]), self.complaints[0])
+
+    def test_review_ends_the_lease_and_officer_approval_forms_the_case(self):
+        complaint_id = self.claim(self.cadets[0]).data["id"]
+        resp = self.client.post(f"/api/intake/complaints/{complaint_id}/cadet_review/", {"status": "approve"})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.data)
+        self.assertIsNone(resp.data["lease_expires_at"])
+
+        self.assertEqual(self.claim(self.officer, "officer").data["id"], complaint_id)
+        resp = self.client.post(f"/api/intake/complaints/{complaint_id}/officer_review/", {"status": "approve"})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.data)
+        self.assertEqual(resp.data["status"], ComplaintStatus.OFFICER_APPROVED)
+        self.assertTrue(CaseNotification.objects.filter(case_id=resp.data["case"], recipient=self.citizen).exists())
+
+    def test_assignment_balances_open_work_and_keeps_counters_exact(self):
+        claim_next("cadet", self.cadets[0])
+        for n in range(3):
+            Complaint.objects.create(created_by=self.citizen, payload={"title": f"late {n}"})
+
+        self.assertEqual(assign_all(max_open=2), {"cadet": 3, "officer": 0})
+        loads = counters.read([counters.review_load_key("cadet", cadet.id) for cadet in self.cadets])
+        self.assertEqual(sorted(loads.values()), [2, 2])
+        self.assertEqual(Complaint.objects.filter(cadet__isnull=True).count(), 1)
+
+        complaint = Complaint.objects.filter(cadet=self.cadets[1]).first()
+        self.client.force_authenticate(self.cadets[1])
+        resp = self.client.post(f"/api/intake/complaints/{complaint.id}/cadet_review/", {"status": "approve"})
+        self.assertEqual(resp.status_code, status.HTTP_200_OK, resp.data)
+        self.assertEqual(counters.read([counters.review_load_key("cadet", self.cadets[1].id)]).popitem()[1], 1)
+        self.assertEqual(assign_all(), {"cadet": 1, "officer": 1})
+        self.assertEqual(counters.mismatches(), {})
+
+    def test_expired_auto_assignment_can_be_reclaimed(self):
+        self.assertEqual(assign_all(), {"cadet": 2, "officer": 0})
+        assigned = Complaint.objects.get(pk=self.complaints[0].pk)
+        self.assertGreater(assigned.lease_expires_at, timezone.now())
+
+        Complaint.objects.filter(pk=assigned.pk).update(lease_expires_at=timezone.now() - timedelta(seconds=1))
+        other = next(cadet for cadet in self.cadets if cadet.id != assigned.cadet_id)
+        self.assertEqual(claim_next("cadet", other), assigned)
+        self.assertEqual(counters.mismatches(), {})
+
+
+class ClaimNextConcurrencyTests(TransactionTestCase):
+    def test_claim_skips_rows_locked_by_another_claim(self):
+        citizen = User.objects.create_user(username="citizen", email="citizen@test.com", password="x")
+        cadet = User.objects.create_user(username="cadet", email="cadet@test.com", password="x")
+        oldest, newer = (Complaint.objects.create(created_by=citizen) for _ in range(2))
+
+        locked, release = threading.Event(), threading.Event()
+
+        def hold_oldest():
+            try:
+                with transaction.atomic():
+                    Complaint.objects.select_for_update().get(pk=oldest.pk)
+                    locked.set()
+                    release.wait(5)
+            finally:
+                connection.close()
+
+        holder = threading.Thread(target=hold_oldest)
+        holder.start()
+        try:
+            locked.wait(5)
+            self.assertEqual(claim_next("cadet", cadet), newer)
+        finally:
+            release.set()
+            holder.join()
+
+
+class ComplaintPayloadTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.citizen = User.objects.create_user(username="citizen", email="citizen@test.com", password="x")
+        cls.cadet = User.objects.create_user(username="cadet", email="cadet@test.com", password="x")
+        UserRole.objects.create(user=cls.cadet, role=Role.objects.create(name="Cadet"))
+
+    def test_payload_is_validated_and_hot_fields_become_columns(self):
+        self.client.force_authenticate(self.citizen)
+        resp = self.client.post("/api/intake/complaints/", {"payload": {"description": "x", "crime_level": 9}}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(set(resp.data["error"]["details"]["payload"]), {"title", "crime_level"})
+
+        resp = self.client.post("/api/intake/complaints/", {"payload": {"schema_version": 7, "title": "t"}}, format="json")
+        self.assertEqual(resp.status_code, status.HTTP_400_BAD_REQUEST)
+
+        for title, level in (("  Stolen car ", "3"), ("Noise", 1)):
+            resp = self.client.post(
+                "/api/intake/complaints/", {"payload": {"title": title, "crime_level": level}}, format="json"
+            )
+            self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+        self.assertEqual(
+            list(Complaint.objects.order_by("id").values_list("title", "crime_level", "payload_version")),
+            [("Stolen car", 3, 1), ("Noise", 1, 1)],
+        )
+
+        self.client.force_authenticate(self.cadet)
+        resp = self.client.get("/api/intake/complaints/cadet_inbox/?crime_level=3")
+        self.assertEqual([c["title"] for c in resp.data["results"]], ["Stolen car"])
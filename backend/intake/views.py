@@ -1,15 +1,19 @@
 from django.db.models import Q
 from django.db import transaction
+from django.utils import timezone
 from rest_framework import status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet
 
+from config.pagination import CreatedAtCursorPagination
 from rbac.permissions import IsCadetRole, IsOfficerRole, user_has_role
 from cases.models import Case, CaseComplainant, CaseNotification
 
 from .models import Complaint, ComplaintStatus
+from .queue import claim_next
 from .serializers import (
     CadetReviewSerializer,
     ComplaintCreateSerializer,
@@ -17,37 +21,24 @@ from .serializers import (
     OfficerReviewSerializer,
     ResubmitSerializer,
 )
+from .visibility import visible_complaints
 
 
 class ComplaintViewSet(ModelViewSet):
     queryset = Complaint.objects.all().order_by("-created_at")
     serializer_class = ComplaintSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = CreatedAtCursorPagination
 
     def get_permissions(self):
-        if self.action in {"cadet_inbox", "cadet_review"}:
+        if self.action in {"cadet_inbox", "cadet_claim_next", "cadet_review"}:
             return [IsAuthenticated(), IsCadetRole()]
-        if self.action in {"officer_inbox", "officer_review"}:
+        if self.action in {"officer_inbox", "officer_claim_next", "officer_review"}:
             return [IsAuthenticated(), IsOfficerRole()]
         return [IsAuthenticated()]
 
     def get_queryset(self):
-        user = self.request.user
-        if user.is_superuser or user.is_staff or user_has_role(user, "Admin"):
-            return Complaint.objects.all().order_by("-created_at")
-
-        if user_has_role(user, "Cadet"):
-            return Complaint.objects.filter(
-                Q(status__in=[ComplaintStatus.SUBMITTED, ComplaintStatus.OFFICER_DEFECT])
-                | Q(cadet=user)
-            ).order_by("-created_at")
-
-        if user_has_role(user, "Officer"):
-            return Complaint.objects.filter(
-                Q(status=ComplaintStatus.CADET_APPROVED) | Q(officer=user)
-            ).order_by("-created_at")
-
-        return Complaint.objects.filter(created_by=user).order_by("-created_at")
+        return visible_complaints(self.request.user).order_by("-created_at")
 
     def get_serializer_class(self):
         if self.action == "create":
@@ -93,93 +84,91 @@ class ComplaintViewSet(ModelViewSet):
     def cadet_inbox(self, request):
         qs = Complaint.objects.filter(
             status__in=[ComplaintStatus.SUBMITTED, ComplaintStatus.OFFICER_DEFECT]
-        ).filter(Q(cadet__isnull=True) | Q(cadet=request.user)).order_by("-created_at")
-        return Response(ComplaintSerializer(qs, many=True).data)
+        ).filter(Q(cadet__isnull=True) | Q(cadet=request.user) | Q(lease_expires_at__lt=timezone.now()))
+        page = self.paginate_queryset(self._filter_inbox(qs))
+        return self.get_paginated_response(ComplaintSerializer(page, many=True).data)
+
+    @action(detail=False, methods=["post"])
+    def cadet_claim_next(self, request):
+        return self._claim_next("cadet", request.user)
 
     @action(detail=True, methods=["post"])
     def cadet_review(self, request, pk=None):
         complaint = self.get_object()
 
-        is_adminish = (
-            request.user.is_superuser
-            or request.user.is_staff
-            or user_has_role(request.user, "Admin")
-        )
-        if complaint.cadet and complaint.cadet_id != request.user.id and not is_adminish:
-            return Response({"detail": "Not allowed."}, status=status.HTTP_403_FORBIDDEN)
+        with transaction.atomic():
+            complaint = self._lock_for_review(complaint, "cadet", request.user)
+            if complaint is None:
+                return Response({"detail": "Not allowed."}, status=status.HTTP_403_FORBIDDEN)
 
-        if complaint.status not in [ComplaintStatus.SUBMITTED, ComplaintStatus.OFFICER_DEFECT]:
-            return Response(
-                {"detail": f"Cannot cadet-review complaint in status {complaint.status}."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            if complaint.status not in [ComplaintStatus.SUBMITTED, ComplaintStatus.OFFICER_DEFECT]:
+                return Response(
+                    {"detail": f"Cannot cadet-review complaint in status {complaint.status}."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
 
-        complaint.cadet = request.user
+            complaint.cadet = request.user
+            complaint.lease_expires_at = None
 
-        if serializer.validated_data["status"] == "approve":
-            complaint.status = ComplaintStatus.CADET_APPROVED
-            complaint.cadet_error_message = ""
-        else:
-            complaint.status = ComplaintStatus.NEEDS_FIX
-            complaint.bad_submission_count += 1
-            complaint.cadet_error_message = serializer.validated_data.get("error_message", "")
-            complaint.invalidate_if_needed()
+            if serializer.validated_data["status"] == "approve":
+                complaint.status = ComplaintStatus.CADET_APPROVED
+                complaint.cadet_error_message = ""
+            else:
+                complaint.status = ComplaintStatus.NEEDS_FIX
+                complaint.bad_submission_count += 1
+                complaint.cadet_error_message = serializer.validated_data.get("error_message", "")
+                complaint.invalidate_if_needed()
 
-        complaint.save()
+            complaint.save()
         return Response(ComplaintSerializer(complaint).data)
 
     @action(detail=False, methods=["get"])
     def officer_inbox(self, request):
         qs = Complaint.objects.filter(status=ComplaintStatus.CADET_APPROVED).filter(
-            Q(officer__isnull=True) | Q(officer=request.user)
-        ).order_by("-created_at")
-        return Response(ComplaintSerializer(qs, many=True).data)
+            Q(officer__isnull=True) | Q(officer=request.user) | Q(lease_expires_at__lt=timezone.now())
+        )
+        page = self.paginate_queryset(self._filter_inbox(qs))
+        return self.get_paginated_response(ComplaintSerializer(page, many=True).data)
+
+    @action(detail=False, methods=["post"])
+    def officer_claim_next(self, request):
+        return self._claim_next("officer", request.user)
 
     @action(detail=True, methods=["post"])
     def officer_review(self, request, pk=None):
         complaint = self.get_object()
 
-        is_adminish = (
-            request.user.is_superuser
-            or request.user.is_staff
-            or user_has_role(request.user, "Admin")
-        )
-        if complaint.officer and complaint.officer_id != request.user.id and not is_adminish:
-            return Response({"detail": "Not allowed."}, status=status.HTTP_403_FORBIDDEN)
+        with transaction.atomic():
+            complaint = self._lock_for_review(complaint, "officer", request.user)
+            if complaint is None:
+                return Response({"detail": "Not allowed."}, status=status.HTTP_403_FORBIDDEN)
 
-        if complaint.status != ComplaintStatus.CADET_APPROVED:
-            return Response(
-                {"detail": f"Cannot officer-review complaint in status {complaint.status}."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            if complaint.status != ComplaintStatus.CADET_APPROVED:
+                return Response(
+                    {"detail": f"Cannot officer-review complaint in status {complaint.status}."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
 
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+            serializer = self.get_serializer(data=request.data)
+            serializer.is_valid(raise_exception=True)
 
-        complaint.officer = request.user
+            complaint.officer = request.user
+            complaint.lease_expires_at = None
 
-        if serializer.validated_data["status"] == "approve":
-            if complaint.case_id:
-                return Response({"detail": "Case already created for this complaint"}, status=status.HTTP_400_BAD_REQUEST)
+            if serializer.validated_data["status"] == "approve":
+                if complaint.case_id:
+                    return Response({"detail": "Case already created for this complaint"}, status=status.HTTP_400_BAD_REQUEST)
 
-            payload = complaint.payload or {}
-            title = (payload.get("title") or payload.get("case_title") or f"Complaint {complaint.id}").strip()
-            description = payload.get("description") or payload.get("case_description") or ""
-            try:
-                crime_level = int(payload.get("crime_level") or 1)
-            except Exception:
-                crime_level = 1
-            crime_level = max(1, min(4, crime_level))
+                payload = complaint.payload or {}
+                description = payload.get("description") or payload.get("case_description") or ""
 
-            with transaction.atomic():
                 case = Case.objects.create(
-                    title=title,
+                    title=complaint.title or f"Complaint {complaint.id}",
                     description=description,
-                    crime_level=crime_level,
-                    details=payload,
+                    crime_level=complaint.crime_level,
                     created_by=complaint.created_by,
                     status="OPEN",
                 )
@@ -188,14 +177,41 @@ class ComplaintViewSet(ModelViewSet):
                     user=complaint.created_by,
                     defaults={"status": CaseComplainant.STATUS_APPROVED},
                 )
-                CaseNotification.objects.create(case=case, message="Case formed from complaint")
+                CaseNotification.objects.create(
+                    case=case, recipient=complaint.created_by, message="Case formed from complaint"
+                )
                 complaint.case = case
                 complaint.status = ComplaintStatus.OFFICER_APPROVED
                 complaint.officer_error_message = ""
-                complaint.save()
-        else:
-            complaint.status = ComplaintStatus.OFFICER_DEFECT
-            complaint.officer_error_message = serializer.validated_data.get("error_message", "")
+            else:
+                complaint.status = ComplaintStatus.OFFICER_DEFECT
+                complaint.officer_error_message = serializer.validated_data.get("error_message", "")
             complaint.save()
 
         return Response(ComplaintSerializer(complaint).data)
+
+    def _filter_inbox(self, qs):
+        """Apply ``?crime_level=`` and ``?title=`` to an inbox, using the extracted columns."""
+        crime_level = self.request.query_params.get("crime_level")
+        if crime_level:
+            if not crime_level.isdigit():
+                raise ValidationError({"crime_level": "Must be an integer."})
+            qs = qs.filter(crime_level=int(crime_level))
+        title = self.request.query_params.get("title")
+        if title:
+            qs = qs.filter(title__icontains=title)
+        return qs
+
+    def _claim_next(self, queue, user):
+        complaint = claim_next(queue, user)
+        if complaint is None:
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return Response(ComplaintSerializer(complaint).data)
+
+    def _lock_for_review(self, complaint, field, user):
+        """Re-read ``complaint`` under a row lock, or return None if another reviewer holds it."""
+        complaint = Complaint.objects.select_for_update().get(pk=complaint.pk)
+        is_adminish = user.is_superuser or user.is_staff or user_has_role(user, "Admin")
+        if complaint.held_by_other(field, user, timezone.now()) and not is_adminish:
+            return None
+        return complaint
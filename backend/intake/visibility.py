@@ -0,0 +1,24 @@
+from django.db.models import Q
+
+from rbac.permissions import user_has_role
+
+from .models import Complaint, ComplaintStatus
+
+
+def visible_complaints(user):
+    """The complaints ``user`` may read: admins all, reviewers their queue and their own reviews, others their own."""
+    if user.is_superuser or user.is_staff or user_has_role(user, "Admin"):
+        return Complaint.objects.all()
+
+    if user_has_role(user, "Cadet"):
+        return Complaint.objects.filter(
+            Q(status__in=[ComplaintStatus.SUBMITTED, ComplaintStatus.OFFICER_DEFECT])
+            | Q(cadet=user)
+        )
+
+    if user_has_role(user, "Officer"):
+        return Complaint.objects.filter(
+            Q(status=ComplaintStatus.CADET_APPROVED) | Q(officer=user)
+        )
+
+    return Complaint.objects.filter(created_by=user)
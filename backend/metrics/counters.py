@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections import Counter as Tally
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F
+
+from cases.models import Case, CaseNotification
+from evidence.models import Evidence
+from intake.models import Complaint
+from intake.queue import QUEUES
+from rewards.models import RewardTip
+from suspects.models import Suspect
+
+from .models import Counter
+
+CASES_TOTAL = "cases.total"
+TIPS_TOTAL = "tips.total"
+EVIDENCE_TOTAL = "evidence.total"
+SUSPECTS_TOTAL = "suspects.total"
+
+
+def case_status_key(status: str) -> str:
+    return f"cases.status.{status}"
+
+
+def tip_status_key(status: str) -> str:
+    return f"tips.status.{status}"
+
+
+def unread_notifications_key(user_id) -> str:
+    return f"notifications.unread.{user_id}"
+
+
+def review_load_key(queue: str, user_id) -> str:
+    return f"intake.open.{queue}.{user_id}"
+
+
+def review_load_keys(status, assignees: dict) -> set[str]:
+    """Load keys a complaint counts towards: its assignee's, in the queue it waits in.
+
+    ``assignees`` maps the queue's assignee field ("cadet"/"officer") to a user id.
+    """
+    return {
+        review_load_key(queue, assignees[field])
+        for queue, (statuses, field) in QUEUES.items()
+        if status in statuses and assignees.get(field) is not None
+    }
+
+
+def dashboard_keys() -> list[str]:
+    """Every key the dashboard reads, including statuses that may still be zero."""
+    return [
+        CASES_TOTAL,
+        TIPS_TOTAL,
+        EVIDENCE_TOTAL,
+        SUSPECTS_TOTAL,
+        *(case_status_key(s) for s, _ in Case.STATUS_CHOICES),
+        *(tip_status_key(s) for s, _ in RewardTip.STATUS),
+    ]
+
+
+def bump(deltas: dict[str, int]) -> None:
+    """Add each delta to its counter, creating missing counters on the fly.
+
+    Runs inside the caller's transaction when there is one, so a rolled back
+    write also rolls back its counter change.
+    """
+    for key, delta in sorted(deltas.items()):
+        if not delta:
+            continue
+        if Counter.objects.filter(key=key).update(value=F("value") + delta):
+            continue
+        try:
+            with transaction.atomic():
+                Counter.objects.create(key=key, value=delta)
+        except IntegrityError:
+            # Another writer created it first.
+            Counter.objects.filter(key=key).update(value=F("value") + delta)
+
+
+def read(keys) -> dict[str, int]:
+    values = dict(Counter.objects.filter(key__in=list(keys)).values_list("key", "value"))
+    return {key: values.get(key, 0) for key in keys}
+
+
+def expected_counts() -> dict[str, int]:
+    """Recount every counter from the source tables (slow; for rebuild/check only)."""
+    counts = Tally({key: 0 for key in dashboard_keys()})
+
+    for row in Case.objects.values("status").annotate(n=Count("id")).order_by():
+        counts[case_status_key(row["status"])] += row["n"]
+        counts[CASES_TOTAL] += row["n"]
+
+    for row in RewardTip.objects.values("status").annotate(n=Count("id")).order_by():
+        counts[tip_status_key(row["status"])] += row["n"]
+        counts[TIPS_TOTAL] += row["n"]
+
+    counts[EVIDENCE_TOTAL] = Evidence.objects.count()
+    counts[SUSPECTS_TOTAL] = Suspect.objects.count()
+
+    unread = CaseNotification.objects.filter(read_at__isnull=True).values("recipient").annotate(n=Count("id"))
+    for row in unread.order_by():
+        counts[unread_notifications_key(row["recipient"])] = row["n"]
+
+    for queue, (statuses, field) in QUEUES.items():
+        assigned = Complaint.objects.filter(status__in=statuses, **{f"{field}__isnull": False})
+        for row in assigned.values(field).annotate(n=Count("id")).order_by():
+            counts[review_load_key(queue, row[field])] = row["n"]
+    return dict(counts)
+
+
+def rebuild() -> dict[str, int]:
+    counts = expected_counts()
+    with transaction.atomic():
+        Counter.objects.all().delete()
+        Counter.objects.bulk_create(Counter(key=key, value=value) for key, value in counts.items())
+    return counts
+
+
+def mismatches() -> dict[str, tuple[int, int]]:
+    """Return ``{key: (stored, actual)}`` for every counter that has drifted."""
+    actual = expected_counts()
+    stored = dict(Counter.objects.values_list("key", "value"))
+    keys = set(actual) | set(stored)
+    return {
+        key: (stored.get(key, 0), actual.get(key, 0))
+        for key in sorted(keys)
+        if stored.get(key, 0) != actual.get(key, 0)
+    }
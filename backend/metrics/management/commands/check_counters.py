@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from metrics import counters
+
+
+class Command(BaseCommand):
+    help = "Compare the stored dashboard counters with a fresh recount."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--fix", action="store_true", help="Rebuild the counters if any have drifted.")
+
+    def handle(self, *args, **options):
+        drift = counters.mismatches()
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("All counters are consistent."))
+            return
+
+        for key, (stored, actual) in drift.items():
+            self.stdout.write(f"{key}: stored={stored} actual={actual}")
+
+        if options["fix"]:
+            counters.rebuild()
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt counters ({len(drift)} had drifted)."))
+            return
+
+        raise CommandError(f"{len(drift)} counter(s) have drifted; run rebuild_counters or pass --fix.")
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from metrics import counters
+
+
+class Command(BaseCommand):
+    help = "Recount every dashboard counter from the source tables."
+
+    def handle(self, *args, **options):
+        counts = counters.rebuild()
+        for key, value in sorted(counts.items()):
+            self.stdout.write(f"{key} = {value}")
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {len(counts)} counters."))
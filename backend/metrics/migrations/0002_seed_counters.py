@@ -0,0 +1,38 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def seed_counters(apps, schema_editor):
+    Counter = apps.get_model("metrics", "Counter")
+    Case = apps.get_model("cases", "Case")
+    RewardTip = apps.get_model("rewards", "RewardTip")
+    Evidence = apps.get_model("evidence", "Evidence")
+    Suspect = apps.get_model("suspects", "Suspect")
+
+    counts = {
+        "cases.total": Case.objects.count(),
+        "tips.total": RewardTip.objects.count(),
+        "evidence.total": Evidence.objects.count(),
+        "suspects.total": Suspect.objects.count(),
+    }
+    for row in Case.objects.values("status").annotate(n=Count("id")).order_by():
+        counts[f"cases.status.{row['status']}"] = row["n"]
+    for row in RewardTip.objects.values("status").annotate(n=Count("id")).order_by():
+        counts[f"tips.status.{row['status']}"] = row["n"]
+
+    Counter.objects.bulk_create(Counter(key=key, value=value) for key, value in counts.items())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("metrics", "0001_initial"),
+        ("cases", "0006_rename_casecomp_case_status_idx_cases_casec_case_id_baf018_idx_and_more"),
+        ("evidence", "0007_alter_evidence_image_urls"),
+        ("rewards", "0002_rename_info_rewardtip_message_and_more"),
+        ("suspects", "0003_suspect_rank_score"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_counters, migrations.RunPython.noop),
+    ]
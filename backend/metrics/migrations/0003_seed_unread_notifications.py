@@ -0,0 +1,24 @@
+from django.db import migrations
+from django.db.models import Count
+
+
+def seed_unread(apps, schema_editor):
+    Counter = apps.get_model("metrics", "Counter")
+    CaseNotification = apps.get_model("cases", "CaseNotification")
+
+    unread = CaseNotification.objects.filter(read_at__isnull=True).values("recipient").annotate(n=Count("id"))
+    Counter.objects.bulk_create(
+        Counter(key=f"notifications.unread.{row['recipient']}", value=row["n"]) for row in unread.order_by()
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("metrics", "0002_seed_counters"),
+        ("cases", "0007_casenotification_recipient_read_idx"),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_unread, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,15 @@
+from django.db import models
+
+
+class Counter(models.Model):
+    """A named running total kept in step with the tables it counts.
+
+    Keys are built by ``metrics.counters`` (e.g. ``cases.status.OPEN``).
+    """
+
+    key = models.CharField(max_length=100, primary_key=True)
+    value = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.key}={self.value}"
@@ -0,0 +1,111 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from cases.models import Case, CaseNotification
+from config.stats import invalidate_dashboard_stats
+from evidence.models import Evidence
+from intake.models import Complaint
+from rewards.models import RewardTip
+from suspects.models import Suspect
+
+from . import counters
+
+# Models counted per status: model -> (total key, status key builder)
+_BY_STATUS = {
+    Case: (counters.CASES_TOTAL, counters.case_status_key),
+    RewardTip: (counters.TIPS_TOTAL, counters.tip_status_key),
+}
+_TOTAL_ONLY = {
+    Evidence: counters.EVIDENCE_TOTAL,
+    Suspect: counters.SUSPECTS_TOTAL,
+}
+
+
+def _remember_status(sender, instance, **kwargs):
+    # Read __dict__ directly so a deferred status field is not fetched per row.
+    instance._counted_status = instance.__dict__.get("status")
+
+
+def _status_saved(sender, instance, created, **kwargs):
+    total_key, status_key = _BY_STATUS[sender]
+    previous = getattr(instance, "_counted_status", None)
+    if created:
+        counters.bump({total_key: 1, status_key(instance.status): 1})
+    elif previous is not None and previous != instance.status:
+        counters.bump({status_key(previous): -1, status_key(instance.status): 1})
+    instance._counted_status = instance.status
+
+
+def _status_deleted(sender, instance, **kwargs):
+    total_key, status_key = _BY_STATUS[sender]
+    status = getattr(instance, "_counted_status", None) or instance.status
+    counters.bump({total_key: -1, status_key(status): -1})
+
+
+for _model in _BY_STATUS:
+    post_init.connect(_remember_status, sender=_model, dispatch_uid=f"metrics-init-{_model.__name__}")
+    post_save.connect(_status_saved, sender=_model, dispatch_uid=f"metrics-save-{_model.__name__}")
+    post_delete.connect(_status_deleted, sender=_model, dispatch_uid=f"metrics-delete-{_model.__name__}")
+
+
+@receiver(post_save, sender=Evidence)
+@receiver(post_save, sender=Suspect)
+def _row_created(sender, instance, created, **kwargs):
+    if created:
+        counters.bump({_TOTAL_ONLY[sender]: 1})
+
+
+@receiver(post_delete, sender=Evidence)
+@receiver(post_delete, sender=Suspect)
+def _row_deleted(sender, instance, **kwargs):
+    counters.bump({_TOTAL_ONLY[sender]: -1})
+
+
+@receiver(post_save, sender=CaseNotification)
+def _notification_created(sender, instance, created, **kwargs):
+    if created and instance.read_at is None:
+        counters.bump({counters.unread_notifications_key(instance.recipient_id): 1})
+
+
+@receiver(post_delete, sender=CaseNotification)
+def _notification_deleted(sender, instance, **kwargs):
+    if instance.read_at is None:
+        counters.bump({counters.unread_notifications_key(instance.recipient_id): -1})
+
+
+def _review_load_keys(instance):
+    values = instance.__dict__
+    if not {"status", "cadet_id", "officer_id"} <= values.keys():
+        return None
+    return counters.review_load_keys(values["status"], {"cadet": values["cadet_id"], "officer": values["officer_id"]})
+
+
+@receiver(post_init, sender=Complaint)
+def _remember_review_load(sender, instance, **kwargs):
+    instance._counted_review_keys = _review_load_keys(instance) if instance.pk else set()
+
+
+@receiver(post_save, sender=Complaint)
+def _review_load_saved(sender, instance, created, **kwargs):
+    previous = set() if created else getattr(instance, "_counted_review_keys", None)
+    current = _review_load_keys(instance)
+    if previous is not None and current is not None:
+        counters.bump({**{key: -1 for key in previous - current}, **{key: 1 for key in current - previous}})
+    instance._counted_review_keys = current
+
+
+@receiver(post_delete, sender=Complaint)
+def _review_load_deleted(sender, instance, **kwargs):
+    keys = getattr(instance, "_counted_review_keys", None)
+    if keys:
+        counters.bump({key: -1 for key in keys})
+
+
+def _dashboard_write(sender, **kwargs):
+    transaction.on_commit(invalidate_dashboard_stats)
+
+
+for _model in (Case, Evidence, Suspect, RewardTip):
+    post_save.connect(_dashboard_write, sender=_model, dispatch_uid=f"stats-save-{_model.__name__}")
+    post_delete.connect(_dashboard_write, sender=_model, dispatch_uid=f"stats-delete-{_model.__name__}")
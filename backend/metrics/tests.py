@@ -0,0 +1,46 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from cases.models import Case
+from metrics import counters
+from metrics.models import Counter
+from rewards.models import RewardTip
+
+User = get_user_model()
+
+
+class CounterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username="u", email="u@test.com", password="x")
+
+    def test_counters_follow_creates_status_changes_and_deletes(self):
+        case = Case.objects.create(title="c", created_by=self.user, status="OPEN")
+        RewardTip.objects.create(citizen=self.user, suspect_name="S", info="tip")
+
+        case = Case.objects.get(pk=case.pk)
+        case.status = "CLOSED"
+        case.save(update_fields=["status"])
+        Case.objects.create(title="d", created_by=self.user)
+
+        self.assertEqual(
+            counters.read([counters.CASES_TOTAL, counters.case_status_key("OPEN"), counters.case_status_key("CLOSED")]),
+            {counters.CASES_TOTAL: 2, counters.case_status_key("OPEN"): 0, counters.case_status_key("CLOSED"): 1},
+        )
+        self.assertEqual(counters.read([counters.tip_status_key("SUBMITTED")])[counters.tip_status_key("SUBMITTED")], 1)
+
+        case.delete()
+        self.assertEqual(counters.mismatches(), {})
+
+    def test_check_counters_detects_and_fixes_drift(self):
+        Case.objects.create(title="c", created_by=self.user, status="OPEN")
+        Counter.objects.filter(key=counters.CASES_TOTAL).update(value=99)
+
+        with self.assertRaises(CommandError):
+            call_command("check_counters", stdout=StringIO())
+
+        call_command("check_counters", "--fix", stdout=StringIO())
+        self.assertEqual(counters.read([counters.CASES_TOTAL])[counters.CASES_TOTAL], 1)
@@ -0,0 +1,43 @@
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+
+from rbac.permissions import remember_user_roles
+from rbac.tokens import ROLE_VERSION_CLAIM, ROLES_CLAIM
+
+
+class RoleClaimJWTAuthentication(JWTAuthentication):
+    """JWT authentication that trusts the role claims signed into the token.
+
+    The user row is loaded by simplejwt anyway, so comparing its
+    ``role_version`` with the token's is free. A matching token seeds the
+    request's role cache and role checks run without touching ``rbac_userrole``.
+    Tokens issued before role claims existed fall back to the database.
+    """
+
+    def get_user(self, validated_token):
+        user = super().get_user(validated_token)
+
+        version = validated_token.get(ROLE_VERSION_CLAIM)
+        if version is None:
+            return user
+        if version != user.role_version:
+            raise InvalidToken("Token roles are out of date; refresh the token.")
+
+        remember_user_roles(user.pk, validated_token.get(ROLES_CLAIM) or [])
+        return user
+
+
+def user_for_token(raw_token):
+    """Resolve a raw access token (e.g. from a query string) to its user, or None."""
+    return user_and_expiry_for_token(raw_token)[0]
+
+
+def user_and_expiry_for_token(raw_token):
+    """Like ``user_for_token``, with the token's ``exp`` (a UNIX timestamp): ``(user, exp)`` or ``(None, None)``."""
+    auth = RoleClaimJWTAuthentication()
+    try:
+        token = auth.get_validated_token(raw_token)
+        return auth.get_user(token), token["exp"]
+    except (InvalidToken, AuthenticationFailed):
+        return None, None
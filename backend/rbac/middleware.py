@@ -0,0 +1,28 @@
+from asgiref.sync import iscoroutinefunction
+from django.utils.decorators import sync_and_async_middleware
+
+from rbac.permissions import _role_cache
+
+
+@sync_and_async_middleware
+def role_cache_middleware(get_response):
+    """Give every request a fresh role cache for ``rbac.permissions``."""
+    if iscoroutinefunction(get_response):
+
+        async def middleware(request):
+            token = _role_cache.set({})
+            try:
+                return await get_response(request)
+            finally:
+                _role_cache.reset(token)
+
+    else:
+
+        def middleware(request):
+            token = _role_cache.set({})
+            try:
+                return get_response(request)
+            finally:
+                _role_cache.reset(token)
+
+    return middleware
@@ -1,9 +1,53 @@
 from __future__ import annotations
 
+from contextvars import ContextVar
+
 from rest_framework.permissions import BasePermission
 
 from rbac.models import UserRole
 
+# Per-request cache of role names keyed by user id. It is only active while
+# ``rbac.middleware.role_cache_middleware`` wraps the request; outside a request
+# (shell, management commands) every lookup goes to the database.
+_role_cache: ContextVar[dict | None] = ContextVar("rbac_role_cache", default=None)
+
+
+def get_user_role_names(user) -> frozenset[str]:
+    """Return the names of every role assigned to ``user``.
+
+    Within a request the full set is loaded once, so any number of role
+    checks for the same user cost at most one query.
+    """
+    if not user or not getattr(user, "is_authenticated", False):
+        return frozenset()
+
+    cache = _role_cache.get()
+    if cache is not None and user.pk in cache:
+        return cache[user.pk]
+
+    names = frozenset(UserRole.objects.filter(user=user).values_list("role__name", flat=True))
+    if cache is not None:
+        cache[user.pk] = names
+    return names
+
+
+def remember_user_roles(user_id, names) -> None:
+    """Seed the current request's cache with role names known from elsewhere (e.g. a token)."""
+    cache = _role_cache.get()
+    if cache is not None:
+        cache[user_id] = frozenset(names)
+
+
+def forget_user_roles(user_id=None) -> None:
+    """Drop cached role names for one user (or everyone) in the current request."""
+    cache = _role_cache.get()
+    if cache is None:
+        return
+    if user_id is None:
+        cache.clear()
+    else:
+        cache.pop(user_id, None)
+
 
 def user_has_role(user, *roles: str) -> bool:
     """RBAC helper.
@@ -14,7 +58,7 @@ def user_has_role(user, *roles: str) -> bool:
         return False
     if getattr(user, "is_superuser", False):
         return True
-    return UserRole.objects.filter(user=user, role__name__in=roles).exists()
+    return not get_user_role_names(user).isdisjoint(roles)
 
 
 class HasRole(BasePermission):
@@ -34,4 +78,4 @@ class HasRole(BasePermission):
 
 
 IsCadetRole = HasRole.with_roles("Cadet", "Admin")
-IsOfficerRole = HasRole.with_roles("Officer", "Admin")
\ No newline at end of file
+IsOfficerRole = HasRole.with_roles("Officer", "Admin")
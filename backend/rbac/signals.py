@@ -0,0 +1,27 @@
+from django.contrib.auth import get_user_model
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from rbac.models import Role, UserRole
+from rbac.permissions import forget_user_roles
+
+
+@receiver([post_save, post_delete], sender=UserRole)
+def _user_role_changed(sender, instance, **kwargs):
+    # Invalidates every access token issued with the previous role set.
+    get_user_model().objects.filter(pk=instance.user_id).update(role_version=F("role_version") + 1)
+    forget_user_roles(instance.user_id)
+
+
+@receiver(post_save, sender=Role)
+def _role_changed(sender, instance, created, **kwargs):
+    if not created:
+        # A rename changes the names signed into tokens of everyone holding the role.
+        get_user_model().objects.filter(userrole__role=instance).update(role_version=F("role_version") + 1)
+    forget_user_roles()
+
+
+@receiver(post_delete, sender=Role)
+def _role_deleted(sender, instance, **kwargs):
+    forget_user_roles()
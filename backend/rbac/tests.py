@@ -1,3 +1,39 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from rbac.models import Role, UserRole
+
+User = get_user_model()
+
+
+class RoleCacheTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.officer = User.objects.create_user(
+            username="officer", email="officer@test.com", password="OfficerPassw0rd!!"
+        )
+        UserRole.objects.create(user=cls.officer, role=Role.objects.create(name="Officer"))
+
+    def test_role_checks_cost_one_query_per_request(self):
+        self.client.force_authenticate(user=self.officer)
+        with CaptureQueriesContext(connection) as ctx:
+            resp = self.client.post(
+                "/api/cases/from-crime-scene/",
+                {"title": "Scene", "crime_level": 2, "report": "r"},
+                format="json",
+            )
+        self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+        role_queries = [q for q in ctx.captured_queries if "rbac_userrole" in q["sql"]]
+        self.assertEqual(len(role_queries), 1)
+
+    def test_role_granted_between_requests_is_visible(self):
+        self.client.force_authenticate(user=self.officer)
+        resp = self.client.get("/api/rbac/roles/")
+        self.assertEqual(resp.status_code, status.HTTP_403_FORBIDDEN)
+
+        UserRole.objects.create(user=self.officer, role=Role.objects.create(name="Admin"))
+        resp = self.client.get("/api/rbac/roles/")
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from rbac.permissions import get_user_role_names
+
+ROLES_CLAIM = "roles"
+ROLE_VERSION_CLAIM = "role_version"
+
+
+def stamp_roles(token, user) -> None:
+    """Sign the user's current role names and role version into ``token``."""
+    token[ROLES_CLAIM] = sorted(get_user_role_names(user))
+    token[ROLE_VERSION_CLAIM] = user.role_version
+
+
+class RoleRefreshToken(RefreshToken):
+    """Refresh token whose derived access tokens carry the user's roles."""
+
+    @classmethod
+    def for_user(cls, user):
+        token = super().for_user(user)
+        stamp_roles(token, user)
+        return token
+
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    token_class = RoleRefreshToken
+
+
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):
+    """Re-read roles on refresh so a client holding a stale token can recover."""
+
+    token_class = RoleRefreshToken
+
+    def validate(self, attrs):
+        data = super().validate(attrs)
+
+        refresh = self.token_class(attrs["refresh"])
+        user_id = refresh.payload.get(api_settings.USER_ID_CLAIM)
+        user = get_user_model().objects.filter(**{api_settings.USER_ID_FIELD: user_id}).first()
+        if user is not None:
+            stamp_roles(refresh, user)
+            data["access"] = str(refresh.access_token)
+        return data
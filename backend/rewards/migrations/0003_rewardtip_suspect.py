@@ -0,0 +1,20 @@
+# Generated by Django 5.2.11 on 2026-10-18 01:26
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('rewards', '0002_rename_info_rewardtip_message_and_more'),
+        ('suspects', '0004_suspect_normalized_name'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rewardtip',
+            name='suspect',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tips', to='suspects.suspect'),
+        ),
+    ]
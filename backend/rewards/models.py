@@ -28,6 +28,14 @@ class RewardTip(models.Model):
     citizen_phone = models.CharField(max_length=50)
 
     suspect_name = models.CharField(max_length=200)
+    # Bound when a detective approves the tip, so the reward no longer depends on name matching.
+    suspect = models.ForeignKey(
+        "suspects.Suspect",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="tips",
+    )
     suspect_last_seen = models.CharField(max_length=500, blank=True, default="")
     message = models.TextField()
 
@@ -61,8 +69,12 @@ class RewardTip(models.Model):
     detective_approved_at = models.DateTimeField(null=True, blank=True)
     detective_note = models.TextField(blank=True, default="")
 
-    def approve_by_detective(self):
+    def approve_by_detective(self, suspect=None):
         self.status = self.STATUS_DETECTIVE_APPROVED
         if not self.unique_code:
             self.unique_code = secrets.token_hex(8)
-        self.save(update_fields=["status", "unique_code"])
\ No newline at end of file
+        if suspect is not None:
+            self.suspect = suspect
+        self.save(
+            update_fields=["status", "unique_code", "suspect", "approved_by_detective", "detective_approved_at"]
+        )
\ No newline at end of file
@@ -6,7 +6,9 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from config.permissions import HasRole
+from suspects.matching import match_suspects
 from suspects.models import Suspect
+from suspects.names import normalize_name
 from .models import RewardTip
 
 POLICE_ROLES = ("Admin", "Cadet", "Officer", "Detective", "Chief", "Captain", "Supervisor")
@@ -84,26 +86,59 @@ class OfficerReviewTip(APIView):
         return Response({"id": tip.id, "status": tip.status}, status=status.HTTP_200_OK)
 
 
+def _unambiguous_suspect(name: str):
+    """The one suspect whose normalized name equals ``name``, or None when there are none or several."""
+    normalized = normalize_name(name)
+    exact = list(Suspect.objects.filter(normalized_name=normalized).order_by("-id")[:2]) if normalized else []
+    return exact[0] if len(exact) == 1 else None
+
+
 class DetectiveApproveTip(APIView):
+    """Approve a tip and bind it to the suspect the reward is paid on.
+
+    An explicit ``suspect_id`` is always used. Without one the tip is bound only
+    when exactly one suspect has the same normalized name (tips name no case,
+    so a shared or merely similar name is never enough); otherwise it is
+    approved unbound and the response lists ranked ``candidates``. Posting again
+    with a ``suspect_id`` binds an approved, unbound tip.
+    """
+
     permission_classes = [IsDetectiveLevel]
 
     def post(self, request, tip_id: int):
         tip = get_object_or_404(RewardTip, id=tip_id)
 
-        if tip.status != RewardTip.STATUS_OFFICER_APPROVED:
+        suspect_id = request.data.get("suspect_id")
+        suspect = None
+        if suspect_id not in (None, ""):
+            suspect = Suspect.objects.filter(id=suspect_id).first() if str(suspect_id).isdigit() else None
+            if suspect is None:
+                return Response({"detail": "suspect_id does not match a suspect."}, status=status.HTTP_400_BAD_REQUEST)
+
+        binding_only = tip.status == RewardTip.STATUS_DETECTIVE_APPROVED and tip.suspect_id is None and suspect
+        if tip.status != RewardTip.STATUS_OFFICER_APPROVED and not binding_only:
             return Response(
                 {"detail": f"Tip is not in OFFICER_APPROVED state (current={tip.status})."},
                 status=status.HTTP_409_CONFLICT,
             )
 
-        tip.approved_by_detective = request.user
-        tip.detective_approved_at = timezone.now()
-        tip.approve_by_detective()
-
-        return Response(
-            {"id": tip.id, "status": tip.status, "unique_code": tip.unique_code},
-            status=status.HTTP_200_OK,
-        )
+        if binding_only:
+            tip.suspect = suspect
+            tip.save(update_fields=["suspect"])
+        else:
+            if suspect is None:
+                suspect = _unambiguous_suspect(tip.suspect_name)
+            tip.approved_by_detective = request.user
+            tip.detective_approved_at = timezone.now()
+            tip.approve_by_detective(suspect=suspect)
+
+        payload = {"id": tip.id, "status": tip.status, "unique_code": tip.unique_code, "suspect_id": tip.suspect_id}
+        if tip.suspect_id is None:
+            payload["candidates"] = [
+                {"id": s.id, "full_name": s.full_name, "case_id": s.case_id, "similarity": round(score, 4)}
+                for s, score in match_suspects(tip.suspect_name)
+            ]
+        return Response(payload, status=status.HTTP_200_OK)
 
 
 class RewardLookup(APIView):
@@ -127,6 +162,7 @@ class RewardLookup(APIView):
                 unique_code=unique_code,
                 status=RewardTip.STATUS_DETECTIVE_APPROVED,
             )
+            .select_related("suspect")
             .order_by("-created_at")
             .first()
         )
@@ -137,7 +173,10 @@ class RewardLookup(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        suspect = Suspect.objects.filter(full_name__iexact=tip.suspect_name).order_by("-id").first()
+        suspect = tip.suspect
+        if suspect is None:
+            # Tips approved before suspects were bound: an unambiguous exact name match only.
+            suspect = _unambiguous_suspect(tip.suspect_name)
         reward_amount_rials = suspect.reward_amount_rials if suspect else 0
 
         return Response(
@@ -152,6 +191,7 @@ class RewardLookup(APIView):
                 },
                 "tip": {
                     "id": tip.id,
+                    "suspect_id": suspect.id if suspect else None,
                     "suspect_name": tip.suspect_name,
                     "suspect_last_seen": tip.suspect_last_seen,
                     "message": tip.message,
@@ -0,0 +1,103 @@
+"""What text each searchable model contributes, and keeping ``SearchDocument`` in step.
+
+Models are named by label so the backfill migration can reuse the builders
+with historical models.
+"""
+
+from django.apps import apps as global_apps
+from django.db import transaction
+
+from .models import SearchDocument
+
+
+def _join(*parts) -> str:
+    return "\n".join(p for p in parts if p)
+
+
+def payload_text(value) -> list[str]:
+    """Every string inside a JSON payload, depth first."""
+    if isinstance(value, str):
+        return [value] if value.strip() else []
+    if isinstance(value, dict):
+        return [text for item in value.values() for text in payload_text(item)]
+    if isinstance(value, list):
+        return [text for item in value for text in payload_text(item)]
+    return []
+
+
+def _case(obj):
+    return obj.id, obj.title, obj.description
+
+
+def _evidence(obj):
+    return obj.case_id, obj.title, _join(obj.description, obj.transcription)
+
+
+def _complaint(obj):
+    # Historical models older than intake 0005 have no title column.
+    return obj.case_id, getattr(obj, "title", ""), _join(*payload_text(obj.payload))
+
+
+# model label -> (document kind, fields read, builder returning (case_id, title, body))
+SOURCES = {
+    "cases.case": (SearchDocument.KIND_CASE, ("id", "title", "description"), _case),
+    "evidence.evidence": (SearchDocument.KIND_EVIDENCE, ("id", "case_id", "title", "description", "transcription"), _evidence),
+    "intake.complaint": (SearchDocument.KIND_COMPLAINT, ("id", "case_id", "title", "payload"), _complaint),
+}
+
+
+def is_indexed_change(label: str, update_fields) -> bool:
+    if update_fields is None:
+        return True
+    _, fields, _ = SOURCES[label]
+    return not {f.removesuffix("_id") for f in fields}.isdisjoint(update_fields)
+
+
+def document_for(label: str, obj, model=SearchDocument):
+    kind, _, build = SOURCES[label]
+    case_id, title, body = build(obj)
+    return model(kind=kind, object_id=obj.id, case_id=case_id, title=(title or "")[:300], body=body or "")
+
+
+def index_instance(instance) -> None:
+    doc = document_for(instance._meta.label_lower, instance)
+    SearchDocument.objects.update_or_create(
+        kind=doc.kind,
+        object_id=doc.object_id,
+        defaults={"case_id": doc.case_id, "title": doc.title, "body": doc.body},
+    )
+
+
+def index_rows(label: str, rows) -> None:
+    """Index rows written in bulk (``bulk_create`` skips the save signals)."""
+    SearchDocument.objects.bulk_create(
+        [document_for(label, row) for row in rows],
+        update_conflicts=True,
+        unique_fields=["kind", "object_id"],
+        update_fields=["case", "title", "body", "updated_at"],
+    )
+
+
+def unindex_instance(instance) -> None:
+    kind, _, _ = SOURCES[instance._meta.label_lower]
+    SearchDocument.objects.filter(kind=kind, object_id=instance.pk).delete()
+
+
+def rebuild(apps=global_apps, batch_size=1000) -> int:
+    """Re-derive every document from the source tables; returns the count."""
+    document_model = apps.get_model("search", "SearchDocument")
+    total = 0
+    with transaction.atomic():
+        document_model.objects.all().delete()
+        for label, (_, fields, _) in SOURCES.items():
+            model, batch = apps.get_model(label), []
+            present = {field.name for field in model._meta.get_fields()}
+            names = [name for name in (f.removesuffix("_id") for f in fields) if name in present]
+            for obj in model.objects.only(*names).iterator(chunk_size=batch_size):
+                batch.append(document_for(label, obj, model=document_model))
+                if len(batch) >= batch_size:
+                    document_model.objects.bulk_create(batch)
+                    total, batch = total + len(batch), []
+            document_model.objects.bulk_create(batch)
+            total += len(batch)
+    return total
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from search import documents
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search documents from cases, evidence and intake complaints."
+
+    def handle(self, *args, **options):
+        total = documents.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"Indexed {total} search documents."))
@@ -0,0 +1,20 @@
+from django.db import migrations
+
+
+def backfill(apps, schema_editor):
+    from search.documents import rebuild
+
+    rebuild(apps)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("search", "0001_initial"),
+        ("evidence", "0007_alter_evidence_image_urls"),
+        ("intake", "0003_alter_complaint_case"),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill, migrations.RunPython.noop),
+    ]
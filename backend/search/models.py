@@ -0,0 +1,50 @@
+from django.contrib.postgres.indexes import GinIndex
+from django.contrib.postgres.search import SearchVector, SearchVectorField
+from django.db import models
+
+from cases.models import Case
+
+# Case data mixes Persian and English, so no language-specific stemming.
+SEARCH_CONFIG = "simple"
+
+
+class SearchDocument(models.Model):
+    """Searchable text of one case, evidence item or intake complaint.
+
+    ``vector`` is a generated column, so Postgres recomputes it whenever the
+    title or body is written and the GIN index always matches the text.
+    """
+
+    KIND_CASE = "case"
+    KIND_EVIDENCE = "evidence"
+    KIND_COMPLAINT = "complaint"
+
+    KIND_CHOICES = [
+        (KIND_CASE, "Case"),
+        (KIND_EVIDENCE, "Evidence"),
+        (KIND_COMPLAINT, "Complaint"),
+    ]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    object_id = models.PositiveBigIntegerField()
+    case = models.ForeignKey(Case, on_delete=models.CASCADE, null=True, blank=True, related_name="search_documents")
+    title = models.CharField(max_length=300, blank=True, default="")
+    body = models.TextField(blank=True, default="")
+    vector = models.GeneratedField(
+        expression=SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("body", weight="B", config=SEARCH_CONFIG),
+        output_field=SearchVectorField(),
+        db_persist=True,
+    )
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["vector"], name="searchdoc_vector_gin"),
+        ]
+        constraints = [
+            models.UniqueConstraint(fields=["kind", "object_id"], name="searchdoc_kind_object_uniq"),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.kind}#{self.object_id}"
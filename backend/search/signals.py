@@ -0,0 +1,19 @@
+from django.apps import apps
+from django.db.models.signals import post_delete, post_save
+
+from . import documents
+
+
+def _source_saved(sender, instance, created, update_fields=None, **kwargs):
+    if created or documents.is_indexed_change(sender._meta.label_lower, update_fields):
+        documents.index_instance(instance)
+
+
+def _source_deleted(sender, instance, **kwargs):
+    documents.unindex_instance(instance)
+
+
+for _label in documents.SOURCES:
+    _model = apps.get_model(_label)
+    post_save.connect(_source_saved, sender=_model, dispatch_uid=f"search-save-{_label}")
+    post_delete.connect(_source_deleted, sender=_model, dispatch_uid=f"search-delete-{_label}")
@@ -0,0 +1,63 @@
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from rest_framework.test import APITestCase
+
+from cases.models import Case
+from evidence.models import Evidence
+from intake.models import Complaint, ComplaintStatus
+from rbac.models import Role, UserRole
+from search.models import SearchDocument
+
+User = get_user_model()
+
+
+class SearchTests(APITestCase):
+    def test_ranked_search_across_models(self):
+        officer = User.objects.create_user(username="o", email="o@test.com", password="x")
+        UserRole.objects.create(user=officer, role=Role.objects.create(name="Officer"))
+        case = Case.objects.create(title="Jewellery robbery", description="Night break-in on Vali Asr", created_by=officer)
+        Evidence.objects.create(case=case, title="Tape", transcription="the robbery crew fled north", created_by=officer)
+        Complaint.objects.create(
+            created_by=officer,
+            payload={"title": "Stolen bike", "details": {"where": "Vali Asr"}},
+            status=ComplaintStatus.CADET_APPROVED,
+        )
+
+        self.client.force_authenticate(user=officer)
+        resp = self.client.get("/api/search/?q=robbery")
+        self.assertEqual(resp.data["count"], 2)
+        # A title hit (weight A) outranks a body hit.
+        self.assertEqual([(r["type"], r["id"]) for r in resp.data["results"]], [("case", case.id), ("evidence", case.evidence.get().id)])
+
+        resp = self.client.get('/api/search/?q="vali asr"&type=complaint')
+        self.assertEqual([r["title"] for r in resp.data["results"]], ["Stolen bike"])
+
+        case.description = "updated"
+        case.save(update_fields=["description"])
+        self.assertEqual(self.client.get("/api/search/?q=break-in").data["count"], 0)
+
+        SearchDocument.objects.all().delete()
+        call_command("rebuild_search_index", stdout=StringIO())
+        self.assertEqual(SearchDocument.objects.count(), 3)
+
+    def test_complaints_are_hidden_from_roles_that_cannot_read_them(self):
+        citizen = User.objects.create_user(username="c", email="c@test.com", password="x")
+        officer = User.objects.create_user(username="o", email="o@test.com", password="x")
+        UserRole.objects.create(user=officer, role=Role.objects.create(name="Officer"))
+        detective = User.objects.create_user(username="d", email="d@test.com", password="x")
+        UserRole.objects.create(user=detective, role=Role.objects.create(name="Detective"))
+        complaint = Complaint.objects.create(created_by=citizen, payload={"title": "Stolen bike", "details": "red frame"})
+
+        for user in (officer, detective):
+            self.client.force_authenticate(user=user)
+            self.assertEqual(self.client.get("/api/search/?q=red frame").data["count"], 0)
+
+        # Once a cadet passes it on, it is in the officer queue and searchable there.
+        complaint.status = ComplaintStatus.CADET_APPROVED
+        complaint.save(update_fields=["status"])
+        self.client.force_authenticate(user=officer)
+        self.assertEqual([r["id"] for r in self.client.get("/api/search/?q=red frame").data["results"]], [complaint.id])
+        self.client.force_authenticate(user=detective)
+        self.assertEqual(self.client.get("/api/search/?q=red frame").data["count"], 0)
@@ -0,0 +1,74 @@
+from django.contrib.postgres.search import SearchHeadline, SearchQuery, SearchRank
+from django.db.models import F, Q
+from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.views import APIView
+
+from intake.visibility import visible_complaints
+from rbac.permissions import HasRole
+
+from .models import SEARCH_CONFIG, SearchDocument
+
+
+class SearchPagination(LimitOffsetPagination):
+    # Ranked results have no stable cursor, so page by offset.
+    default_limit = 20
+    max_limit = 100
+
+
+class SearchView(APIView):
+    """Ranked full-text search over cases, evidence and intake complaints.
+
+    ``GET /api/search/?q=<words>[&type=case,evidence,complaint][&limit=&offset=]``.
+    ``q`` accepts web-search syntax: quoted phrases, ``or`` and ``-word``.
+    """
+
+    permission_classes = [
+        HasRole.with_roles("Officer", "Patrol", "Detective", "Sergeant", "Supervisor", "Captain", "Chief", "Admin")
+    ]
+
+    def get(self, request):
+        q = (request.query_params.get("q") or "").strip()
+        if not q:
+            return Response({"detail": "q is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        kinds = [k for k in (request.query_params.get("type") or "").split(",") if k]
+        valid = {k for k, _ in SearchDocument.KIND_CHOICES}
+        if not set(kinds) <= valid:
+            return Response({"detail": f"type must be among {sorted(valid)}"}, status=status.HTTP_400_BAD_REQUEST)
+
+        qs = SearchDocument.objects.defer("vector")
+        if kinds:
+            qs = qs.filter(kind__in=kinds)
+        # Complaints are only searchable by those who may read them in intake.
+        qs = qs.filter(
+            ~Q(kind=SearchDocument.KIND_COMPLAINT)
+            | Q(object_id__in=visible_complaints(request.user).values("id"))
+        )
+
+        query = SearchQuery(q, search_type="websearch", config=SEARCH_CONFIG)
+        qs = (
+            qs.filter(vector=query)
+            .annotate(
+                rank=SearchRank(F("vector"), query),
+                headline=SearchHeadline("body", query, config=SEARCH_CONFIG, max_words=30, min_words=10),
+            )
+            .order_by("-rank", "-id")
+        )
+
+        paginator = SearchPagination()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        return paginator.get_paginated_response(
+            [
+                {
+                    "type": doc.kind,
+                    "id": doc.object_id,
+                    "case_id": doc.case_id,
+                    "title": doc.title,
+                    "headline": doc.headline,
+                    "rank": round(float(doc.rank), 6),
+                }
+                for doc in page
+            ]
+        )
@@ -0,0 +1,65 @@
+"""Fuzzy lookup of suspects by name.
+
+Exact matches on ``normalized_name`` use its btree index. Fuzzy matches use
+pg_trgm's ``%`` operator and the trigram GIN index when the extension is
+installed, and otherwise score candidates in Python with the same trigram
+similarity, so results agree across databases.
+"""
+
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import connection
+
+from .models import Suspect
+from .names import normalize_name, similarity
+
+
+@lru_cache(maxsize=None)
+def _trigram_available(alias: str) -> bool:
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+        return cursor.fetchone() is not None
+
+
+def trigram_available() -> bool:
+    return _trigram_available(connection.alias)
+
+
+def match_suspects(name: str, limit: int = 10, threshold: float | None = None, queryset=None) -> list[tuple[Suspect, float]]:
+    """Suspects whose name resembles ``name``, best first, as ``(suspect, similarity)``."""
+    normalized = normalize_name(name)
+    if not normalized:
+        return []
+    threshold = settings.SUSPECT_MATCH_THRESHOLD if threshold is None else threshold
+    qs = Suspect.objects.all() if queryset is None else queryset
+
+    exact = list(qs.filter(normalized_name=normalized).order_by("-id")[:limit])
+    if len(exact) >= limit:
+        return [(s, 1.0) for s in exact]
+
+    if trigram_available():
+        from django.contrib.postgres.search import TrigramSimilarity
+
+        fuzzy = (
+            qs.filter(normalized_name__trigram_similar=normalized)
+            .annotate(similarity=TrigramSimilarity("normalized_name", normalized))
+            .filter(similarity__gte=threshold)
+            .order_by("-similarity", "-id")[:limit]
+        )
+        scored = [(s, float(s.similarity)) for s in fuzzy]
+    else:
+        candidates = qs.exclude(normalized_name="").only("id", "normalized_name")
+        ranked = sorted(
+            ((s.id, similarity(normalized, s.normalized_name)) for s in candidates.iterator()),
+            key=lambda pair: (-pair[1], -pair[0]),
+        )
+        ranked = [(pk, score) for pk, score in ranked if score >= threshold][:limit]
+        by_id = qs.in_bulk([pk for pk, _ in ranked])
+        scored = [(by_id[pk], score) for pk, score in ranked]
+
+    seen = {s.id for s in exact}
+    results = [(s, 1.0) for s in exact] + [(s, score) for s, score in scored if s.id not in seen]
+    return results[:limit]
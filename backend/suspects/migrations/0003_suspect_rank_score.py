@@ -0,0 +1,34 @@
+# Generated by Django 5.2.11 on 2026-10-18 01:05
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_rank_score(apps, schema_editor):
+    Suspect = apps.get_model("suspects", "Suspect")
+    Suspect.objects.update(rank_score=F("max_l") * F("max_d"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cases', '0006_rename_casecomp_case_status_idx_cases_casec_case_id_baf018_idx_and_more'),
+        ('suspects', '0002_suspect_public_fields'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='suspect',
+            name='rank_score',
+            field=models.PositiveIntegerField(default=1, editable=False),
+        ),
+        migrations.RunPython(backfill_rank_score, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='suspect',
+            index=models.Index(fields=['-rank_score', '-id'], name='suspect_rank_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='suspect',
+            index=models.Index(fields=['chase_started_at'], name='suspect_chase_started_idx'),
+        ),
+    ]
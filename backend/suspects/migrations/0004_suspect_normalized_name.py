@@ -0,0 +1,56 @@
+from django.db import DatabaseError, migrations, models, transaction
+
+from suspects.names import normalize_name
+
+
+def backfill_normalized_name(apps, schema_editor):
+    Suspect = apps.get_model("suspects", "Suspect")
+    batch = []
+    for suspect in Suspect.objects.only("id", "full_name").iterator(chunk_size=1000):
+        suspect.normalized_name = normalize_name(suspect.full_name)[:200]
+        batch.append(suspect)
+        if len(batch) >= 1000:
+            Suspect.objects.bulk_update(batch, ["normalized_name"])
+            batch = []
+    Suspect.objects.bulk_update(batch, ["normalized_name"])
+
+
+def add_trigram_index(apps, schema_editor):
+    # pg_trgm is optional: without it, suspects.matching scores in Python.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+        try:
+            with transaction.atomic(using=schema_editor.connection.alias):
+                cursor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        except DatabaseError:
+            # No privilege to create extensions; an administrator can add it later.
+            return
+        cursor.execute(
+            "CREATE INDEX IF NOT EXISTS suspect_name_trgm_idx ON suspects_suspect USING gin (normalized_name gin_trgm_ops)"
+        )
+
+
+def drop_trigram_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS suspect_name_trgm_idx")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('suspects', '0003_suspect_rank_score'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='suspect',
+            name='normalized_name',
+            field=models.CharField(blank=True, db_index=True, default='', editable=False, max_length=200),
+        ),
+        migrations.RunPython(backfill_normalized_name, migrations.RunPython.noop),
+        migrations.RunPython(add_trigram_index, drop_trigram_index),
+    ]
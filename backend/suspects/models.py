@@ -5,18 +5,25 @@ from django.utils import timezone
 
 from cases.models import Case
 
+from .names import normalize_name
+
 MOST_WANTED_DAYS = 30
 
 
+def most_wanted_q() -> models.Q:
+    return models.Q(chase_started_at__lte=timezone.now() - timedelta(days=MOST_WANTED_DAYS))
+
+
 class SuspectQuerySet(models.QuerySet):
     def most_wanted(self):
-        cutoff = timezone.now() - timedelta(days=MOST_WANTED_DAYS)
-        return self.filter(chase_started_at__lte=cutoff)
+        return self.filter(most_wanted_q())
 
 
 class Suspect(models.Model):
     case = models.ForeignKey(Case, on_delete=models.CASCADE, related_name="suspects")
     full_name = models.CharField(max_length=200)
+    # derived from full_name for indexed exact and trigram matching (see suspects.matching)
+    normalized_name = models.CharField(max_length=200, blank=True, default="", db_index=True, editable=False)
     national_id = models.CharField(max_length=20, blank=True, db_index=True)
     phone = models.CharField(max_length=20, blank=True)
     photo_url = models.URLField(blank=True)
@@ -26,16 +33,38 @@ class Suspect(models.Model):
     max_l = models.PositiveIntegerField(default=1)
     max_d = models.PositiveIntegerField(default=1)
 
+    # derived: max_l * max_d, stored so the most-wanted board can ORDER BY it
+    rank_score = models.PositiveIntegerField(default=1, editable=False)
+
     objects = SuspectQuerySet.as_manager()
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["-rank_score", "-id"], name="suspect_rank_idx"),
+            models.Index(fields=["chase_started_at"], name="suspect_chase_started_idx"),
+            # A trigram GIN index on normalized_name (suspect_name_trgm_idx) is added
+            # by migration 0004 where pg_trgm is available; it is not declared here
+            # because it cannot exist without the extension.
+        ]
+
+    def save(self, *args, **kwargs):
+        self.rank_score = int(self.max_l) * int(self.max_d)
+        self.normalized_name = normalize_name(self.full_name)[:200]
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            derived = set()
+            if {"max_l", "max_d"} & set(update_fields):
+                derived.add("rank_score")
+            if "full_name" in update_fields:
+                derived.add("normalized_name")
+            if derived:
+                kwargs["update_fields"] = {*update_fields, *derived}
+        return super().save(*args, **kwargs)
+
     @property
     def is_most_wanted(self) -> bool:
         return timezone.now() - self.chase_started_at >= timedelta(days=MOST_WANTED_DAYS)
 
-    @property
-    def rank_score(self) -> int:
-        return int(self.max_l) * int(self.max_d)
-
     @property
     def reward_amount_rials(self) -> int:
         return self.rank_score * 20_000_000
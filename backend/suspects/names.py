@@ -0,0 +1,36 @@
+import re
+import unicodedata
+
+# Arabic code points that Persian keyboards produce interchangeably with the
+# Persian ones, plus the zero-width non-joiner used inside names.
+_UNIFY = str.maketrans({"ي": "ی", "ى": "ی", "ك": "ک", "ة": "ه", "ۀ": "ه", "أ": "ا", "إ": "ا", "آ": "ا", "‌": " "})
+_NOT_WORD = re.compile(r"[^\w]+")
+
+
+def normalize_name(name: str) -> str:
+    """Fold a person's name to the form stored in ``Suspect.normalized_name``.
+
+    Case, diacritics, Arabic/Persian letter variants, punctuation and runs of
+    whitespace are folded away, so ``"  Ali-Reza  REZAEI"`` and
+    ``"ali reza rezaei"`` compare equal.
+    """
+    decomposed = unicodedata.normalize("NFKD", (name or "").translate(_UNIFY).casefold())
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(_NOT_WORD.sub(" ", stripped).replace("_", " ").split())
+
+
+def trigrams(text: str) -> set[str]:
+    """Trigrams the way pg_trgm builds them: per word, padded with two leading and one trailing space."""
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} "
+        grams.update(padded[i : i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(a: str, b: str) -> float:
+    """pg_trgm's ``similarity()``: shared trigrams over all distinct trigrams."""
+    ta, tb = trigrams(a), trigrams(b)
+    if not ta or not tb:
+        return 0.0
+    return len(ta & tb) / len(ta | tb)
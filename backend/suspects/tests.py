@@ -1,3 +1,91 @@
+from django.contrib.auth import get_user_model
 from django.test import TestCase
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from cases.models import Case
+from rbac.models import Role, UserRole
+from rewards.models import RewardTip
+from suspects.matching import match_suspects
+from suspects.models import Suspect
+
+User = get_user_model()
+
+
+class SuspectRankScoreTests(TestCase):
+    def test_rank_score_is_persisted_on_partial_save(self):
+        user = User.objects.create_user(username="u", email="u@test.com", password="x")
+        case = Case.objects.create(title="c", created_by=user)
+        suspect = Suspect.objects.create(case=case, full_name="S", max_l=2, max_d=3)
+        self.assertEqual(Suspect.objects.get(pk=suspect.pk).rank_score, 6)
+
+        suspect.max_l = 5
+        suspect.save(update_fields=["max_l"])
+        self.assertEqual(Suspect.objects.get(pk=suspect.pk).rank_score, 15)
+
+
+class SuspectMatchingTests(APITestCase):
+    def test_spelling_variants_match_but_approval_only_binds_a_chosen_suspect(self):
+        user = User.objects.create_user(username="d", email="d@test.com", password="x")
+        UserRole.objects.create(user=user, role=Role.objects.create(name="Detective"))
+        case = Case.objects.create(title="c", created_by=user)
+        wanted = Suspect.objects.create(case=case, full_name="Ali Rezaei", max_l=3, max_d=4)
+        Suspect.objects.create(case=case, full_name="Maryam Karimi")
+
+        self.assertEqual(wanted.normalized_name, "ali rezaei")
+        self.assertEqual([s for s, _ in match_suspects("  ALI  rezaie ")], [wanted])
+
+        tip = RewardTip.objects.create(
+            citizen=user,
+            citizen_name="c",
+            citizen_national_id="123",
+            citizen_phone="0912",
+            suspect_name="Aly Rezaei",
+            message="seen",
+            status=RewardTip.STATUS_OFFICER_APPROVED,
+        )
+        self.client.force_authenticate(user=user)
+        resp = self.client.post(f"/api/rewards/tips/{tip.id}/detective-approve/")
+        self.assertEqual(resp.status_code, 200, resp.content)
+        self.assertEqual((resp.data["status"], resp.data["suspect_id"]), (RewardTip.STATUS_DETECTIVE_APPROVED, None))
+        self.assertEqual(resp.data["candidates"][0]["id"], wanted.id)
+        tip.refresh_from_db()
+        self.assertIsNone(tip.suspect_id)
+        self.assertIsNotNone(tip.approved_by_detective_id)
+
+        resp = self.client.post(f"/api/rewards/tips/{tip.id}/detective-approve/", {"suspect_id": wanted.id})
+        self.assertEqual(resp.status_code, 200, resp.content)
+        tip.refresh_from_db()
+        self.assertEqual(tip.suspect_id, wanted.id)
+        self.assertEqual(
+            self.client.post(f"/api/rewards/tips/{tip.id}/detective-approve/", {"suspect_id": wanted.id}).status_code,
+            409,
+        )
+
+        resp = self.client.get(f"/api/rewards/lookup/?national_id=123&code={tip.unique_code}")
+        self.assertEqual(resp.data["reward_amount_rials"], wanted.reward_amount_rials)
+
+    def test_approval_binds_only_a_unique_exact_name(self):
+        user = User.objects.create_user(username="d", email="d@test.com", password="x")
+        UserRole.objects.create(user=user, role=Role.objects.create(name="Detective"))
+        case, other_case = (Case.objects.create(title=t, created_by=user) for t in ("c", "d"))
+        unique = Suspect.objects.create(case=case, full_name="Ali Rezaei")
+        Suspect.objects.create(case=case, full_name="Reza Karimi")
+        Suspect.objects.create(case=other_case, full_name="reza  KARIMI")
+
+        def approve(name):
+            tip = RewardTip.objects.create(
+                citizen=user,
+                citizen_name="c",
+                citizen_national_id="123",
+                citizen_phone="0912",
+                suspect_name=name,
+                message="seen",
+                status=RewardTip.STATUS_OFFICER_APPROVED,
+            )
+            return self.client.post(f"/api/rewards/tips/{tip.id}/detective-approve/").data
+
+        self.client.force_authenticate(user=user)
+        self.assertEqual(approve("ALI rezaei")["suspect_id"], unique.id)
+        shared = approve("Reza Karimi")
+        self.assertIsNone(shared["suspect_id"])
+        self.assertEqual(len(shared["candidates"]), 2)
@@ -1,9 +1,10 @@
 from django.urls import path
 
-from .views import MostWantedList, CaseSuspects, SuspectUpdate
+from .views import MostWantedList, CaseSuspects, SuspectMatch, SuspectUpdate
 
 urlpatterns = [
     path("most-wanted/", MostWantedList.as_view(), name="most_wanted"),
+    path("match/", SuspectMatch.as_view(), name="suspect_match"),
     path("case/<int:case_id>/", CaseSuspects.as_view(), name="case_suspects"),
     path("<int:suspect_id>/", SuspectUpdate.as_view(), name="suspect_update"),
 ]
@@ -8,15 +8,16 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from cases.models import Case
+from config.pagination import IdCursorPagination
 from rbac.permissions import user_has_role
+from .matching import match_suspects
 from .models import Suspect
 
 
 class IsPoliceRole(BasePermission):
     def has_permission(self, request, view):
-        return any(
-            user_has_role(request.user, r)
-            for r in ["Officer", "Patrol", "Detective", "Sergeant", "Supervisor", "Captain", "Chief", "Admin"]
+        return user_has_role(
+            request.user, "Officer", "Patrol", "Detective", "Sergeant", "Supervisor", "Captain", "Chief", "Admin"
         )
 
 
@@ -49,15 +50,39 @@ def _serialize(suspect: Suspect):
     }
 
 
+class MostWantedPagination(IdCursorPagination):
+    # served straight from suspect_rank_idx
+    ordering = ("-rank_score", "-id")
+
+
 class MostWantedList(APIView):
     # Visible to all authenticated users
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        suspects = list(Suspect.objects.most_wanted().select_related("case").all())
-        data = [_serialize(s) for s in suspects]
-        data.sort(key=lambda x: x.get("rank_score", 0), reverse=True)
-        return Response(data, status=status.HTTP_200_OK)
+        qs = Suspect.objects.most_wanted()
+        paginator = MostWantedPagination()
+        page = paginator.paginate_queryset(qs, request, view=self)
+        return paginator.get_paginated_response([_serialize(s) for s in page])
+
+
+class SuspectMatch(APIView):
+    """Suspects whose name resembles ``?name=``, best first, for binding tips."""
+
+    permission_classes = [IsPoliceRole]
+
+    def get(self, request):
+        name = (request.query_params.get("name") or "").strip()
+        if not name:
+            return Response({"detail": "name is required"}, status=status.HTTP_400_BAD_REQUEST)
+
+        raw_limit = request.query_params.get("limit") or "10"
+        limit = min(int(raw_limit), 50) if raw_limit.isdigit() and int(raw_limit) > 0 else 10
+        matches = match_suspects(name, limit=limit)
+        return Response(
+            [{**_serialize(s), "similarity": round(score, 4)} for s, score in matches],
+            status=status.HTTP_200_OK,
+        )
 
 
 class CaseSuspects(APIView):
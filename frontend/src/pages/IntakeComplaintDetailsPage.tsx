@@ -56,7 +56,7 @@ export default function IntakeComplaintDetailsPage() {
       const d = await getComplaint(complaintId);
       setData(d);
       setTitle(pickString(d as Record<string, unknown>, "title"));
-      setDescription(pickString(d as Record<string, unknown>, "description"));
+      setDescription(pickString((d.payload ?? {}) as Record<string, unknown>, "description"));
     } catch (e) {
       setError(getApiErrorMessage(e));
       setData(null);
@@ -78,8 +78,7 @@ export default function IntakeComplaintDetailsPage() {
     try {
       if (isNew) {
         const created = await createComplaint({
-          title: title.trim(),
-          description: description.trim(),
+          payload: { title: title.trim(), description: description.trim() },
         });
 
         const newId = (created as BackendComplaint).id;
@@ -90,8 +89,7 @@ export default function IntakeComplaintDetailsPage() {
         }
       } else if (complaintId) {
         const updated = await patchComplaint(complaintId, {
-          title: title.trim(),
-          description: description.trim(),
+          payload: { title: title.trim(), description: description.trim() },
         });
         setData(updated);
       }
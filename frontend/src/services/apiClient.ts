@@ -1,5 +1,6 @@
 import axios, { AxiosError, type AxiosRequestConfig } from "axios";
 import { clearToken, getRefreshToken, getToken, setToken } from "../features/auth/authStorage";
+import type { CursorPage } from "../types/common";
 
 type RefreshResponse = { access: string };
 
@@ -80,3 +81,21 @@ apiClient.interceptors.response.use(
     }
   },
 );
+
+// Largest page the backend serves (API_MAX_PAGE_SIZE), to keep round trips few.
+const MAX_PAGE_SIZE = 200;
+
+// Reads every page of a cursor-paginated list by following `next` to the end.
+export async function getAllPages<T>(url: string, params?: Record<string, unknown>): Promise<T[]> {
+  const items: T[] = [];
+  let next: string | null = url;
+  let query: Record<string, unknown> | undefined = { page_size: MAX_PAGE_SIZE, ...params };
+  while (next) {
+    const { data }: { data: CursorPage<T> } = await apiClient.get<CursorPage<T>>(next, { params: query });
+    items.push(...(data?.results ?? []));
+    next = data?.next ?? null;
+    // `next` already carries the query string, cursor included.
+    query = undefined;
+  }
+  return items;
+}
@@ -1,4 +1,4 @@
-import { apiClient } from "./apiClient";
+import { getAllPages } from "./apiClient";
 import type { CaseStatus, CaseSummary, ComplaintType } from "../types/case";
 
 export type GetCasesParams = {
@@ -37,9 +37,7 @@ function mapCase(c: BackendCase): CaseSummary {
 }
 
 export async function getCases(params: GetCasesParams): Promise<CaseSummary[]> {
-  const { data } = await apiClient.get<BackendCase[]>("/cases/");
-
-  const mapped = data.map(mapCase);
+  const mapped = (await getAllPages<BackendCase>("/cases/")).map(mapCase);
 
   const query = (params.q ?? "").trim().toLowerCase();
   const status = params.status ?? "ALL";
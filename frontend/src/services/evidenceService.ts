@@ -1,4 +1,4 @@
-import { apiClient } from "./apiClient";
+import { apiClient, getAllPages } from "./apiClient";
 import type { Evidence, EvidenceStatus } from "../types/evidence";
 
 type AddIdentityEvidenceInput = {
@@ -187,14 +187,11 @@ export async function listEvidence(params?: { caseId?: string }): Promise<Eviden
   const caseId = params?.caseId?.trim();
   const caseParam = caseId ? normalizeCaseIdToNumber(caseId) : null;
 
-  const { data } = await apiClient.get<BackendEvidence[]>("/evidence/", {
-    params: caseParam ? { case: caseParam } : undefined,
-  });
-
-  return (data ?? []).map(mapFromBackend);
+  const items = await getAllPages<BackendEvidence>("/evidence/", caseParam ? { case: caseParam } : undefined);
+  return items.map(mapFromBackend);
 }
 
-export async function addEvidence(input: AddEvidenceInput): Promise<Evidence> {
+function toBackendBody(input: AddEvidenceInput): Record<string, unknown> {
   const caseNum = normalizeCaseIdToNumber(input.caseId);
 
   const body: Record<string, unknown> = {
@@ -243,10 +240,20 @@ export async function addEvidence(input: AddEvidenceInput): Promise<Evidence> {
     }
   }
 
-  const { data } = await apiClient.post<BackendEvidence>("/evidence/", body);
+  return body;
+}
+
+export async function addEvidence(input: AddEvidenceInput): Promise<Evidence> {
+  const { data } = await apiClient.post<BackendEvidence>("/evidence/", toBackendBody(input));
   return mapFromBackend(data);
 }
 
+// All-or-nothing: one request for the whole batch, one board notification per case.
+export async function addEvidenceBulk(inputs: AddEvidenceInput[]): Promise<Evidence[]> {
+  const { data } = await apiClient.post<BackendEvidence[]>("/evidence/bulk/", inputs.map(toBackendBody));
+  return data.map(mapFromBackend);
+}
+
 export async function setEvidenceStatus(id: string, status: EvidenceStatus): Promise<void> {
   void id;
   void status;
@@ -1,4 +1,4 @@
-import { apiClient } from "./apiClient";
+import { apiClient, getAllPages } from "./apiClient";
 
 export type ComplaintStatus =
   | "DRAFT"
@@ -36,18 +36,21 @@ function mapComplaint(x: BackendComplaint): ComplaintItem {
 }
 
 export async function listComplaints(): Promise<ComplaintItem[]> {
-  const { data } = await apiClient.get<BackendComplaint[]>("/intake/complaints/");
-  return (data ?? []).map(mapComplaint);
+  return (await getAllPages<BackendComplaint>("/intake/complaints/")).map(mapComplaint);
 }
 
 export async function listCadetInbox(): Promise<ComplaintItem[]> {
-  const { data } = await apiClient.get<BackendComplaint[]>("/intake/complaints/cadet_inbox/");
-  return (data ?? []).map(mapComplaint);
+  return (await getAllPages<BackendComplaint>("/intake/complaints/cadet_inbox/")).map(mapComplaint);
 }
 
 export async function listOfficerInbox(): Promise<ComplaintItem[]> {
-  const { data } = await apiClient.get<BackendComplaint[]>("/intake/complaints/officer_inbox/");
-  return (data ?? []).map(mapComplaint);
+  return (await getAllPages<BackendComplaint>("/intake/complaints/officer_inbox/")).map(mapComplaint);
+}
+
+// Leases the oldest unclaimed complaint in the queue to the caller; null when the queue is empty.
+export async function claimNextComplaint(queue: "cadet" | "officer"): Promise<BackendComplaint | null> {
+  const { data, status } = await apiClient.post<BackendComplaint>(`/intake/complaints/${queue}_claim_next/`);
+  return status === 204 ? null : data;
 }
 
 export async function getComplaint(id: number): Promise<BackendComplaint> {
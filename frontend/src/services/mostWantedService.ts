@@ -1,4 +1,4 @@
-import { apiClient } from "./apiClient";
+import { getAllPages } from "./apiClient";
 import type { MostWantedItem, MostWantedLevel } from "../types/mostWanted";
 
 type BackendMostWanted = {
@@ -17,9 +17,9 @@ function levelFromScore(score: number): MostWantedLevel {
 }
 
 export async function listMostWanted(): Promise<MostWantedItem[]> {
-  const { data } = await apiClient.get<BackendMostWanted[]>("/suspects/most-wanted/");
+  const suspects = await getAllPages<BackendMostWanted>("/suspects/most-wanted/");
 
-  return data.map((s) => ({
+  return suspects.map((s) => ({
     id: String(s.id),
     fullName: s.full_name,
     reason: "—",
@@ -0,0 +1,59 @@
+import { apiClient } from "./apiClient";
+
+export type SearchResultType = "case" | "evidence" | "complaint";
+
+export type SearchResult = {
+  type: SearchResultType;
+  id: number;
+  caseId: number | null;
+  title: string;
+  headline: string;
+  rank: number;
+};
+
+export type SearchPage = {
+  count: number;
+  results: SearchResult[];
+};
+
+type BackendSearchResult = {
+  type: SearchResultType;
+  id: number;
+  case_id: number | null;
+  title: string;
+  headline: string;
+  rank: number;
+};
+
+type BackendSearchPage = {
+  count: number;
+  next: string | null;
+  previous: string | null;
+  results: BackendSearchResult[];
+};
+
+export async function search(
+  q: string,
+  opts: { types?: SearchResultType[]; limit?: number; offset?: number } = {}
+): Promise<SearchPage> {
+  const { data } = await apiClient.get<BackendSearchPage>("/search/", {
+    params: {
+      q,
+      type: opts.types?.length ? opts.types.join(",") : undefined,
+      limit: opts.limit,
+      offset: opts.offset,
+    },
+  });
+
+  return {
+    count: data.count,
+    results: data.results.map((r) => ({
+      type: r.type,
+      id: r.id,
+      caseId: r.case_id,
+      title: r.title,
+      headline: r.headline,
+      rank: r.rank,
+    })),
+  };
+}
@@ -9,6 +9,13 @@ export type Paginated<T> = {
   pageSize: number;
 };
 
+// Shape returned by the backend's cursor-paginated list endpoints.
+export type CursorPage<T> = {
+  next: string | null;
+  previous: string | null;
+  results: T[];
+};
+
 export type ApiSuccess<T> = {
   data: T;
 };